@@ -0,0 +1,65 @@
+"""Busca de aulas em um curso grande: varreduras lineares x índices por lecture_id (user-017).
+
+    python -m benchmarks.bench_course_index [aulas] [buscas]
+
+As duas versões pedem os detalhes da aula ao servidor local; a diferença está em como a aula e seus
+arquivos adicionais são encontrados no currículo.
+"""
+import sys
+import time
+
+from benchmarks.stub_server import curriculum_items, run_stub, use_stub
+from udemy_userAPI.api import get_files_aule, get_links, is_lecture_in_course, parser_chapters
+from udemy_userAPI.bultins import Course, Lecture
+from udemy_userAPI.cache import invalidate_memory_cache
+
+
+def lectures_before(chapters) -> list:
+    """O antigo get_lectures: a lista de aulas era remontada a cada leitura da propriedade."""
+    return [{'section': chapter.get('title', ''), 'title': lecture.get('title', ''),
+             'lecture_id': lecture.get('lecture_id', ''), 'asset_id': lecture.get('asset_id', ''),
+             'asset_type': lecture.get('asset_type', ''), 'section_order': chapter.get('chapter_index', 1)}
+            for chapter in chapters for lecture in chapter.get('lectures', [])]
+
+
+def files_before(results: dict) -> list:
+    """O antigo __load_assets + extract_files: percorria o currículo inteiro a cada busca."""
+    return [{'lecture_id': item.get('id'), 'asset_id': asset.get('id'), 'asset_type': asset.get('asset_type'),
+             'filename': asset.get('filename'), 'title': asset.get('title'), 'lecture_title': item.get('title'),
+             'external_link': asset.get('is_external', None)}
+            for item in results.get('results', []) if item.get('_class') == 'lecture'
+            for asset in item.get('supplementary_assets', [])]
+
+
+def details_before(chapters, results: dict, course_id: int, lecture_id: int) -> Lecture:
+    if not is_lecture_in_course(lecture_id=lecture_id, lectures=lectures_before(chapters)):
+        raise FileNotFoundError(lecture_id)
+    for lecture in lectures_before(chapters):
+        if lecture.get('lecture_id') == lecture_id:
+            break
+    files = get_files_aule(lecture_id, files_before(results))
+    return Lecture(data=get_links(course_id=course_id, id_lecture=lecture_id), course_id=course_id,
+                   additional_files=files)
+
+
+def main(lectures: int = 5000, lookups: int = 300):
+    results = {'results': curriculum_items(lectures)}
+    lecture_ids = [item['id'] for item in results['results'] if item['_class'] == 'lecture']
+    sample = lecture_ids[::max(1, len(lecture_ids) // lookups)][:lookups]
+    with run_stub() as stub:
+        use_stub(stub.base)
+        chapters = parser_chapters(results)  # os dicts de sempre
+        course = Course(results, course_id=1)
+        for name, details in (('varreduras lineares', lambda i: details_before(chapters, results, 1, i)),
+                              ('índices por lecture_id', course.get_details_lecture)):
+            invalidate_memory_cache()
+            started = time.perf_counter()
+            for lecture_id in sample:
+                details(lecture_id)
+            elapsed = time.perf_counter() - started
+            print(f'{name:24s} {len(sample)} aulas de {lectures} em {elapsed:.2f}s '
+                  f'({elapsed / len(sample) * 1000:.2f} ms por aula)')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
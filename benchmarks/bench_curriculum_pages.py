@@ -0,0 +1,48 @@
+"""Paginação do currículo: links 'next' em série x páginas 2..N simultâneas (user-007).
+
+    python -m benchmarks.bench_curriculum_pages [aulas] [itens_por_página] [latência_s]
+"""
+import sys
+import time
+
+from benchmarks.stub_server import run_stub, use_stub
+from udemy_userAPI.api import HEADERS_USER, curriculum_url
+from udemy_userAPI.sections import iter_curriculum_pages
+from udemy_userAPI.session import decode_json, get_session
+
+
+def serial(course_id: int, page_size: int) -> list:
+    """O comportamento anterior: cada página só é pedida depois que a anterior chega."""
+    results = []
+    url = curriculum_url(course_id, page_size=page_size)
+    while url:
+        page = decode_json(get_session().get(url, headers=HEADERS_USER).content)
+        results.extend(page['results'])
+        url = page.get('next')
+    return results
+
+
+def concurrent(course_id: int, page_size: int) -> list:
+    results = []
+    for page in iter_curriculum_pages(course_id, page_size=page_size):
+        results.extend(page['results'])
+    return results
+
+
+def main(lectures: int = 3000, page_size: int = 300, delay: float = 0.15):
+    with run_stub(items=lectures, delay=delay) as stub:
+        use_stub(stub.base)
+        timings = {}
+        for name, fetch in (('links next em série', serial), ('páginas simultâneas', concurrent)):
+            stub.reset()
+            started = time.perf_counter()
+            results = fetch(1, page_size)
+            timings[name] = (time.perf_counter() - started, results)
+            print(f'{name:22s} {len(results)} itens em {stub.stats()["requests"]} páginas: '
+                  f'{timings[name][0]:.2f}s')
+        first, second = (results for _, results in timings.values())
+        print('resultados idênticos:', first == second)
+
+
+if __name__ == '__main__':
+    main(*(cast(arg) for cast, arg in zip((int, int, float), sys.argv[1:])))
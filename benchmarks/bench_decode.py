@@ -0,0 +1,46 @@
+"""Decodificação do JSON do currículo: texto x bytes, tempo e pico de memória (user-013).
+
+    python -m benchmarks.bench_decode [aulas]
+"""
+import gzip
+import json
+import sys
+import time
+import tracemalloc
+
+from benchmarks.stub_server import curriculum_items
+from udemy_userAPI.session import decode_json
+
+
+def measure(decode, body: bytes, runs: int = 5):
+    best = float('inf')
+    for _ in range(runs):
+        started = time.perf_counter()
+        decode(body)
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    decode(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main(lectures: int = 9000):
+    body = json.dumps({'count': lectures, 'next': None, 'results': curriculum_items(lectures)}).encode('utf-8')
+    print(f'subscriber-curriculum-items: {len(body) / 2 ** 20:.1f} MB '
+          f'({len(gzip.compress(body)) / 2 ** 20:.2f} MB com gzip)')
+    try:
+        import orjson  # noqa: F401 (o decode_json usa o orjson quando instalado)
+        backend = 'orjson'
+    except ImportError:
+        backend = 'json'
+    cases = (('json.loads(resp.text)', lambda b: json.loads(b.decode('utf-8'))),
+             ('json.loads(resp.content)', json.loads),
+             (f'decode_json(resp.content) [{backend}]', decode_json))
+    for name, decode in cases:
+        best, peak = measure(decode, body)
+        print(f'{name:36s} {best * 1000:7.1f} ms  pico {peak / 2 ** 20:5.1f} MB')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
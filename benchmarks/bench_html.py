@@ -0,0 +1,48 @@
+"""HTML para texto: o antigo remove_tag (replace encadeado) x html_to_text (user-025).
+
+    python -m benchmarks.bench_html [enunciados]
+"""
+import random
+import re
+import sys
+import time
+
+from udemy_userAPI.htmltext import html_to_text
+
+TEMPLATES = (
+    '<p>Qual é o resultado de <code>print({a} &lt; {b})</code>?</p>',
+    '<p>Considere o código abaixo:</p><pre class="prettyprint linenums">x = [{a}, {b}]\nfor i in x:\n'
+    '    print(i &amp; 1)\n</pre><p>O que será impresso?</p>',
+    '<p>Sobre&nbsp;<strong>listas</strong> em Python, é correto afirmar:</p>'
+    '<ul><li>São mutáveis</li><li>Aceitam tipos &quot;mistos&quot;</li></ul>',
+    '<p>Você criou a função <em>soma({a}, {b})</em>. Explique o retorno&hellip;</p><p><br></p>'
+    '<p>Veja a <a href="https://docs.python.org">documentação</a>.</p>',
+    '<p>{a} &times; {b} = ?</p>',
+    '<div><h4>Cenário</h4><p>A empresa X usa o serviço Y com {a} instâncias &mdash; qual a melhor opção?</p>'
+    '<ol><li>Opção A</li><li>Opção B</li></ol></div>',
+)
+_LEFTOVER_TAG = re.compile(r'<[a-zA-Z/][^>]*>')
+_LEFTOVER_ENTITY = re.compile(r'&[a-zA-Z#][a-zA-Z0-9]*;')
+
+
+def remove_tag(value: str) -> str:
+    """O remove_tag anterior de api.py."""
+    return value.replace('<p>', '').replace('</p>', '').replace('&nbsp;', ' ')
+
+
+def main(bodies: int = 100000):
+    rnd = random.Random(7)
+    corpus = [rnd.choice(TEMPLATES).format(a=rnd.randrange(1000), b=rnd.randrange(1000)) for _ in range(bodies)]
+    print(f'{bodies} enunciados de quiz ({sum(map(len, corpus)) / 2 ** 20:.1f} MB de HTML)')
+    for name, convert in (('remove_tag (replace encadeado)', remove_tag), ('html_to_text', html_to_text)):
+        started = time.perf_counter()
+        texts = [convert(body) for body in corpus]
+        elapsed = time.perf_counter() - started
+        tags = sum(1 for text in texts if _LEFTOVER_TAG.search(text))
+        entities = sum(1 for text in texts if _LEFTOVER_ENTITY.search(text))
+        print(f'{name:31s} {elapsed:5.2f}s ({bodies / elapsed:9,.0f}/s); sobram tags em {tags}, '
+              f'entidades em {entities}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
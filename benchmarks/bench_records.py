@@ -0,0 +1,52 @@
+"""Memória dos catálogos: dicionários comuns x registros com __slots__ (user-018).
+
+    python -m benchmarks.bench_records [aulas]
+"""
+import gc
+import json
+import sys
+import tracemalloc
+
+from benchmarks.stub_server import curriculum_items
+from udemy_userAPI.api import extract_files, parser_chapters
+
+
+def traced(build):
+    """Retorna o resultado de build() e a memória que ele ocupa (strings já existentes não contam)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def supplementary(results: dict) -> list:
+    return [{'lecture_id': item.get('id'), 'lecture_title': item.get('title'), 'asset': asset}
+            for item in results['results'] if item.get('_class') == 'lecture'
+            for asset in item.get('supplementary_assets', [])]
+
+
+def main(lectures: int = 50000):
+    # strings recém-decodificadas, como numa resposta da API
+    results = json.loads(json.dumps({'results': curriculum_items(lectures)}))
+    assets = supplementary(results)
+    chapters, chapters_size = traced(lambda: parser_chapters(results, records=True))
+    lecture_refs, lectures_size = traced(lambda: [lecture.in_section(chapter.title, chapter.chapter_index)
+                                                  for chapter in chapters for lecture in chapter.lectures])
+    files, files_size = traced(lambda: extract_files(assets, records=True))
+    records = (chapters_size, lectures_size, files_size)
+    # os dicionários que as mesmas funções retornavam antes, com as mesmas chaves e valores
+    _, chapters_size = traced(lambda: [chapter.to_dict() for chapter in chapters])
+    _, lectures_size = traced(lambda: [lecture.to_dict() for lecture in lecture_refs])
+    _, files_size = traced(lambda: [file.to_dict() for file in files])
+    dicts = (chapters_size, lectures_size, files_size)
+    print(f'{lectures} aulas ({len(lecture_refs)} itens, {len(files)} arquivos adicionais)')
+    print(f'{"":10s} {"capítulos":>10s} {"get_lectures":>13s} {"extract_files":>14s} {"total":>9s}')
+    for name, sizes in (('dicts', dicts), ('registros', records)):
+        mb = [size / 2 ** 20 for size in sizes]
+        print(f'{name:10s} {mb[0]:7.2f} MB {mb[1]:10.2f} MB {mb[2]:11.2f} MB {sum(mb):6.2f} MB')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
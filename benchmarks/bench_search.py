@@ -0,0 +1,64 @@
+"""Índice de legendas: vazão de montagem e latência das buscas x varrer o texto das legendas (user-022).
+
+    python -m benchmarks.bench_search [cursos] [aulas_por_curso] [cues_por_aula]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from itertools import islice
+
+from udemy_userAPI.search import CaptionIndex, tokenize
+
+QUERIES = ('python', 'funcao classe', 'palavra123', 'palavra123 python', 'inexistente')
+
+
+def corpus(courses: int, lectures: int, cues: int):
+    rnd = random.Random(1)
+    words = [f'palavra{i}' for i in range(20000)] + ['python', 'função', 'classe', 'variável', 'lista']
+    for course_id in range(courses):
+        for lecture_id in range(lectures):
+            yield course_id, lecture_id, [(k * 3000, k * 3000 + 2500, ' '.join(rnd.choices(words, k=10)))
+                                          for k in range(cues)]
+
+
+def median_ms(func, runs: int = 21) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return sorted(timings)[runs // 2] * 1000
+
+
+def main(courses: int = 50, lectures: int = 40, cues: int = 100):
+    data = list(corpus(courses, lectures, cues))
+    with tempfile.TemporaryDirectory() as directory:
+        index = CaptionIndex(os.path.join(directory, 'captions_index.sqlite3'))
+        started = time.perf_counter()
+        total = 0
+        with index.bulk():
+            for course_id, lecture_id, lecture_cues in data:
+                total += index.add_lecture(course_id, lecture_id, lecture_cues, signature='v1')
+        elapsed = time.perf_counter() - started
+        stats = index.stats()
+        print(f'montagem: {total} cues de {len(data)} aulas em {elapsed:.1f}s ({total / elapsed:,.0f} cues/s); '
+              f'{stats["terms"]} termos, {stats["size"] / 2 ** 20:.0f} MB')
+
+        def scan(query):
+            terms = set(tokenize(query))
+            return list(islice((text for _, _, lecture_cues in data for _, _, text in lecture_cues
+                                if terms.issubset(tokenize(text))), 50))
+
+        print(f'{"consulta":22s} {"resultados":>10s} {"índice":>10s} {"varredura":>11s}')
+        for query in QUERIES:
+            hits = len(index.search(query, limit=50))
+            indexed = median_ms(lambda: index.search(query, limit=50))
+            scanned = median_ms(lambda: scan(query), runs=3)
+            print(f'{query!r:22s} {hits:10d} {indexed:7.2f} ms {scanned:8.0f} ms')
+        index.close()
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:4]))
@@ -0,0 +1,31 @@
+"""Reutilização de conexões: requests.get por chamada x sessão compartilhada (user-001).
+
+    python -m benchmarks.bench_session [requisições]
+"""
+import sys
+import time
+
+import requests
+
+from benchmarks.stub_server import run_stub
+from udemy_userAPI.session import configure_rate_limit, connection_stats, get_session
+
+
+def main(total: int = 300):
+    configure_rate_limit('default', None)  # mede só o transporte
+    with run_stub() as stub:
+        url = f'{stub.base}/ping'
+        for name, get in (('requests.get por chamada', requests.get), ('sessão compartilhada', get_session().get)):
+            stub.reset()
+            started = time.perf_counter()
+            for _ in range(total):
+                get(url).raise_for_status()
+            elapsed = time.perf_counter() - started
+            stats = stub.stats()
+            print(f'{name:26s} {total} GETs em {elapsed:.2f}s ({elapsed / total * 1000:.2f} ms cada); '
+                  f'conexões abertas no servidor: {stats["connections"]}')
+        print('connection_stats():', connection_stats())
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,244 @@
+"""Servidor HTTP local que imita os endpoints da API da Udemy usados pelos benchmarks.
+
+Roda em um processo separado (para não disputar o GIL com o cliente medido) e conta as conexões
+TCP aceitas e as requisições atendidas. Uso::
+
+    with run_stub(items=3000, delay=0.15) as stub:
+        use_stub(stub.base)  # aponta a biblioteca para o servidor local
+        ...
+        stub.stats()  # {'connections': ..., 'requests': ...}
+"""
+import json
+import multiprocessing
+import re
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+_CURRICULUM = re.compile(r'^/api-2\.0/courses/(\d+)/subscriber-curriculum-items/$')
+_COURSE = re.compile(r'^/api-2\.0/courses/(\d+)/$')
+_LECTURE = re.compile(r'^/api-2\.0/users/me/subscribed-courses/(\d+)/lectures/(\d+)/$')
+_QUIZ = re.compile(r'^/api-2\.0/users/me/subscribed-courses/(\d+)/quizzes/(\d+)/$')
+_ASSESSMENTS = re.compile(r'^/api-2\.0/quizzes/(\d+)/assessments/$')
+_SUPPLEMENTARY = re.compile(r'^/api-2\.0/users/me/subscribed-courses/(\d+)/lectures/(\d+)/supplementary-assets/(\d+)/$')
+
+
+ASSESSMENTS_PER_QUIZ = 12  # perguntas de cada quiz
+
+
+def assessment_items(quiz_id: int) -> list[dict]:
+    """Gera as perguntas sintéticas de um quiz."""
+    return [{'_class': 'assessment', 'id': quiz_id * 100 + i, 'assessment_type': 'multiple-choice',
+             'prompt': {'question': f'<p>Pergunta {i + 1}</p>', 'answers': ['<p>a</p>', '<p>b</p>'],
+                        'feedbacks': ['', ''], 'explanation': ''},
+             'correct_response': ['a'], 'section': 'Geral', 'question_plain': f'Pergunta {i + 1}',
+             'related_lectures': []}
+            for i in range(ASSESSMENTS_PER_QUIZ)]
+
+
+def curriculum_items(count: int, per_chapter: int = 10) -> list[dict]:
+    """Gera um currículo sintético com 'count' aulas (mais capítulos, quizzes e arquivos adicionais)."""
+    items = []
+    order = 0
+    for i in range(count):
+        if i % per_chapter == 0:
+            items.append({'_class': 'chapter', 'id': 900000 + i, 'title': f'Capítulo {i // per_chapter + 1}',
+                          'object_index': i // per_chapter + 1, 'sort_order': 10 ** 7 - order})
+            order += 1
+        files = []
+        if i % 3 == 0:
+            files.append({'_class': 'asset', 'id': 700000 + i, 'asset_type': 'File', 'filename': f'aula{i}.pdf',
+                          'title': f'aula{i}.pdf', 'is_external': False})
+        if i % 5 == 0:
+            files.append({'_class': 'asset', 'id': 800000 + i, 'asset_type': 'ExternalLink', 'filename': '',
+                          'title': f'link {i}', 'is_external': True})
+        items.append({'_class': 'lecture', 'id': 100000 + i, 'title': f'Aula {i + 1}', 'object_index': i + 1,
+                      'is_published': True, 'sort_order': 10 ** 7 - order, 'created': '2024-01-01T00:00:00Z',
+                      'is_free': False, 'supplementary_assets': files,
+                      'asset': {'_class': 'asset', 'id': 500000 + i, 'asset_type': 'Video' if i % 7 else 'Article',
+                                'title': f'aula{i}.mp4', 'created': '2024-01-01T00:00:00Z', 'time_estimation': 600}})
+        order += 1
+        if i % per_chapter == per_chapter - 1:
+            items.append({'_class': 'quiz', 'id': 300000 + i, 'title': f'Quiz {i // per_chapter + 1}',
+                          'object_index': 1, 'is_published': True, 'type': 'simple-quiz',
+                          'sort_order': 10 ** 7 - order})
+            order += 1
+    return items
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 512
+
+    def __init__(self, address, items: int, delay: float, max_page_size: int = None, missing=()):
+        super().__init__(address, _Handler)
+        self.items = curriculum_items(items)
+        self.delay = delay
+        self.max_page_size = max_page_size
+        self.missing = frozenset(missing)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+
+    def process_request(self, request, client_address):
+        with self.lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # mantém a conexão aberta entre requisições (keep-alive)
+    disable_nagle_algorithm = True  # cabeçalhos e corpo saem em escritas separadas
+
+    def do_GET(self):
+        server = self.server
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        if url.path == '/__stats':
+            with server.lock:
+                # a própria consulta abriu uma conexão nova
+                stats = {'connections': server.connections - 1, 'requests': server.requests}
+            return self._send(200, stats)
+        if url.path == '/__reset':
+            with server.lock:
+                server.connections, server.requests = 0, 0
+            return self._send(200, {})
+        with server.lock:
+            server.requests += 1
+        if server.delay:
+            time.sleep(server.delay)
+        match = _CURRICULUM.match(url.path)
+        if match:
+            return self._send(200, self._page(url, query, server.items))
+        match = _COURSE.match(url.path)
+        if match:
+            return self._send(200, {'_class': 'course', 'id': int(match.group(1)), 'title': 'Curso de teste',
+                                    'locale': {'locale': 'pt_BR'}, 'visible_instructors': []})
+        match = _QUIZ.match(url.path)
+        if match:
+            quiz_id = int(match.group(2))
+            if quiz_id in server.missing:
+                return self._send(404, {'detail': 'Not found'})
+            return self._send(200, {'_class': 'quiz', 'id': quiz_id, 'type': 'practice-test',
+                                    'title': f'Quiz {quiz_id}', 'description': '<p>Teste</p>', 'duration': 600,
+                                    'pass_percent': 70, 'num_assessments': ASSESSMENTS_PER_QUIZ})
+        match = _ASSESSMENTS.match(url.path)
+        if match:
+            quiz_id = int(match.group(1))
+            if quiz_id in server.missing:
+                return self._send(404, {'detail': 'Not found'})
+            return self._send(200, self._page(url, query, assessment_items(quiz_id)))
+        match = _SUPPLEMENTARY.match(url.path)
+        if match:
+            asset_id = int(match.group(3))
+            if asset_id in server.missing:
+                return self._send(404, {'detail': 'Not found'})
+            if 'external_url' in query.get('fields[asset]', ()):
+                return self._send(200, {'_class': 'asset', 'id': asset_id,
+                                        'external_url': f'https://example.com/{asset_id}'})
+            return self._send(200, {'_class': 'asset', 'id': asset_id, 'download_urls': {
+                'File': [{'label': 'download', 'file': f'https://files.example.com/{asset_id}'}]}})
+        match = _LECTURE.match(url.path)
+        if match:
+            lecture_id = int(match.group(2))
+            if lecture_id in server.missing:
+                return self._send(404, {'detail': 'Not found'})
+            return self._send(200, {'_class': 'lecture', 'id': lecture_id, 'title': f'Aula {lecture_id}',
+                                    'description': '<p>Descrição</p>', 'is_free': False,
+                                    'asset': {'_class': 'asset', 'id': lecture_id, 'asset_type': 'Video',
+                                              'media_sources': [], 'captions': []}})
+        if url.path == '/ping':
+            return self._send(200, {'ok': True})
+        return self._send(404, {'detail': 'Not found'})
+
+    def _page(self, url, query: dict, items: list) -> dict:
+        requested = int(query.get('page_size', ['1000'])[0])
+        # como a Udemy, limita o page_size sem avisar (o link 'next' repete o tamanho pedido)
+        size = min(requested, self.server.max_page_size or requested)
+        page = int(query.get('page', ['1'])[0])
+        next_page = None
+        if page * size < len(items):
+            next_page = f'http://{self.headers["Host"]}{url.path}?page_size={requested}&page={page + 1}'
+        return {'count': len(items), 'next': next_page, 'previous': None,
+                'results': items[(page - 1) * size:page * size]}
+
+    def _send(self, status: int, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _serve(conn, items: int, delay: float, max_page_size: int = None, missing=()):
+    server = _Server(('127.0.0.1', 0), items, delay, max_page_size, missing)
+    conn.send(server.server_address[1])
+    server.serve_forever()
+
+
+class Stub:
+    """Servidor em execução: 'base' é a URL raiz (ex.: http://127.0.0.1:54321)."""
+
+    def __init__(self, base: str):
+        self.base = base
+
+    def stats(self) -> dict:
+        with urllib.request.urlopen(f'{self.base}/__stats') as response:
+            return json.loads(response.read())
+
+    def reset(self):
+        urllib.request.urlopen(f'{self.base}/__reset').close()
+
+
+@contextmanager
+def run_stub(items: int = 300, delay: float = 0.0, max_page_size: int = None, missing=()):
+    """
+    Inicia o servidor local em outro processo.
+
+    Args:
+        items (int): Aulas do currículo servido em /api-2.0/courses/<id>/subscriber-curriculum-items/.
+        delay (float): Latência simulada de cada resposta, em segundos.
+        max_page_size (int): Maior página (do currículo e das perguntas) entregue, qualquer que seja o
+            page_size pedido.
+        missing: IDs de aulas, quizzes e assets respondidos com 404.
+    """
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_serve, args=(child, items, delay, max_page_size, tuple(missing)), daemon=True)
+    process.start()
+    try:
+        yield Stub(f'http://127.0.0.1:{parent.recv()}')
+    finally:
+        process.terminate()
+        process.join()
+
+
+def use_stub(base: str):
+    """
+    Aponta a biblioteca para o servidor local, dispensa a verificação de login (não há conta) e desliga o
+    rate limiter, que mediria a espera entre requisições em vez do código.
+    """
+    from udemy_userAPI import api
+    from udemy_userAPI.authenticate import UdemyAuth
+    from udemy_userAPI.session import rate_limiter
+    api.API_BASE = f'{base}/api-2.0'
+    UdemyAuth.verif_login = lambda self: True
+    rate_limiter.enabled = False
+
+
+if __name__ == '__main__':
+    import sys
+    with run_stub(items=int(sys.argv[1]) if len(sys.argv) > 1 else 300,
+                  delay=float(sys.argv[2]) if len(sys.argv) > 2 else 0.0) as stub:
+        print(f'Servidor local em {stub.base} (Ctrl+C para encerrar)', flush=True)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
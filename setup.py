@@ -21,6 +21,10 @@ setup(
         'cloudscraper',
         'pywidevine'
     ],
+    extras_require={
+        'async': ['aiohttp'],
+        'speed': ['orjson', 'brotli'],
+    },
     packages=find_packages(),
     zip_safe=False,
     include_package_data=True,
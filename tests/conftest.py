@@ -0,0 +1,27 @@
+from contextlib import ExitStack
+
+import pytest
+
+from benchmarks.stub_server import run_stub
+from udemy_userAPI import api
+from udemy_userAPI.authenticate import UdemyAuth
+from udemy_userAPI.cache import invalidate_memory_cache
+from udemy_userAPI.session import rate_limiter, validators
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """Inicia o servidor local dos benchmarks (argumentos de run_stub) e aponta a biblioteca para ele."""
+    invalidate_memory_cache()
+    validators.clear()
+    with ExitStack() as stack:
+        def start(**options):
+            server = stack.enter_context(run_stub(**options))
+            monkeypatch.setattr(api, 'API_BASE', f'{server.base}/api-2.0')
+            monkeypatch.setattr(UdemyAuth, 'verif_login', lambda self: True)
+            monkeypatch.setattr(rate_limiter, 'enabled', False)
+            return server
+
+        yield start
+    invalidate_memory_cache()
+    validators.clear()
@@ -0,0 +1,173 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from aiohttp import web
+
+from udemy_userAPI.aio import AsyncUdemy
+from udemy_userAPI.session import validators
+
+BASE = 'https://www.udemy.com/api-2.0/courses/1/subscriber-curriculum-items/?page_size=10'
+
+
+def paginated_client(pages: int = 3, per_page: int = 10):
+    """AsyncUdemy cujo __fetch serve um recurso paginado local, decodificando cada página uma única vez."""
+    client = AsyncUdemy()
+    fetched = []
+
+    async def fetch(url, as_json):
+        fetched.append(url)
+        await asyncio.sleep(0.01)  # mantém as chamadas simultâneas em andamento ao mesmo tempo
+        page = int(url.rsplit('page=', 1)[1]) if '&page=' in url else 1
+        return {'count': pages * per_page,
+                'next': f'{BASE}&page={page + 1}' if page < pages else None,
+                'results': [{'id': (page - 1) * per_page + i} for i in range(per_page)]}
+
+    client._AsyncUdemy__fetch = fetch
+    return client, fetched
+
+
+def test_get_paginated_merges_all_pages():
+    client, _ = paginated_client()
+    data = asyncio.run(client._get_paginated(BASE, page_size=10))
+    assert [item['id'] for item in data['results']] == list(range(30))
+    assert data['next'] is None
+
+
+def test_concurrent_identical_calls_do_not_share_results():
+    client, fetched = paginated_client()
+
+    async def run():
+        return await asyncio.gather(client._get_paginated(BASE, page_size=10),
+                                    client._get_paginated(BASE, page_size=10))
+
+    first, second = asyncio.run(run())
+    assert len(first['results']) == 30
+    assert len(second['results']) == 30
+    assert first['results'] is not second['results']
+    assert len(fetched) == 3  # as duas chamadas foram agrupadas pelo single-flight
+
+
+def test_not_modified_after_eviction_refetches():
+    requests = []
+
+    async def curriculum(request):
+        requests.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            validators.clear()  # o corpo guardado some enquanto a resposta está a caminho
+            return web.Response(status=304, headers={'ETag': '"v1"'})
+        return web.json_response({'results': [1, 2]}, headers={'ETag': '"v1"'})
+
+    async def run():
+        app = web.Application()
+        app.router.add_get('/api-2.0/courses/1/subscriber-curriculum-items/', curriculum)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        url = f'http://127.0.0.1:{port}/api-2.0/courses/1/subscriber-curriculum-items/'
+        client = AsyncUdemy()
+
+        async def logged_in():
+            return True
+
+        client.verif_login = logged_in
+        try:
+            return [await client._request(url), await client._request(url)]
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    validators.clear()
+    first, second = asyncio.run(run())
+    assert first == second == {'results': [1, 2]}
+    assert requests == [None, '"v1"', None]
+
+
+def test_get_paginated_with_capped_page_size(stub):
+    from benchmarks.stub_server import curriculum_items
+    from udemy_userAPI.api import curriculum_url
+
+    stub(items=3000, max_page_size=400)
+
+    async def run():
+        async with stub_client() as client:
+            return await client._get_paginated(curriculum_url(1, page_size=1000))
+
+    data = asyncio.run(run())
+    assert [item['id'] for item in data['results']] == [item['id'] for item in curriculum_items(3000)]
+
+
+def stub_client() -> AsyncUdemy:
+    client = AsyncUdemy()
+
+    async def logged_in():
+        return True
+
+    client.verif_login = logged_in
+    return client
+
+
+def test_additional_files_report_failures_per_file(stub):
+    stub(items=30, missing=(700003,))
+
+    async def run():
+        async with stub_client() as client:
+            course = await client.get_details_course(1)
+            return await course.get_additional_files()
+
+    files = asyncio.run(run())
+    assert len(files) == 16
+    assert [f['title-file'] for f in files if f['error'] is not None] == ['aula3.pdf']
+    assert files[0]['data-file'] == {'File': [{'label': 'download', 'file': 'https://files.example.com/700000'}]}
+
+
+def test_cached_login_does_not_leave_the_loop(monkeypatch):
+    from udemy_userAPI.authenticate import UdemyAuth
+
+    async def no_threads(*args, **kwargs):
+        raise AssertionError('verificação em cache não deveria usar uma thread')
+
+    monkeypatch.setattr(UdemyAuth, 'cached_login', lambda self: True)
+    monkeypatch.setattr(asyncio, 'to_thread', no_threads)
+    assert asyncio.run(AsyncUdemy().verif_login()) is True
+
+
+def test_concurrent_login_checks_share_one_thread(monkeypatch):
+    import time
+    from udemy_userAPI.authenticate import UdemyAuth
+
+    calls = []
+
+    def verif_login(self):
+        calls.append(1)
+        time.sleep(0.05)
+        return True
+
+    monkeypatch.setattr(UdemyAuth, 'cached_login', lambda self: None)
+    monkeypatch.setattr(UdemyAuth, 'verif_login', verif_login)
+    client = AsyncUdemy()
+
+    async def run():
+        return await asyncio.gather(*(client.verif_login() for _ in range(50)))
+
+    assert asyncio.run(run()) == [True] * 50
+    assert calls == [1]
+
+
+def test_get_details_lectures_reports_failures_per_lecture(stub):
+    stub(items=30, missing=(100004,))
+
+    async def run():
+        async with stub_client() as client:
+            course = await client.get_details_course(1)
+            return await course.get_details_lectures([100005, 100004, 999, 100001, 100005])
+
+    results = asyncio.run(run())
+    assert [r.lecture_id for r in results] == [100001, 100004, 100005, 999]
+    assert [r.ok for r in results] == [True, False, True, False]
+    assert results[0].lecture.get_lecture_id == 100001
+    assert isinstance(results[3].error, FileNotFoundError)
@@ -0,0 +1,118 @@
+import threading
+import time
+
+from udemy_userAPI.cache import DiskCache, invalidate_memory_cache, memoized, memory_cache
+
+
+def test_memoized_results_are_independent_copies():
+    calls = []
+
+    @memoized(ttl=60)
+    def load(course_id):
+        calls.append(course_id)
+        return {'results': [{'id': 1}], 'count': 1}
+
+    invalidate_memory_cache()
+    first = load(7)
+    first['results'].append({'id': 2})
+    first['count'] = 99
+    second = load(7)
+    assert second == {'results': [{'id': 1}], 'count': 1}
+    second['results'][0]['id'] = 3
+    assert load(7)['results'] == [{'id': 1}]
+    assert calls == [7]
+
+
+def test_memoized_coalesces_concurrent_calls_without_sharing():
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    @memoized(ttl=60)
+    def slow(course_id):
+        calls.append(course_id)
+        started.set()
+        release.wait(5)
+        return {'results': []}
+
+    invalidate_memory_cache()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow(1))) for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert calls == [1]
+    assert len({id(result) for result in results}) == 4
+    invalidate_memory_cache(course_id=1)
+    assert memory_cache.stats()['entries'] == 0
+
+
+def disk_cache(tmp_path, **kwargs) -> DiskCache:
+    return DiskCache(str(tmp_path / 'responses.sqlite3'), **kwargs)
+
+
+def test_disk_cache_key_normalizes_urls():
+    assert (DiskCache.key('HTTPS://WWW.Udemy.com/api-2.0/courses/1/?b=2&a=1#x', 'conta')
+            == DiskCache.key('https://www.udemy.com/api-2.0/courses/1/?a=1&b=2', 'conta'))
+    assert DiskCache.key('https://www.udemy.com/a/', 'outra') != DiskCache.key('https://www.udemy.com/a/', 'conta')
+
+
+def test_disk_cache_round_trip_and_ttl(tmp_path):
+    cache = disk_cache(tmp_path, ttls={'course': 60, 'quick': 0.05})
+    cache.set('a', 'course', {'Content-Type': 'application/json'}, b'{"id": 1}')
+    assert cache.get('a') == ({'Content-Type': 'application/json'}, b'{"id": 1}')
+    cache.set('b', 'lecture', {}, b'x')  # família sem TTL: não é gravada
+    assert cache.get('b') is None
+    cache.set('c', 'quick', {}, b'x')
+    time.sleep(0.06)
+    assert cache.get('c') is None
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (1, 2)
+
+
+def test_disk_cache_evicts_least_recently_accessed(tmp_path):
+    cache = disk_cache(tmp_path, max_bytes=1000, ttls={'course': 60})
+    for key in ('a', 'b', 'c'):
+        cache.set(key, 'course', {}, b'x' * 400)
+        time.sleep(0.01)
+    cache.get('a')
+    cache.evict()
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.stats()['stored_bytes'] <= 1000
+
+
+def test_disk_cache_invalidate_by_pattern(tmp_path):
+    cache = disk_cache(tmp_path, ttls={'course': 60})
+    cache.set(DiskCache.key('https://www.udemy.com/api-2.0/courses/1/', ''), 'course', {}, b'1')
+    cache.set(DiskCache.key('https://www.udemy.com/api-2.0/courses/2/', ''), 'course', {}, b'2')
+    cache.invalidate('/courses/1/')
+    assert cache.stats()['entries'] == 1
+    cache.invalidate()
+    assert cache.stats()['entries'] == 0
+
+
+def test_disk_cache_is_shared_by_threads_and_instances(tmp_path):
+    cache = disk_cache(tmp_path, ttls={'course': 60})
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(20):
+                cache.set(f'{n}-{i}', 'course', {}, str(i).encode())
+                assert cache.get(f'{n}-{i}')[1] == str(i).encode()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    other = disk_cache(tmp_path, ttls={'course': 60})  # outro processo abrindo o mesmo arquivo
+    assert other.stats()['entries'] == 160
+    assert other.get('7-19')[1] == b'19'
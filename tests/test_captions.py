@@ -0,0 +1,12 @@
+from udemy_userAPI.bultins import Caption, Captions
+
+
+def test_captions_iterates_caption_objects():
+    captions = Captions([{'locale_id': 'pt_BR', 'video_label': 'Português', 'url': 'https://x/pt.vtt', 'id': 3},
+                         {'locale_id': 'en_US', 'video_label': 'English'}])
+    assert len(captions) == 2
+    items = list(captions)
+    assert all(isinstance(caption, Caption) for caption in items)
+    assert [(c.locale_id, c.locale, c.url) for c in items] == [('pt_BR', 'Português', 'https://x/pt.vtt'),
+                                                              ('en_US', 'English', '')]
+    assert captions.get_lang('en_US').locale_id == 'en_US'
@@ -0,0 +1,78 @@
+from benchmarks.stub_server import assessment_items, curriculum_items
+from udemy_userAPI.bultins import Course
+from udemy_userAPI.exeptions import UnhandledExceptions
+from udemy_userAPI.sections import get_details_courses
+
+
+def stub_course(stub, **options) -> Course:
+    stub(**options)
+    return Course(results=get_details_courses(1), course_id=1)
+
+
+def curriculum_ids(items: int) -> list:
+    return [item['id'] for item in curriculum_items(items) if item['_class'] in ('lecture', 'quiz')]
+
+
+def expected_files(items: int) -> list:
+    return [(item['id'], asset['id']) for item in curriculum_items(items) if item['_class'] == 'lecture'
+            for asset in item['supplementary_assets']]
+
+
+def test_resolve_additional_files_reports_failures_per_file(stub):
+    course = stub_course(stub, items=30, missing=(700003, 800005))
+    files = course.resolve_additional_files(max_workers=4)
+    assert [f['lecture_id'] for f in files] == [lecture_id for lecture_id, _ in expected_files(30)]
+    failed = {f['title-file']: f for f in files if f['error'] is not None}
+    assert set(failed) == {'aula3.pdf', 'link 5'}
+    assert all(isinstance(f['error'], UnhandledExceptions) and f['data-file'] is None for f in failed.values())
+    ok = [f for f in files if f['error'] is None]
+    assert len(ok) == len(files) - 2
+    assert ok[0]['data-file'] == {'File': [{'label': 'download', 'file': 'https://files.example.com/700000'}]}
+    assert ok[1]['data-file'] == 'https://example.com/800000'
+
+
+def test_resolve_additional_files_filters_by_lecture(stub):
+    course = stub_course(stub, items=30)
+    files = course.resolve_additional_files(lecture_ids=[100000, 100003])
+    assert [(f['lecture_id'], f['title-file']) for f in files] == [
+        (100000, 'aula0.pdf'), (100000, 'link 0'), (100003, 'aula3.pdf')]
+    assert all(f['error'] is None for f in files)
+
+
+def test_get_details_lectures_returns_the_whole_course_in_curriculum_order(stub):
+    course = stub_course(stub, items=30)
+    results = course.get_details_lectures(max_workers=4)
+    assert [r.lecture_id for r in results] == curriculum_ids(30)
+    assert all(r.ok for r in results)
+    assert [r.lecture.get_lecture_id for r in results] == curriculum_ids(30)
+
+
+def test_get_details_lectures_reports_failures_per_lecture(stub):
+    course = stub_course(stub, items=30, missing=(100004, 300009))
+    results = course.get_details_lectures([100005, 999, 300009, 100004, 100001, 100005], max_workers=3)
+    # ordem do currículo, IDs repetidos uma única vez e desconhecidos no final
+    assert [r.lecture_id for r in results] == [100001, 100004, 100005, 300009, 999]
+    assert [r.ok for r in results] == [True, False, True, False, False]
+    assert results[0].lecture.get_lecture_id == 100001
+    assert isinstance(results[-1].error, FileNotFoundError)
+
+
+def test_iter_details_lectures_yields_every_result(stub):
+    course = stub_course(stub, items=30, missing=(100004,))
+    results = list(course.iter_details_lectures([100002, 100003, 100004, 100002], max_workers=2))
+    assert sorted(r.lecture_id for r in results) == [100002, 100003, 100004]
+    assert {r.lecture_id for r in results if not r.ok} == {100004}
+
+
+def test_get_all_quizzes_follows_pagination_and_reports_failures(stub):
+    course = stub_course(stub, items=30, max_page_size=5, missing=(300019,))
+    quizzes = course.get_all_quizzes(max_workers=4)
+    assert [q.quiz_id for q in quizzes] == [300009, 300019, 300029]
+    first = quizzes[0]
+    assert first.ok
+    assert (first.title, first.type, first.section, first.duration) == ('Quiz 300009', 'practice-test',
+                                                                        'Capítulo 1', 600)
+    assert [a.id for a in first.assessments] == [a['id'] for a in assessment_items(300009)]
+    assert first.assessments[0].question_text == 'Pergunta 1'
+    assert not quizzes[1].ok and quizzes[1].assessments == ()
+    assert [q.quiz_id for q in course.get_all_quizzes(quiz_ids=[300029, 123])] == [300029]
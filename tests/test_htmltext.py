@@ -0,0 +1,21 @@
+from udemy_userAPI.htmltext import html_to_text
+
+
+def test_blocks_lists_and_entities():
+    html = ('<h2>Título</h2><p>Use&nbsp;o <b>comando</b> &amp; veja:<br>saída</p>'
+            '<ol><li>um</li><li>dois<ul><li>sub</li></ul></li></ol><script>x()</script>')
+    assert html_to_text(html) == 'Título\n\nUse o comando & veja:\nsaída\n\n1. um\n2. dois\n  - sub'
+
+
+def test_table_cells_are_tab_separated():
+    assert html_to_text('<table><tr><td>a</td><td>b</td></tr><tr><td>c</td><td>d</td></tr></table>') == 'a\tb\nc\td'
+
+
+def test_pre_keeps_leading_whitespace():
+    assert html_to_text('<pre>    indented\n        code</pre>') == '    indented\n        code'
+    assert html_to_text('<p>a</p><pre>  x\n  y</pre><p>b</p>') == 'a\n\n  x\n  y\n\nb'
+
+
+def test_plain_text_and_empty_values():
+    assert html_to_text(None) == ''
+    assert html_to_text('  a\n  b &lt;c&gt; ') == 'a b <c>'
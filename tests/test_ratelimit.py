@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+
+from udemy_userAPI.ratelimit import MAX_RETRY_AFTER, RateLimiter, TokenBucket, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after(None, default=2.0) == 2.0
+    assert parse_retry_after('invalido', default=1.5) == 1.5
+    assert parse_retry_after('100000') == MAX_RETRY_AFTER
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0  # data no passado
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    bucket = TokenBucket(rate=10, burst=3)
+    now = bucket._updated
+    assert [bucket.reserve(now) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert abs(bucket.reserve(now) - 0.1) < 1e-9
+    assert abs(bucket.reserve(now) - 0.2) < 1e-9
+
+
+def test_token_bucket_adapts_rate():
+    bucket = TokenBucket(rate=10, burst=10)
+    bucket.slow_down()
+    assert bucket.rate == 5
+    for _ in range(100):
+        bucket.speed_up()
+    assert bucket.rate == 10
+
+
+def test_limiter_is_shared_across_threads():
+    limiter = RateLimiter({'default': (50.0, 5)})
+    started = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire, args=('lecture',)) for _ in range(15)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 5 de rajada e 10 a 50/s: ao menos ~0.2s no total
+    assert time.monotonic() - started >= 0.18
+
+
+def test_throttle_pauses_every_family_and_slows_the_affected_one():
+    limiter = RateLimiter({'lecture': (20.0, 20), 'default': (20.0, 20)})
+    limiter.throttle('lecture', retry_after=0.2)
+    assert limiter.reserve('default') > 0.1
+    stats = limiter.stats()
+    assert stats['throttled'] == 1
+    assert stats['rates']['lecture'] == 10.0
+    limiter.enabled = False
+    assert limiter.reserve('lecture') == 0.0
+
+
+def test_acquire_async_waits_without_blocking_the_loop():
+    limiter = RateLimiter({'default': (20.0, 1)})
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.gather(*(limiter.acquire_async('default') for _ in range(4)))
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(run()) > 5
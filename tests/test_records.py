@@ -0,0 +1,41 @@
+import json
+import pickle
+
+from benchmarks.stub_server import curriculum_items
+from udemy_userAPI.api import extract_files, parser_chapters
+from udemy_userAPI.bultins import Course
+from udemy_userAPI.records import Chapter, LectureRef, SupplementaryFile
+
+RESULTS = {'results': curriculum_items(20)}
+ASSETS = [{'lecture_id': item['id'], 'lecture_title': item['title'], 'asset': asset}
+          for item in RESULTS['results'] if item['_class'] == 'lecture' for asset in item['supplementary_assets']]
+
+
+def test_legacy_accessors_return_plain_dicts():
+    chapters = parser_chapters(RESULTS)
+    assert type(chapters[0]) is dict and type(chapters[0]['lectures']) is list
+    chapters[0]['lectures'].append({'title': 'extra'})
+    assert chapters[1]['lectures'][0] == {'asset_type': 'Video', 'title': 'Aula 11', 'lecture_id': 100010,
+                                          'asset_id': 500010}
+    assert chapters[0]['lectures'][-2] == {'asset_type': 'quiz', 'title': 'Quiz 1', 'lecture_id': 300009,
+                                           'type': 'simple-quiz', 'asset_id': ''}
+    files = extract_files(ASSETS)
+    assert files[0] == {'lecture_id': 100000, 'asset_id': 700000, 'asset_type': 'File', 'filename': 'aula0.pdf',
+                        'title': 'aula0.pdf', 'lecture_title': 'Aula 1', 'ExternalLink': False}
+    lectures = Course(RESULTS, course_id=1).get_lectures
+    assert lectures[0] == {'section': 'Capítulo 1', 'title': 'Aula 1', 'lecture_id': 100000, 'asset_id': 500000,
+                           'asset_type': 'Article', 'section_order': 1}
+    json.dumps([chapters, files, lectures])
+
+
+def test_records_are_opt_in_and_match_the_dicts():
+    chapters = parser_chapters(RESULTS, records=True)
+    assert all(isinstance(chapter, Chapter) for chapter in chapters)
+    assert [chapter.to_dict() for chapter in chapters] == parser_chapters(RESULTS)
+    files = extract_files(ASSETS, records=True)
+    assert all(isinstance(file, SupplementaryFile) for file in files)
+    assert [dict(file) for file in files] == extract_files(ASSETS)
+    course = Course(RESULTS, course_id=1)
+    assert all(isinstance(lecture, LectureRef) for lecture in course.lecture_records)
+    assert [dict(lecture) for lecture in course.lecture_records] == course.get_lectures
+    assert pickle.loads(pickle.dumps(chapters)) == chapters
@@ -0,0 +1,150 @@
+import time
+
+import pytest
+
+from udemy_userAPI.exeptions import CircuitOpenException
+from udemy_userAPI.ratelimit import RateLimiter
+from udemy_userAPI.retry import CircuitBreaker, CircuitBreakers, RequestAttempts, RetryPolicy, THROTTLE_RETRIES
+
+
+def test_retry_policy_respects_attempts_and_budget():
+    policy = RetryPolicy(max_attempts=3, budget_ratio=0.5, budget_reserve=2)
+    assert policy.should_retry(1) and policy.should_retry(2)
+    assert not policy.should_retry(3)  # limite de tentativas
+    assert not policy.should_retry(1)  # orçamento esgotado
+    policy.record_request()
+    policy.record_request()
+    assert policy.should_retry(1)
+    assert policy.stats()['budget_exhausted'] == 1
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=2.0)
+    assert all(0 <= policy.backoff(attempt) <= 2.0 for attempt in range(1, 20))
+
+
+def test_circuit_opens_after_consecutive_failures_and_recovers():
+    breaker = CircuitBreaker('www.udemy.com', failure_threshold=3, reset_timeout=0.05)
+    for _ in range(3):
+        breaker.before_request()
+        breaker.record_failure()
+    assert breaker.state == 'open'
+    with pytest.raises(CircuitOpenException):
+        breaker.before_request()
+    time.sleep(0.06)
+    breaker.before_request()  # requisição de teste
+    assert breaker.state == 'half_open'
+    with pytest.raises(CircuitOpenException):
+        breaker.before_request()  # só uma por vez
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    assert breaker.rejected == 2
+
+
+def test_failed_trial_reopens_the_circuit():
+    breaker = CircuitBreaker('www.udemy.com', failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker('www.udemy.com', failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == 'closed'
+
+
+def test_one_breaker_per_host():
+    breakers = CircuitBreakers()
+    first = breakers.for_url('https://www.udemy.com/api-2.0/courses/1/')
+    assert breakers.for_url('https://www.udemy.com/api-2.0/quizzes/2/') is first
+    assert breakers.for_url('https://vtt-c.udemycdn.com/a.vtt') is not first
+    assert set(breakers.stats()) == {'www.udemy.com', 'vtt-c.udemycdn.com'}
+
+
+def attempts_for(policy: RetryPolicy, retryable: bool = True) -> RequestAttempts:
+    limiter = RateLimiter()
+    limiter.enabled = False
+    return RequestAttempts('https://www.udemy.com/api-2.0/courses/1/', 'course', policy, CircuitBreakers(), limiter,
+                           retryable=retryable)
+
+
+def test_throttle_retries_spend_the_retry_budget():
+    policy = RetryPolicy(budget_ratio=0.0, budget_reserve=1)
+    attempts = attempts_for(policy)
+    attempts.before_send()
+    assert attempts.on_response(503, '0') == 0.0
+    attempts.before_send()
+    assert attempts.on_response(503, '0') is None  # orçamento esgotado
+    assert policy.stats()['retries'] == 1 and policy.stats()['budget_exhausted'] == 1
+
+
+def test_throttle_retries_do_not_count_as_attempts():
+    policy = RetryPolicy(max_attempts=1, budget_reserve=100)
+    attempts = attempts_for(policy)
+    for _ in range(THROTTLE_RETRIES):
+        attempts.before_send()
+        assert attempts.on_response(429, '0') == 0.0
+    attempts.before_send()
+    assert attempts.on_response(429, '0') is None
+    assert attempts.breaker.state == 'closed'  # 429 não indica instabilidade
+
+
+def test_transient_failures_back_off_until_the_attempt_limit():
+    policy = RetryPolicy(max_attempts=2, backoff_base=0.0, budget_reserve=100)
+    attempts = attempts_for(policy)
+    attempts.before_send()
+    assert attempts.on_error() == 0.0
+    attempts.before_send()
+    assert attempts.on_response(502) is None
+    attempts = attempts_for(policy)
+    attempts.before_send()
+    assert attempts.on_error(transient=False) is None
+
+
+def test_non_idempotent_requests_are_sent_once():
+    attempts = attempts_for(RetryPolicy(budget_reserve=100), retryable=False)
+    attempts.before_send()
+    assert attempts.on_response(429, '0') is None
+    assert attempts.on_error() is None
+
+
+def test_sync_session_stops_a_503_storm_at_the_budget(monkeypatch):
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    import requests
+
+    from udemy_userAPI import session
+
+    sent = []
+
+    class Unavailable(BaseHTTPRequestHandler):
+        def do_GET(self):
+            sent.append(self.path)
+            self.send_response(503)
+            self.send_header('Retry-After', '0')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Unavailable)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(session, 'retry_policy', RetryPolicy(budget_ratio=0.0, budget_reserve=1, backoff_base=0.0))
+    monkeypatch.setattr(session, 'circuit_breakers', CircuitBreakers())
+    monkeypatch.setattr(session, 'rate_limiter', RateLimiter())
+    http = requests.Session()
+    http.mount('http://', session.UdemyAdapter())
+    try:
+        assert http.get(f'http://127.0.0.1:{server.server_port}/a').status_code == 503
+        assert http.get(f'http://127.0.0.1:{server.server_port}/b').status_code == 503
+    finally:
+        http.close()
+        server.shutdown()
+    assert sent == ['/a', '/a', '/b']  # uma única nova tentativa cabia no orçamento
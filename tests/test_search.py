@@ -0,0 +1,53 @@
+from udemy_userAPI.search import CaptionIndex, tokenize
+
+
+def postings(index: CaptionIndex) -> int:
+    return index._connection().execute('SELECT COUNT(*) FROM postings').fetchone()[0]
+
+
+def test_tokenize_strips_case_and_accents():
+    assert tokenize('Ação, REAÇÃO e café_2') == ['acao', 'reacao', 'e', 'cafe_2']
+
+
+def test_search_requires_every_term(tmp_path):
+    index = CaptionIndex(str(tmp_path / 'index.sqlite3'))
+    index.add_lecture(1, 10, [(0, 1000, 'Olá mundo'), (1000, 2000, 'mundo cruel')])
+    index.add_lecture(2, 20, [(0, 1000, 'outro mundo')])
+    assert [hit['text'] for hit in index.search('mundo')] == ['Olá mundo', 'mundo cruel', 'outro mundo']
+    assert [hit['start_ms'] for hit in index.search('MUNDO cruel')] == [1000]
+    assert index.search('mundo', course_ids=[2])[0]['lecture_id'] == 20
+    assert index.search('inexistente') == []
+
+
+def test_cues_starting_together_are_kept(tmp_path):
+    index = CaptionIndex(str(tmp_path / 'index.sqlite3'))
+    cues = [(1000, 2000, 'alpha speaker'), (1000, 2500, 'beta narrator')]
+    assert index.add_lecture(1, 10, cues) == 2
+    assert [hit['text'] for hit in index.search('alpha')] == ['alpha speaker']
+    assert [hit['text'] for hit in index.search('beta')] == ['beta narrator']
+    assert postings(index) == 4
+
+
+def test_reindex_leaves_no_orphan_postings(tmp_path):
+    index = CaptionIndex(str(tmp_path / 'index.sqlite3'))
+    index.add_lecture(1, 10, [(1000, 2000, 'alpha speaker'), (1000, 2500, 'beta narrator')])
+    index.add_lecture(1, 10, [(0, 500, 'gamma')])
+    assert postings(index) == 1
+    assert index.search('alpha') == []
+    index.remove_course(1)
+    assert postings(index) == 0
+    assert index.stats()['lectures'] == 0
+
+
+def test_bulk_rolls_back_on_error(tmp_path):
+    index = CaptionIndex(str(tmp_path / 'index.sqlite3'))
+    try:
+        with index.bulk(commit_every=10):
+            index.add_lecture(1, 10, [(0, 1000, 'primeira')])
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert index.search('primeira') == []
+    with index.bulk(commit_every=1):
+        index.add_lecture(1, 10, [(0, 1000, 'primeira')], signature='v1')
+    assert index.signature(1, 10) == 'v1'
@@ -0,0 +1,26 @@
+from benchmarks.stub_server import curriculum_items
+from udemy_userAPI.sections import get_details_courses, remaining_page_urls
+
+NEXT = 'https://www.udemy.com/api-2.0/courses/1/subscriber-curriculum-items/?page_size=1000&page=2'
+
+
+def test_remaining_pages_use_the_page_size_applied_by_the_server():
+    first_page = {'count': 3000, 'next': NEXT, 'results': [{}] * 200}
+    urls = remaining_page_urls(first_page, page_size=1000)
+    assert len(urls) == 14
+    assert urls[0] == NEXT
+    assert urls[-1].endswith('&page=15')
+
+
+def test_remaining_pages_without_next_or_count():
+    assert remaining_page_urls({'count': 10, 'next': None, 'results': [{}] * 10}, 1000) == []
+    assert remaining_page_urls({'next': NEXT, 'results': [{}] * 10}, 1000) == []
+
+
+def test_capped_page_size_returns_the_whole_curriculum(stub):
+    stub(items=3000, max_page_size=400)
+    data = get_details_courses(1)
+    expected = [item['id'] for item in curriculum_items(3000)]
+    assert data['count'] == len(expected)
+    assert [item['id'] for item in data['results']] == expected
+    assert data['next'] is None
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+
+import pytest
+
+from udemy_userAPI.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def run_concurrently(flights: SingleFlight, key, func, callers: int = 5):
+    started = threading.Event()
+    release = threading.Event()
+    results, errors = [], []
+
+    def leader():
+        started.set()
+        release.wait(5)
+        return func()
+
+    def call(target):
+        try:
+            results.append(flights.do(key, target))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call, args=(leader,))]
+    threads[0].start()
+    started.wait(5)
+    threads += [threading.Thread(target=call, args=(func,)) for _ in range(callers - 1)]
+    for thread in threads[1:]:
+        thread.start()
+    while flights.stats()['shared'] < callers - 1:  # todas aguardando a execução em andamento
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_calls_share_one_execution():
+    flights = SingleFlight()
+    calls = []
+    results, errors = run_concurrently(flights, 'k', lambda: calls.append(1) or 'valor')
+    assert errors == [] and calls == [1]
+    assert sorted(results) == [('valor', False)] + [('valor', True)] * 4
+    assert flights.stats() == {'executed': 1, 'shared': 4, 'in_flight': 0}
+
+
+def test_errors_reach_every_waiting_caller():
+    flights = SingleFlight()
+
+    def fail():
+        raise ValueError('falhou')
+
+    results, errors = run_concurrently(flights, 'k', fail)
+    assert results == [] and len(errors) == 5
+    assert flights.stats()['in_flight'] == 0
+
+
+def test_sequential_calls_execute_again():
+    flights = SingleFlight()
+    assert flights.do('k', lambda: 1) == (1, False)
+    assert flights.do('k', lambda: 2) == (2, False)
+    assert flights.do('outra', lambda: 3) == (3, False)
+
+
+def test_async_single_flight_shares_one_task():
+    flights = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 'valor'
+
+    async def run():
+        return await asyncio.gather(*(flights.do('k', fetch) for _ in range(5)))
+
+    assert asyncio.run(run()) == ['valor'] * 5
+    assert calls == [1]
+    assert flights.stats() == {'executed': 1, 'shared': 4, 'in_flight': 0}
+
+
+def test_cancelling_one_caller_does_not_cancel_the_others():
+    flights = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return 'valor'
+
+    async def run():
+        first = asyncio.ensure_future(flights.do('k', fetch))
+        second = asyncio.ensure_future(flights.do('k', fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == 'valor'
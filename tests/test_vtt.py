@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+from udemy_userAPI.vtt import (CueTable, convert_captions, convert_file, format_timestamp, iter_lines, parse_timestamp,
+                               parse_vtt)
+
+VTT = """WEBVTT
+
+NOTE comentário
+
+1
+00:00:01.000 --> 00:00:02.500
+Olá
+
+00:00:02.500 --> 00:00:04.000 align:start
+segunda
+linha
+
+01:00:00.000 --> 01:00:01.000
+fim
+"""
+
+
+def test_timestamps():
+    assert parse_timestamp('01:02:03.004') == 3723004
+    assert parse_timestamp('02:03,4') == 123400
+    assert format_timestamp(3723004, ',') == '01:02:03,004'
+
+
+def test_parse_and_lookup():
+    table = parse_vtt(VTT)
+    assert len(table) == 3
+    assert table[1].text == 'segunda\nlinha'
+    assert table.cue_at(1500).text == 'Olá'
+    assert table.cue_at(2500).text == 'segunda\nlinha'
+    assert table.cue_at(5000) is None
+    assert [cue.text for cue in table.cues_between(0, 3000)] == ['Olá', 'segunda\nlinha']
+    assert table.duration == 3601000
+    assert list(CueTable(table)) == list(table)
+
+
+def test_iter_lines_joins_crlf_split_across_chunks():
+    assert list(iter_lines(['a\r', '\nb\n', 'c'])) == ['a', 'b', 'c']
+
+
+def test_convert_file_writes_srt_and_txt(tmp_path):
+    source = tmp_path / 'aula.vtt'
+    source.write_text(VTT, encoding='utf-8')
+    result = convert_file(str(source))
+    assert result['status'] == 'converted' and result['cues'] == 3
+    assert (tmp_path / 'aula.srt').read_text(encoding='utf-8').startswith('1\n00:00:01,000 --> 00:00:02,500\nOlá\n')
+    assert (tmp_path / 'aula.txt').read_text(encoding='utf-8') == 'Olá\nsegunda\nlinha\nfim\n'
+    assert convert_file(str(source))['status'] == 'skipped'
+
+
+def test_convert_file_cleans_up_when_an_output_cannot_be_opened(tmp_path):
+    source = tmp_path / 'aula.vtt'
+    source.write_text(VTT, encoding='utf-8')
+    (tmp_path / 'aula.txt.part').mkdir()  # o open() da segunda saída falha
+    with pytest.raises(OSError):
+        convert_file(str(source), formats=('srt', 'txt'))
+    assert not os.path.exists(tmp_path / 'aula.srt.part')
+    assert not os.path.exists(tmp_path / 'aula.srt')
+
+
+def test_convert_captions_lists_outputs_in_source_order(tmp_path):
+    for name in ('a', 'b', 'c'):
+        (tmp_path / f'{name}.vtt').write_text(VTT, encoding='utf-8')
+    first = convert_captions(str(tmp_path), formats=('srt',), processes=1)
+    assert first['converted'] == 3
+    source = tmp_path / 'b.vtt'
+    later = os.path.getmtime(tmp_path / 'b.srt') + 10
+    os.utime(source, (later, later))
+    report = convert_captions(str(tmp_path), formats=('srt',), processes=1)
+    assert (report['converted'], report['skipped']) == (1, 2)
+    assert [os.path.basename(path) for path in report['files']] == ['a.srt', 'b.srt', 'c.srt']
@@ -1,7 +1,24 @@
 from .udemy import Udemy
-from .authenticate import UdemyAuth
-from .exeptions import UdemyUserApiExceptions,LoginException
+from .authenticate import UdemyAuth, set_login_cache_ttl, invalidate_login_cache, login_cache_stats
+from .exeptions import UdemyUserApiExceptions,LoginException,CircuitOpenException,FieldNotFetchedException
+from .api import LECTURE_FIELD_GROUPS, CURRICULUM_FIELD_GROUPS
+from .htmltext import html_to_text
+from .records import Assessment, Chapter, LectureRef, QuizRecord, SupplementaryFile
+from .vtt import Cue, CueTable, parse_vtt, parse_vtt_file, convert_file, convert_captions
+from .search import CaptionIndex, get_caption_index, search_captions
+from .cache import configure_memory_cache, invalidate_memory_cache, memory_cache_stats
+from .aio import AsyncUdemy, AsyncCourse, AsyncLecture
+from .session import configure_session, close_session, connection_stats, configure_rate_limit, rate_limit_stats, \
+    configure_retry, retry_stats, revalidation_stats, enable_disk_cache, disable_disk_cache, clear_disk_cache, \
+    disk_cache_stats, single_flight_stats
  
 
-__all_ = ['Udemy','UdemyAuth','UdemyUserApiExceptions','LoginException']
-
+__all_ = ['Udemy','AsyncUdemy','AsyncCourse','AsyncLecture','UdemyAuth','UdemyUserApiExceptions',
+          'LoginException','CircuitOpenException','FieldNotFetchedException','LECTURE_FIELD_GROUPS',
+          'CURRICULUM_FIELD_GROUPS','Chapter','LectureRef','SupplementaryFile','QuizRecord','Assessment',
+          'html_to_text','Cue','CueTable','parse_vtt','parse_vtt_file','convert_file','convert_captions','CaptionIndex',
+          'get_caption_index','search_captions','configure_session','close_session','connection_stats',
+          'configure_rate_limit','rate_limit_stats','configure_retry','retry_stats','revalidation_stats',
+          'enable_disk_cache','disable_disk_cache','clear_disk_cache','disk_cache_stats',
+          'single_flight_stats','configure_memory_cache','invalidate_memory_cache','memory_cache_stats',
+          'set_login_cache_ttl','invalidate_login_cache','login_cache_stats']
@@ -0,0 +1,648 @@
+import asyncio
+
+try:
+    import aiohttp
+except ImportError:  # dependência opcional: pip install udemy_userAPI[async]
+    aiohttp = None
+
+from .api import (HEADERS_USER, curriculum_url, lecture_url, lecture_infor_url, quiz_url, assessments_url,
+                  supplementary_asset_url, article_url, course_infor_url, parser_chapters, extract_files,
+                  get_files_aule, save_html, select_fields, LECTURE_FIELD_GROUPS, CURRICULUM_FIELD_GROUPS)
+from .authenticate import UdemyAuth, invalidate_login_cache
+from functools import cached_property
+from .bultins import Lecture, LectureResult, Captions, Caption, Quiz
+from .exeptions import UdemyUserApiExceptions, UnhandledExceptions, LoginException, FieldNotFetchedException
+from .cache import account_identity
+from .retry import RequestAttempts
+from .singleflight import AsyncSingleFlight
+from . import session as session_module
+from .session import (rate_limiter, retry_policy, circuit_breakers, validators, endpoint_family, DEFAULT_TIMEOUT,
+                      CONDITIONAL_FAMILIES, decode_json)
+from .sections import (SUBSCRIBED_COURSES_URL, SUBSCRIPTION_ENROLLMENTS_URL, CURRICULUM_PAGE_SIZE,
+                       remaining_page_urls)
+
+MAX_CONCURRENCY = 20  # requisições simultâneas por cliente
+MAX_CONNECTIONS = 32  # tamanho do pool de conexões do cliente
+
+
+class AsyncUdemy:
+    """Cliente assíncrono (asyncio) para API de usuário da plataforma Udemy.
+
+    Use como gerenciador de contexto para que o pool de conexões seja fechado ao final::
+
+        async with AsyncUdemy() as udemy:
+            course = await udemy.get_details_course(course_id)
+            lectures = await course.get_details_lectures()
+    """
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY, max_connections: int = MAX_CONNECTIONS):
+        """
+        Inicializa o cliente assíncrono.
+
+        Args:
+            max_concurrency (int): Número máximo de requisições em andamento ao mesmo tempo.
+            max_connections (int): Número máximo de conexões mantidas no pool.
+
+        Raises:
+            UdemyUserApiExceptions: Se o aiohttp não estiver instalado.
+        """
+        if aiohttp is None:
+            raise UdemyUserApiExceptions("O cliente assíncrono requer o aiohttp: pip install udemy_userAPI[async]")
+        self.__max_concurrency = max_concurrency
+        self.__max_connections = max_connections
+        self.__session = None
+        self.__semaphore = None
+        self.__flights = AsyncSingleFlight()
+        self.__auth = UdemyAuth()
+        self.__login_flights = AsyncSingleFlight()
+        self.__timeout = aiohttp.ClientTimeout(sock_connect=DEFAULT_TIMEOUT[0], sock_read=DEFAULT_TIMEOUT[1])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Fecha o pool de conexões do cliente."""
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        self.__session = None
+
+    def __get_session(self):
+        if self.__session is None or self.__session.closed:
+            connector = aiohttp.TCPConnector(limit=self.__max_connections, limit_per_host=self.__max_connections)
+            self.__session = aiohttp.ClientSession(connector=connector, headers=HEADERS_USER)
+            self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+        return self.__session
+
+    async def verif_login(self) -> bool:
+        """
+        Verifica se o usuário está logado (usa o mesmo cache de verificação do cliente síncrono).
+
+        O resultado em cache é lido sem sair do loop; só a consulta à Udemy roda em uma thread, e as
+        verificações simultâneas do cliente compartilham essa consulta.
+
+        Returns:
+            bool: True se o usuário estiver logado, False caso contrário.
+        """
+        cached = self.__auth.cached_login()
+        if cached is not None:
+            return cached
+        return await self.__login_flights.do('verif_login', lambda: asyncio.to_thread(self.__auth.verif_login))
+
+    async def _request(self, url: str, as_json: bool = True):
+        """
+        Faz uma requisição GET respeitando o limite de concorrência do cliente.
+
+        Args:
+            url (str): URL a ser requisitada.
+            as_json (bool): Se True, decodifica a resposta como JSON; caso contrário retorna o texto.
+
+        Raises:
+            LoginException: Se a sessão estiver expirada.
+            UdemyUserApiExceptions: Se houver erro de conexão ou tempo de requisição excedido
+                (após as novas tentativas da política de retry).
+            CircuitOpenException: Se o circuito do host estiver aberto.
+            UnhandledExceptions: Se a resposta tiver um código de status diferente de 200.
+        """
+        return await self.__flights.do((url, as_json), lambda: self.__fetch(url, as_json))
+
+    def single_flight_stats(self) -> dict:
+        """Retorna quantas requisições simultâneas idênticas deste cliente foram agrupadas em uma só."""
+        return self.__flights.stats()
+
+    async def __fetch(self, url: str, as_json: bool):
+        if not await self.verif_login():
+            raise LoginException("Sessão expirada!")
+        session = self.__get_session()
+        family = endpoint_family(url)
+        cache = session_module.disk_cache
+        disk_key = None
+        if cache is not None and cache.ttl_for(family):
+            disk_key = cache.key(url, account_identity(HEADERS_USER.get('Cookie', '')))
+            hit = await asyncio.to_thread(cache.get, disk_key)
+            if hit is not None:
+                return decode_json(hit[1]) if as_json else hit[1].decode('utf-8')
+        headers = None
+        if family in CONDITIONAL_FAMILIES:
+            key = (url, account_identity(HEADERS_USER.get('Cookie', '')))
+            headers = validators.conditional_headers(key)
+        status, body, validator_headers, content_type = await self.__send(session, url, family, headers)
+        if headers is not None:
+            entry = validators.not_modified_entry(key) if status == 304 and headers else None
+            if status == 304 and headers and entry is None:
+                # o corpo guardado foi descartado entre o envio e a resposta: pede o recurso completo
+                status, body, validator_headers, content_type = await self.__send(session, url, family, None)
+            if entry is not None:
+                status, body = 200, entry['body']
+            elif status == 200:
+                validators.store(key, validator_headers[0], validator_headers[1], body,
+                                 {'Content-Type': content_type} if content_type else {})
+        if status in (401, 403):
+            invalidate_login_cache()
+        if status != 200:
+            raise UnhandledExceptions(f"Erro ao obter dados! Código de status: {status}")
+        if disk_key is not None:
+            await asyncio.to_thread(cache.set, disk_key, family,
+                                    {'Content-Type': content_type} if content_type else {}, body)
+        if as_json:
+            return decode_json(body)
+        return body.decode('utf-8')
+
+    async def __send(self, session, url: str, family: str, headers: dict):
+        # uma requisição com a mesma política de rate limit, retry e circuit breaker do cliente síncrono
+        attempts = RequestAttempts(url, family, retry_policy, circuit_breakers, rate_limiter)
+        while True:
+            delay = attempts.before_send()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                async with self.__semaphore:
+                    async with session.get(url, headers=headers, timeout=self.__timeout) as response:
+                        body = await response.read()
+                        status = response.status
+                        retry_after = response.headers.get('Retry-After')
+                        validator_headers = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                        content_type = response.headers.get('Content-Type')
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+                delay = attempts.on_error()
+                if delay is None:
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise UdemyUserApiExceptions(f"Tempo de requisição excedido: {e}")
+                    raise UdemyUserApiExceptions(f"Erro de conexão: {e}")
+                await asyncio.sleep(delay)
+                continue
+            except aiohttp.TooManyRedirects as e:
+                attempts.on_error(transient=False)
+                raise UdemyUserApiExceptions(f"Limite de redirecionamentos excedido: {e}")
+            except aiohttp.ClientError as e:
+                attempts.on_error(transient=False)
+                raise UdemyUserApiExceptions(f"Erro de conexão: {e}")
+            delay = attempts.on_response(status, retry_after)
+            if delay is None:
+                return status, body, validator_headers, content_type
+            await asyncio.sleep(delay)
+
+    async def _get_paginated(self, url: str, page_size: int = CURRICULUM_PAGE_SIZE) -> dict:
+        """
+        Obtém um recurso paginado e concatena os 'results' (páginas 2..N pedidas simultaneamente).
+
+        Se a quantidade de itens não bater com o 'count' da primeira página, a paginação é refeita seguindo
+        os links 'next' um a um (ver sections.get_details_courses).
+        """
+        data = await self._request(url)
+        # a mesma resposta é entregue a todas as chamadas agrupadas pelo single-flight: não a altere
+        first_results = data.get('results') or []
+        all_results = list(first_results)
+        next_page = data.get('next', '')
+        pages = remaining_page_urls(data, page_size)
+        if pages:
+            for page_data in await asyncio.gather(*(self._request(page) for page in pages)):
+                all_results.extend(page_data.get('results', []))
+                next_page = page_data.get('next', '')
+        all_results.extend(await self.__follow_next(next_page))
+        count = data.get('count')
+        if count and len(all_results) != count and data.get('next'):
+            all_results = list(first_results) + await self.__follow_next(data.get('next'))
+        return dict(data, results=all_results, next=None)
+
+    async def __follow_next(self, next_page: str) -> list:
+        results = []
+        while next_page:
+            next_data = await self._request(next_page)
+            results.extend(next_data.get('results', []))
+            next_page = next_data.get('next', '')
+        return results
+
+    async def my_subscribed_courses_by_plan(self) -> list[dict]:
+        """
+        Obtém os cursos que o usuário está inscrito, obtidos através de planos (assinatura).
+
+        Returns:
+            list[dict]: Lista de cursos inscritos através de planos.
+        """
+        data = await self._request(SUBSCRIPTION_ENROLLMENTS_URL)
+        results = data.get('results', None)
+        return [results] if results else []
+
+    async def my_subscribed_courses(self) -> list[dict]:
+        """
+        Obtém todos os cursos que o usuário está inscrito (comprados e de planos).
+
+        Returns:
+            list[dict]: Lista de todos os cursos inscritos.
+        """
+        default, plan = await asyncio.gather(self._request(SUBSCRIBED_COURSES_URL),
+                                             self._request(SUBSCRIPTION_ENROLLMENTS_URL))
+        all_courses = []
+        for data in (default, plan):
+            all_courses.extend(data.get('results', None) or [])
+        return all_courses
+
+    async def get_details_course(self, course_id, fields=None) -> 'AsyncCourse':
+        """
+        Obtém detalhes de um curso através do ID.
+
+        O currículo (que também traz os arquivos adicionais) e as informações do curso são obtidos simultaneamente.
+
+        Args:
+            course_id: O ID do curso.
+            fields: Grupos de campos opcionais do currículo (chaves de CURRICULUM_FIELD_GROUPS). None pede todos;
+                sem 'supplementary' os arquivos adicionais não são baixados.
+
+        Returns:
+            AsyncCourse: Um objeto AsyncCourse contendo os detalhes do curso.
+        """
+        fields = select_fields(fields, CURRICULUM_FIELD_GROUPS)
+        results, information = await asyncio.gather(
+            self._get_paginated(curriculum_url(course_id, page_size=CURRICULUM_PAGE_SIZE, fields=fields)),
+            self._request(course_infor_url(course_id)),
+        )
+        return AsyncCourse(client=self, course_id=course_id, results=results,
+                           additional_files=results if 'supplementary' in fields else None, information=information)
+
+
+class AsyncCaption(Caption):
+    """Representa uma legenda cujo conteúdo é obtido de forma assíncrona."""
+
+    def __init__(self, caption: dict, client: AsyncUdemy):
+        super().__init__(caption=caption)
+        self.__client = client
+
+    async def content(self) -> str:
+        """Obtém o conteúdo da legenda."""
+        if not self.url:
+            raise FileNotFoundError('Não foi possível obter a URL da legenda!')
+        return await self.__client._request(self.url, as_json=False)
+
+
+class AsyncCaptions(Captions):
+    """Gerencia as legendas de um vídeo (versão assíncrona)."""
+
+    def __init__(self, caption_data: list, client: AsyncUdemy):
+        super().__init__(caption_data=caption_data)
+        self.__client = client
+
+    def __iter__(self):
+        """Percorre as legendas da aula, uma por idioma."""
+        return (AsyncCaption(caption=caption._caption, client=self.__client) for caption in super().__iter__())
+
+    def get_lang(self, locale_id: str) -> AsyncCaption:
+        """
+        Obtém a legenda para o idioma especificado.
+
+        Args:
+            locale_id (str): ID do idioma,pode ser obtido no método -> 'languages'
+
+        Returns:
+            AsyncCaption: Objeto AsyncCaption.
+
+        Raises:
+            FileNotFoundError: Se o idioma não estiver disponível na aula.
+        """
+        caption = super().get_lang(locale_id=locale_id)
+        return AsyncCaption(caption=caption._caption, client=self.__client)
+
+
+class AsyncQuiz(Quiz):
+    """Representa um quiz cujo conteúdo é obtido de forma assíncrona."""
+
+    def __init__(self, quiz_data: dict, client: AsyncUdemy):
+        super().__init__(quiz_data=quiz_data)
+        self.__client = client
+
+    async def content(self) -> dict:
+        """Obtém o conteúdo do quiz (todas as páginas de perguntas, em 'results')."""
+        data = await self.__client._request(assessments_url(self.id))
+        results = list(data.get('results') or [])
+        next_page = data.get('next')
+        while next_page:
+            page = await self.__client._request(next_page)
+            results.extend(page.get('results') or [])
+            next_page = page.get('next')
+        return dict(data, results=results, next=None)
+
+
+class AsyncFiles:
+    """Resolve as URLs de download dos arquivos adicionais de forma assíncrona."""
+
+    def __init__(self, files: list[dict], id_course, client: AsyncUdemy):
+        """
+        Inicializa o objeto AsyncFiles.
+
+        Args:
+            files (list[dict]): Lista de dicionários contendo os dados dos arquivos.
+            id_course: ID do curso.
+            client (AsyncUdemy): Cliente usado nas requisições.
+        """
+        self.__data = files
+        self.__id_course = id_course
+        self.__client = client
+
+    async def __resolve(self, file: dict) -> dict:
+        lecture_id = file.get('lecture_id', None)
+        asset_id = file.get('asset_id', None)
+        title = file.get('title', None)
+        external_link = file.get('ExternalLink', None)
+        dt_file = {'title-file': title,
+                   'lecture_title': file.get('lecture_title', None),
+                   'lecture_id': lecture_id,
+                   'external_link': external_link,
+                   'data-file': None,
+                   'error': None}
+        try:
+            if external_link:
+                lnk = await self.__client._request(
+                    supplementary_asset_url(self.__id_course, lecture_id, asset_id, field='external_url'))
+                dt_file['data-file'] = lnk.get('external_url', None)
+            elif asset_id and title and lecture_id:
+                da = await self.__client._request(
+                    supplementary_asset_url(self.__id_course, lecture_id, asset_id, field='download_urls'))
+                dt_file['data-file'] = da['download_urls']
+            else:
+                raise UdemyUserApiExceptions("Arquivo sem ID da aula, ID do asset ou título!")
+        except Exception as e:
+            dt_file['error'] = e
+        return dt_file
+
+    async def get_download_url(self, lecture_ids: list = None) -> list[dict]:
+        """
+        Obtém as URLs de download (ou links externos) de todos os arquivos, simultaneamente.
+
+        Args:
+            lecture_ids (list): Se informado, resolve apenas os arquivos dessas aulas.
+
+        Returns:
+            list[dict]: Um dicionário por arquivo, na mesma ordem dos arquivos recebidos. Arquivos que falharam
+                trazem 'data-file' None e a exceção em 'error' em vez de interromper o lote.
+        """
+        files = self.__data
+        if lecture_ids is not None:
+            wanted = set(lecture_ids)
+            files = [f for f in files if f.get('lecture_id') in wanted]
+        return list(await asyncio.gather(*(self.__resolve(f) for f in files)))
+
+
+class AsyncLecture(Lecture):
+    """Aula (lecture) cujos dados adicionais são obtidos de forma assíncrona.
+
+    Os acessores de dados herdados de Lecture continuam síncronos; apenas os métodos que fazem
+    requisições (get_captions().get_lang(...).content, get_articles, get_resources, quiz_object) são awaitables.
+    """
+
+    def __init__(self, data: dict, course_id: int, additional_files, client: AsyncUdemy, fields=None):
+        super().__init__(data=data, course_id=course_id, additional_files=additional_files, fields=fields)
+        self.__client = client
+        self.__course_id = course_id
+        self.__data = data
+        self.__additional_files = additional_files
+
+    @property
+    def get_captions(self) -> AsyncCaptions:
+        """
+        Obtém as legendas.
+
+        Returns:
+            AsyncCaptions: Objeto para gerenciar as legendas.
+        """
+        self._require('captions')
+        captions = self.__data.get('asset', {}).get('captions', [])
+        if not captions:
+            raise FileNotFoundError('Não foi encontrada legendas nessa aula!')
+        return AsyncCaptions(caption_data=captions, client=self.__client)
+
+    async def get_articles(self):
+        """
+        Obtém os artigos relacionados à aula.
+
+        Returns:
+            O HTML do artigo ou uma lista vazia se a aula não tiver asset.
+        """
+        asset = self.__data.get('asset', {})
+        if not asset:
+            return []
+        body, infor = await asyncio.gather(
+            self.__client._request(article_url(self.__course_id, self.get_lecture_id, asset.get('id'))),
+            self.__client._request(lecture_infor_url(self.__course_id, self.get_lecture_id)),
+        )
+        return save_html(body.get('body'), title_lecture=infor.get('title'))
+
+    async def get_resources(self):
+        """
+        Obtém os recursos adicionais relacionados à aula.
+
+        Returns:
+            list: Os recursos adicionais relacionados à aula.
+
+        Raises:
+            FieldNotFetchedException: Se o curso foi obtido sem o grupo 'supplementary'.
+        """
+        if self.__additional_files is None:
+            raise FieldNotFetchedException("Os arquivos suplementares não foram pedidos no currículo! "
+                                           "Inclua 'supplementary' em fields ao obter o curso.")
+        if not self.__additional_files:
+            return []
+        files_add = get_files_aule(lecture_id_filter=self.get_lecture_id, data=self.__additional_files)
+        return await AsyncFiles(files=files_add, id_course=self.__course_id, client=self.__client).get_download_url()
+
+    async def quiz_object(self) -> AsyncQuiz:
+        """se for um quiz ele retorna um objeto AsyncQuiz"""
+        if self.get_asset_type.lower() != 'quiz':
+            raise UserWarning('Atenção essa aula não é um Quiz!')
+        data = await self.__client._request(quiz_url(self.__course_id, self.get_lecture_id))
+        return AsyncQuiz(data, client=self.__client)
+
+
+class AsyncCourse:
+    """Curso com métodos assíncronos, criado por AsyncUdemy.get_details_course."""
+
+    def __init__(self, client: AsyncUdemy, course_id: int, results: dict, additional_files: dict, information: dict):
+        """
+        Inicializa o objeto AsyncCourse.
+
+        Args:
+            client (AsyncUdemy): Cliente usado nas requisições.
+            course_id (int): O ID do curso.
+            results (dict): Itens do currículo do curso.
+            additional_files (dict): Currículo com os arquivos suplementares (None se não foram pedidos).
+            information (dict): Informações gerais do curso.
+        """
+        self.__client = client
+        self.__course_id = course_id
+        self.__data: list = parser_chapters(results=results, records=True)
+        self.__additional_files_data = additional_files
+        self.__information = information
+
+    @property
+    def title_course(self) -> str:
+        """Obtém o título do curso."""
+        return self.__information.get('title')
+
+    @property
+    def instructors(self) -> dict:
+        """Obtém informações dos instrutores."""
+        return self.__information.get("visible_instructors")
+
+    @property
+    def locale(self):
+        """Obtém informações de localidade do curso."""
+        return self.__information.get('locale')
+
+    @property
+    def primary_category(self):
+        """Obtém a categoria primária."""
+        return self.__information.get('primary_category')
+
+    @property
+    def primary_subcategory(self):
+        """Obtém a subcategoria primária."""
+        return self.__information.get('primary_subcategory')
+
+    @property
+    def count_lectures(self) -> int:
+        """Obtém o número total de lectures no curso."""
+        return sum(len(chapter.get('lectures', [])) for chapter in self.__data)
+
+    @property
+    def count_chapters(self) -> int:
+        """Obtém o número total de chapters (sections) no curso."""
+        return len(self.__data)
+
+    @property
+    def get_lectures(self) -> list:
+        """
+        Obtém uma lista de dicionários com todas as aulas.
+
+        Returns:
+            list: Uma lista contendo todas as aulas.
+        """
+        return [lecture.to_dict() for lecture in self.lecture_records]
+
+    @property
+    def lecture_records(self) -> list:
+        """
+        Obtém as aulas como registros compactos e imutáveis (ver Course.lecture_records).
+
+        Returns:
+            list[LectureRef]: Uma lista contendo todas as aulas.
+        """
+        return [lecture.in_section(chapter.title, chapter.chapter_index)
+                for chapter in self.__data for lecture in chapter.lectures]
+
+    @cached_property
+    def __assets(self):
+        return self.__load_assets()
+
+    @cached_property
+    def __files_index(self):
+        if self.__assets is None:
+            return None
+        index = {}
+        for file in self.__assets:
+            index.setdefault(file.get('lecture_id'), []).append(file)
+        return index
+
+    def __files_for(self, lecture_id):
+        if self.__files_index is None:
+            return None
+        return self.__files_index.get(lecture_id, [])
+
+    def __load_assets(self) -> list:
+        if self.__additional_files_data is None:
+            return None
+        supplementary_assets = []
+        for item in self.__additional_files_data.get('results', []):
+            if item.get('_class') == 'lecture':
+                for asset in item.get('supplementary_assets', []):
+                    supplementary_assets.append({
+                        'lecture_id': item.get('id'),
+                        'lecture_title': item.get('title'),
+                        'asset': asset
+                    })
+        return extract_files(supplementary_assets, records=True)
+
+    async def get_details_lecture(self, lecture_id: int, fields=None) -> AsyncLecture:
+        """
+        Obtém detalhes de uma aula específica.
+
+        Args:
+            lecture_id (int): O ID da aula.
+            fields: Grupos de campos a pedir (chaves de LECTURE_FIELD_GROUPS). None pede todos.
+
+        Returns:
+            AsyncLecture: Um objeto AsyncLecture contendo os detalhes da aula.
+
+        Raises:
+            FileNotFoundError: Se a aula não existir no curso.
+        """
+        types = self.__types
+        if lecture_id not in types:
+            raise FileNotFoundError('Essa aula não existe nesse curso!')
+        return await self.__fetch_lecture(lecture_id, types[lecture_id], fields)
+
+    @cached_property
+    def __types(self) -> dict:
+        types = {}
+        for lecture in self.lecture_records:
+            types.setdefault(lecture.get('lecture_id'), lecture.get('asset_type') or '')
+        return types
+
+    async def __fetch_lecture(self, lecture_id: int, type_lecture: str, fields=None) -> AsyncLecture:
+        if type_lecture.lower() == 'video' or type_lecture.lower() == 'article':
+            links = await self.__client._request(lecture_url(self.__course_id, lecture_id, fields=fields))
+        else:
+            fields = None
+            links = await self.__client._request(quiz_url(self.__course_id, lecture_id))
+        return AsyncLecture(data=links, course_id=self.__course_id, additional_files=self.__files_for(lecture_id),
+                            client=self.__client, fields=fields)
+
+    async def __run_batch_job(self, lecture_id: int, fields=None) -> LectureResult:
+        type_lecture = self.__types.get(lecture_id)
+        if type_lecture is None:
+            return LectureResult(lecture_id, error=FileNotFoundError('Essa aula não existe nesse curso!'))
+        try:
+            return LectureResult(lecture_id, lecture=await self.__fetch_lecture(lecture_id, type_lecture, fields))
+        except Exception as e:
+            return LectureResult(lecture_id, error=e)
+
+    async def get_details_lectures(self, lecture_ids: list = None, fields=None) -> list[LectureResult]:
+        """
+        Obtém os detalhes de várias aulas simultaneamente (limitado por max_concurrency do cliente).
+
+        Args:
+            lecture_ids (list): IDs das aulas. Se None, obtém todas as aulas do curso.
+            fields: Grupos de campos a pedir para cada aula (chaves de LECTURE_FIELD_GROUPS). None pede todos.
+
+        Returns:
+            list[LectureResult]: Um resultado por aula, na ordem do currículo (IDs repetidos uma única vez e
+                desconhecidos no final). Aulas que falharam trazem a exceção em LectureResult.error em vez de
+                interromper o lote, como em Course.get_details_lectures.
+        """
+        types = self.__types
+        if lecture_ids is None:
+            lecture_ids = list(types)
+        else:
+            order = {lecture_id: i for i, lecture_id in enumerate(types)}
+            lecture_ids = sorted(dict.fromkeys(lecture_ids), key=lambda x: order.get(x, len(order)))
+        fields = select_fields(fields, LECTURE_FIELD_GROUPS)
+        return list(await asyncio.gather(*(self.__run_batch_job(lecture_id, fields) for lecture_id in lecture_ids)))
+
+    async def get_additional_files(self, lecture_ids: list = None) -> list:
+        """
+        Retorna a lista de arquivos adicionais de um curso com suas URLs de download.
+
+        Args:
+            lecture_ids (list): Se informado, resolve apenas os arquivos dessas aulas.
+
+        Returns:
+            list: Uma lista contendo os arquivos adicionais de um curso.
+
+        Raises:
+            FieldNotFetchedException: Se o curso foi obtido sem o grupo 'supplementary'.
+        """
+        if self.__additional_files_data is None:
+            raise FieldNotFetchedException("Os arquivos suplementares não foram pedidos no currículo! "
+                                           "Inclua 'supplementary' em fields ao obter o curso.")
+        return await AsyncFiles(files=self.__assets, id_course=self.__course_id,
+                                client=self.__client).get_download_url(lecture_ids)
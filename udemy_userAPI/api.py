@@ -1,10 +1,14 @@
-import json
 import hashlib
 import hmac
 import math
 from datetime import datetime
-from .exeptions import UdemyUserApiExceptions, UnhandledExceptions, LoginException
+from typing import Iterable, Iterator
+from .exeptions import UdemyUserApiExceptions, UnhandledExceptions, LoginException, CircuitOpenException
 from .authenticate import UdemyAuth
+from .cache import memoized
+from .htmltext import html_to_text
+from .records import Chapter, LectureRef, SupplementaryFile
+from .session import get_session, decode_json
 import os.path
 from pywidevine.cdm import Cdm
 from pywidevine.device import Device
@@ -48,6 +52,119 @@ HEADERS_octet_stream = {
     'accept-language': 'en-US,en;q=0.9',
 }
 
+API_BASE = 'https://www.udemy.com/api-2.0'
+ASSESSMENTS_PAGE_SIZE = 1000  # perguntas por página de um quiz
+
+# Grupos de campos que podem ser pedidos a cada endpoint (projeção). O padrão (None) pede todos.
+LECTURE_FIELD_GROUPS = {
+    'media': ('length', 'media_license_token', 'course_is_drmed', 'media_sources'),
+    'captions': ('captions',),
+    'thumbnail': ('thumbnail_sprite',),
+    'slides': ('slides', 'slide_urls'),
+    'downloads': ('download_urls',),
+    'external': ('external_url',),
+}
+CURRICULUM_FIELD_GROUPS = {
+    'supplementary': ('supplementary_assets',),
+}
+
+
+def select_fields(fields, groups: dict) -> tuple:
+    """
+    Valida os grupos de campos pedidos por quem chama.
+
+    Args:
+        fields: Nomes dos grupos desejados (ex.: ('captions',)). None seleciona todos.
+        groups (dict): Grupos disponíveis no endpoint (LECTURE_FIELD_GROUPS ou CURRICULUM_FIELD_GROUPS).
+
+    Returns:
+        tuple: Os grupos selecionados, na ordem de 'groups'.
+
+    Raises:
+        UdemyUserApiExceptions: Se algum grupo não existir no endpoint.
+    """
+    if fields is None:
+        return tuple(groups)
+    if isinstance(fields, str):
+        fields = (fields,)
+    unknown = [field for field in fields if field not in groups]
+    if unknown:
+        raise UdemyUserApiExceptions(f"Grupo(s) de campos desconhecido(s): {', '.join(map(str, unknown))}. "
+                                     f"Disponíveis: {', '.join(groups)}")
+    return tuple(group for group in groups if group in fields)
+
+
+def curriculum_url(course_id: int, page_size: int = 1000, fields=None) -> str:
+    """Monta a URL dos itens do currículo (capítulos, aulas e quizzes) de um curso.
+
+    'fields' escolhe os grupos opcionais de CURRICULUM_FIELD_GROUPS (None pede todos)."""
+    selected = select_fields(fields, CURRICULUM_FIELD_GROUPS)
+    optional = {f for group in selected for f in CURRICULUM_FIELD_GROUPS[group]}
+    lecture_fields = ['title', 'object_index', 'is_published', 'sort_order', 'created', 'asset']
+    if 'supplementary_assets' in optional:
+        lecture_fields.append('supplementary_assets')
+    lecture_fields.append('is_free')
+    return (f'{API_BASE}/courses/{course_id}/subscriber-curriculum-items/?page_size={page_size}&'
+            f'fields[lecture]={",".join(lecture_fields)}&'
+            f'fields[quiz]=title,object_index,is_published,sort_order,type&'
+            f'fields[practice]=title,object_index,is_published,sort_order&'
+            f'fields[chapter]=title,object_index,is_published,sort_order&'
+            f'fields[asset]=title,filename,asset_type,status,time_estimation,is_external&'
+            f'caching_intent=True')
+
+
+def lecture_url(course_id: int, lecture_id: int, fields=None) -> str:
+    """Monta a URL de detalhes (mídias, legendas, downloads...) de uma aula.
+
+    'fields' escolhe os grupos de LECTURE_FIELD_GROUPS a pedir (None pede todos)."""
+    asset_fields = ['asset_type']
+    for group in select_fields(fields, LECTURE_FIELD_GROUPS):
+        asset_fields.extend(LECTURE_FIELD_GROUPS[group])
+    return (f"{API_BASE}/users/me/subscribed-courses/{course_id}/lectures/{lecture_id}/?"
+            f"fields[lecture]"
+            f"=asset,description,download_url,is_free,last_watched_second&fields[asset]={','.join(asset_fields)}"
+            f"&q=0.3108014137011559/?fields[asset]=download_urls")
+
+
+def lecture_infor_url(course_id: int, lecture_id: int) -> str:
+    """Monta a URL de informações básicas de uma aula."""
+    return (f"{API_BASE}/users/me/subscribed-courses/{course_id}/lectures/{lecture_id}/?"
+            f"fields[asset]=media_license_token")
+
+
+def quiz_url(course_id: int, quiz_id: int) -> str:
+    """Monta a URL dos metadados de um quiz."""
+    return (f'{API_BASE}/users/me/subscribed-courses/{course_id}/quizzes/{quiz_id}/?draft='
+            f'false&fields[quiz]=id,type,title,description,object_index,num_assessments,version,duration,'
+            f'is_draft,pass_percent,changelog')
+
+
+def assessments_url(quiz_id: int, page_size: int = ASSESSMENTS_PAGE_SIZE) -> str:
+    """Monta a URL da primeira página das perguntas (assessments) de um quiz."""
+    return (f'{API_BASE}/quizzes/{quiz_id}/assessments/?version=1&page_size={page_size}&fields[assessment]'
+            f'=id,assessment_type,prompt,correct_response,section,question_plain,related_lectures&'
+            f'use_remote_version=true')
+
+
+def supplementary_asset_url(course_id: int, lecture_id: int, asset_id: int, field: str = 'download_urls') -> str:
+    """Monta a URL de um arquivo suplementar ('download_urls' ou 'external_url')."""
+    return (f'{API_BASE}/users/me/subscribed-courses/{course_id}/lectures/{lecture_id}/'
+            f'supplementary-assets/{asset_id}/?fields[asset]={field}')
+
+
+def article_url(course_id: int, lecture_id: int, asset_id: int) -> str:
+    """Monta a URL do corpo (HTML) de um asset do tipo artigo."""
+    return (f'{API_BASE}/assets/{asset_id}/?fields[asset]=@min,status,delayed_asset_message,'
+            f'processing_errors,body&course_id={course_id}&lecture_id={lecture_id}')
+
+
+def course_infor_url(course_id: int) -> str:
+    """Monta a URL das informações gerais de um curso."""
+    return (f'{API_BASE}/courses/{course_id}/?fields[course]=title,context_info,primary_category,'
+            'primary_subcategory,avg_rating_recent,visible_instructors,locale,estimated_content_length,'
+            'num_subscribers')
+
+
 locate = os.path.dirname(__file__)
 WVD_FILE_PATH = os.path.join(locate, 'mpd_analyzer', 'bin.wvd')
 device = Device.load(WVD_FILE_PATH)
@@ -67,7 +184,7 @@ def get_pssh(init_url):
     auth = UdemyAuth()
     if not auth.verif_login():
         raise LoginException("Sessão expirada!")
-    res = requests.get(init_url, headers=HEADERS_octet_stream)
+    res = get_session().get(init_url, headers=HEADERS_octet_stream)
     if not res.ok:
         return
     pssh = read_pssh_from_bytes(res.content)
@@ -140,7 +257,7 @@ def extract(pssh, license_token):
                    f"&auth_token={license_token}")
     session_id = cdm.open()
     challenge = cdm.get_license_challenge(session_id, PSSH(pssh))
-    license_file = requests.post(license_url, headers=HEADERS_octet_stream, data=challenge)
+    license_file = get_session().post(license_url, headers=HEADERS_octet_stream, data=challenge)
     try:
         str(license_file.content, "utf-8")
     except Exception as e:
@@ -167,7 +284,7 @@ def get_mpd_file(mpd_url):
         raise LoginException("Sessão expirada!")
     try:
         # Faz a solicitação GET com os cabeçalhos
-        response = requests.get(mpd_url, headers=HEADERS_USER)
+        response = get_session().get(mpd_url, headers=HEADERS_USER)
         # Exibe o código de status
         if response.status_code == 200:
             return response.text
@@ -181,11 +298,102 @@ def get_mpd_file(mpd_url):
         raise UdemyUserApiExceptions(f"Limite de redirecionamentos excedido: {e}")
     except requests.HTTPError as e:
         raise UdemyUserApiExceptions(f"Erro HTTP: {e}")
+    except CircuitOpenException:
+        raise
     except Exception as e:
         raise UnhandledExceptions(f"Errro Ao Obter Mídias:{e}")
 
 
-def parser_chapters(results) -> list[dict]:
+DEFAULT_CHAPTER_TITLE = "CourseFiles"  # nome do grupo quando o curso não tem capítulos
+
+
+def _chapter_header(dictionary: dict = None) -> tuple:
+    """Retorna (título, índice) de um item 'chapter'; sem item, do capítulo padrão."""
+    if dictionary is None:
+        return DEFAULT_CHAPTER_TITLE, None
+    return dictionary.get('title', 'Sem Título'), dictionary.get('object_index', None)
+
+
+def _curriculum_entry(dictionary: dict):
+    """Converte um item 'lecture' ou 'quiz' do currículo no LectureRef usado pelos capítulos (ou None)."""
+    _class = dictionary.get('_class')
+    if _class == 'lecture':
+        asset = dictionary.get('asset')
+        if asset:
+            return LectureRef(
+                asset_type=asset.get('asset_type', ''),
+                title=dictionary.get('title', 'Aula'),
+                lecture_id=dictionary.get('id', ''),
+                asset_id=asset.get('id', '')
+            )
+    elif _class == 'quiz':
+        return LectureRef(
+            asset_type='quiz',
+            title=dictionary.get('title', 'Quiz'),
+            lecture_id=dictionary.get('id', ''),
+            type=dictionary.get('type', ''),
+            asset_id=''
+        )
+    return None
+
+
+def iter_curriculum_items(items: Iterable[dict]) -> Iterator[LectureRef]:
+    """
+    Percorre os itens do currículo entregando cada aula/quiz assim que aparece.
+
+    Os itens podem vir de um gerador (ex.: páginas chegando da API); nada é acumulado.
+
+    Args:
+        items (Iterable[dict]): Itens crus do currículo ('results'), na ordem do servidor.
+
+    Yields:
+        LectureRef: Cada aula no formato de Course.get_lectures (com 'section' e 'section_order').
+    """
+    header = None  # (título, índice) do capítulo atual
+    for dictionary in items:
+        _class = dictionary.get('_class')
+        if _class == 'chapter':
+            header = _chapter_header(dictionary)
+        elif _class in ('lecture', 'quiz'):
+            # Se não houver um capítulo atual, usa o capítulo padrão
+            if header is None:
+                header = _chapter_header()
+            entry = _curriculum_entry(dictionary)
+            if entry is not None:
+                yield entry.in_section(*header)
+
+
+def iter_chapters(items: Iterable[dict]) -> Iterator[Chapter]:
+    """
+    Versão incremental de parser_chapters: entrega cada capítulo completo assim que o seguinte começa.
+
+    Args:
+        items (Iterable[dict]): Itens crus do currículo ('results'), na ordem do servidor.
+
+    Yields:
+        Chapter: Capítulos no mesmo formato de parser_chapters.
+    """
+    header = None  # (título, índice) do capítulo atual
+    lectures = []  # aulas e quizzes do capítulo atual
+    for dictionary in items:
+        _class = dictionary.get('_class')
+        if _class == 'chapter':
+            # Se já há um capítulo em andamento, entrega-o
+            if header is not None:
+                yield Chapter(title=header[0], chapter_index=header[1], lectures=tuple(lectures))
+            header, lectures = _chapter_header(dictionary), []
+        elif _class in ('lecture', 'quiz'):
+            if header is None:
+                header = _chapter_header()
+            entry = _curriculum_entry(dictionary)
+            if entry is not None:
+                lectures.append(entry)
+    # Se houver um capítulo em andamento, entrega-o
+    if header is not None:
+        yield Chapter(title=header[0], chapter_index=header[1], lectures=tuple(lectures))
+
+
+def parser_chapters(results, records: bool = False) -> list[dict] | list[Chapter]:
     """
     Processa os dados do curso e retorna uma lista de capítulos com suas aulas e quizzes.
 
@@ -194,117 +402,49 @@ def parser_chapters(results) -> list[dict]:
 
     Args:
         results (dict): Dicionário com os resultados do curso, normalmente contendo a chave 'results'.
+        records (bool): Se True, retorna registros compactos e imutáveis (Chapter com a tupla de LectureRef)
+            em vez de dicionários, o que reduz a memória de currículos grandes.
 
     Returns:
-        list[dict]: Lista de capítulos, cada um com título, índice (se disponível) e lista de lectures/quizzes.
+        list[dict] | list[Chapter]: Lista de capítulos, cada um com título, índice (se disponível) e lista de
+            lectures/quizzes.
 
     Raises:
         UdemyUserApiExceptions: Se não for possível obter os detalhes do curso.
     """
     if not results:
         raise UdemyUserApiExceptions("Não foi possível obter detalhes do curso!")
-
-    items = results.get('results', [])
-    chapters_dicts = []  # Lista de capítulos
-    current_chapter = None  # Capítulo atual
-
-    # Nome padrão para o grupo quando não houver capítulos
-    default_chapter_title = "CourseFiles"
-
-    for dictionary in items:
-        _class = dictionary.get('_class')
-        chapter_index = dictionary.get('object_index', None)
-
-        if _class == 'chapter':
-            # Se já há um capítulo em andamento, adiciona-o à lista
-            if current_chapter:
-                chapters_dicts.append(current_chapter)
-            # Inicia um novo capítulo
-            current_chapter = {
-                'title': dictionary.get('title', 'Sem Título'),
-                'chapter_index': chapter_index,
-                'lectures': []  # Lista para armazenar aulas e quizzes
-            }
-        elif _class in ('lecture', 'quiz'):
-            # Se não houver um capítulo atual, cria um capítulo padrão
-            if current_chapter is None:
-                current_chapter = {
-                    'title': default_chapter_title,
-                    'chapter_index': None,
-                    'lectures': []
-                }
-            # Processa a aula ou quiz
-            if _class == 'lecture':
-                asset = dictionary.get('asset')
-                if asset:
-                    lecture_data = {
-                        'asset_type': asset.get('asset_type', ''),
-                        'title': dictionary.get('title', 'Aula'),
-                        'lecture_id': dictionary.get('id', ''),
-                        'asset_id': asset.get('id', '')
-                    }
-                    current_chapter['lectures'].append(lecture_data)
-            elif _class == 'quiz':
-                quiz_data = {
-                    'asset_type': 'quiz',
-                    'title': dictionary.get('title', 'Quiz'),
-                    'lecture_id': dictionary.get('id', ''),
-                    'type': dictionary.get('type', ''),
-                    'asset_id': ''
-                }
-                current_chapter['lectures'].append(quiz_data)
-
-    # Se houver um capítulo em andamento, adiciona-o à lista
-    if current_chapter:
-        chapters_dicts.append(current_chapter)
-
-    return chapters_dicts
+    chapters = iter_chapters(results.get('results', []))
+    if records:
+        return list(chapters)
+    return [chapter.to_dict() for chapter in chapters]
 
 
+@memoized(ttl=3600)
 def get_add_files(course_id: int):
     """
     Obtém arquivos adicionais de um curso.
 
+    Usa o mesmo download paginado do currículo de sections.get_details_courses (que já traz os
+    'supplementary_assets' de cada aula).
+
     Args:
         course_id (int): ID do curso.
 
     Returns:
-        dict: Um dicionário contendo os arquivos adicionais do curso.
+        dict: O currículo completo do curso, com os arquivos adicionais de cada aula.
 
-    Raises: LoginException: Se a sessão estiver expirada. UdemyUserApiExceptions: Se houver erro de conexão,
-    tempo de requisição excedido, limite de redirecionamentos excedido ou erro HTTP. UnhandledExceptions: Se houver
-    erro ao obter dados das aulas.
+    Raises: LoginException: Se a sessão estiver expirada. UnhandledExceptions: Se houver erro ao obter o
+    currículo (conexão, tempo de requisição excedido, erro HTTP...).
     """
-    from .authenticate import UdemyAuth
-    auth = UdemyAuth()
-    if not auth.verif_login():
-        raise LoginException("Sessão expirada!")
-    url = (f'https://www.udemy.com/api-2.0/courses/{course_id}/subscriber-curriculum-items/?page_size=2000&fields['
-           f'lecture]=title,object_index,is_published,sort_order,created,asset,supplementary_assets,is_free&fields['
-           f'quiz]=title,object_index,is_published,sort_order,type&fields[practice]=title,object_index,is_published,'
-           f'sort_order&fields[chapter]=title,object_index,is_published,sort_order&fields[asset]=title,filename,'
-           f'asset_type,status,time_estimation,is_external&caching_intent=True')
+    from .sections import get_details_courses
     try:
-        # Faz a solicitação GET com os cabeçalhos
-        response = requests.get(url, headers=HEADERS_USER)
-        data = []
-        # Exibe o código de status
-        if response.status_code == 200:
-            a = json.loads(response.text)
-            return a
-        else:
-            raise UnhandledExceptions(f"Erro ao obter dados de aulas! Código de status: {response.status_code}")
-
-    except requests.ConnectionError as e:
-        raise UdemyUserApiExceptions(f"Erro de conexão: {e}")
-    except requests.Timeout as e:
-        raise UdemyUserApiExceptions(f"Tempo de requisição excedido: {e}")
-    except requests.TooManyRedirects as e:
-        raise UdemyUserApiExceptions(f"Limite de redirecionamentos excedido: {e}")
-    except requests.HTTPError as e:
-        raise UdemyUserApiExceptions(f"Erro HTTP: {e}")
-    except Exception as e:
-        raise UnhandledExceptions(f"Erro ao obter mídias: {e}")
+        # fields=None pede todos os grupos, inclusive 'supplementary'
+        return get_details_courses(course_id)
+    except (LoginException, CircuitOpenException):
+        raise
+    except UdemyUserApiExceptions as e:
+        raise UnhandledExceptions(f"Erro ao obter dados de aulas! {e}")
 
 
 def get_files_aule(lecture_id_filter, data: list):
@@ -326,13 +466,15 @@ def get_files_aule(lecture_id_filter, data: list):
     return files
 
 
-def get_links(course_id: int, id_lecture: int):
+@memoized()
+def get_links(course_id: int, id_lecture: int, fields=None):
     """
     Obtém links e informações de uma aula específica.
 
     Args:
         course_id (int): ID do curso.
         id_lecture (int): ID da aula.
+        fields: Grupos de campos a pedir (chaves de LECTURE_FIELD_GROUPS). None pede todos.
 
     Returns:
         dict: Um dicionário contendo links e informações da aula.
@@ -341,23 +483,18 @@ def get_links(course_id: int, id_lecture: int):
     tempo de requisição excedido, limite de redirecionamentos excedido ou erro HTTP. UnhandledExceptions: Se houver
     erro ao obter dados das aulas.
     """
-    get = (f"https://www.udemy.com/api-2.0/users/me/subscribed-courses/{course_id}/lectures/{id_lecture}/?"
-               f"fields[lecture]"
-               f"=asset,description,download_url,is_free,last_watched_second&fields[asset]=asset_type,length,"
-               f"media_license_token,course_is_drmed,media_sources,captions,thumbnail_sprite,slides,slide_urls,"
-               f"download_urls,"
-               f"external_url&q=0.3108014137011559/?fields[asset]=download_urls")
+    get = lecture_url(course_id, id_lecture, fields=fields)
     from .authenticate import UdemyAuth
     auth = UdemyAuth()
     if not auth.verif_login():
         raise LoginException("Sessão expirada!")
     try:
         # Faz a solicitação GET com os cabeçalhos
-        response = requests.get(get, headers=HEADERS_USER)
+        response = get_session().get(get, headers=HEADERS_USER)
         data = []
         # Exibe o código de status
         if response.status_code == 200:
-            a = json.loads(response.text)
+            a = decode_json(response.content)
             return a
         else:
             raise UnhandledExceptions(
@@ -375,25 +512,25 @@ def get_links(course_id: int, id_lecture: int):
     except requests.HTTPError as e:
         raise UdemyUserApiExceptions(
             f"Erro HTTP: {e}")
+    except CircuitOpenException:
+        raise
     except Exception as e:
         raise UnhandledExceptions(
             f"Erro ao obter mídias: {e}")
 
 def get_assessments(course_id: int,lecture_id:int):
-    get = (f'https://www.udemy.com/api-2.0/users/me/subscribed-courses/{course_id}/quizzes/{lecture_id}/?draft='
-           f'false&fields[quiz]=id,type,title,description,object_index,num_assessments,version,duration,'
-           f'is_draft,pass_percent,changelog')
+    get = quiz_url(course_id, lecture_id)
     from .authenticate import UdemyAuth
     auth = UdemyAuth()
     if not auth.verif_login():
         raise LoginException("Sessão expirada!")
     try:
         # Faz a solicitação GET com os cabeçalhos
-        response = requests.get(get, headers=HEADERS_USER)
+        response = get_session().get(get, headers=HEADERS_USER)
         data = []
         # Exibe o código de status
         if response.status_code == 200:
-            a = json.loads(response.text)
+            a = decode_json(response.content)
             return a
         else:
             raise ConnectionError(
@@ -415,25 +552,55 @@ def get_assessments(course_id: int,lecture_id:int):
             f"Erro HTTP: {e}")
 
 
-def get_quizzes(lecture_id:int):
-    get = (f'https://www.udemy.com/api-2.0/quizzes/{lecture_id}/assessments/?version=1&page_size=1000&fields[assessment]'
-           f'=id,assessment_type,prompt,correct_response,section,question_plain,related_lectures&use_remote_version=true'
-           )
+def iter_assessment_pages(quiz_id: int, page_size: int = ASSESSMENTS_PAGE_SIZE) -> Iterator[dict]:
+    """
+    Entrega as páginas de perguntas de um quiz, seguindo o link 'next' até a última.
+
+    Args:
+        quiz_id (int): ID do quiz.
+        page_size (int): Perguntas por página.
+
+    Yields:
+        dict: Cada página decodificada (com 'count', 'next' e 'results').
+
+    Raises:
+        UnhandledExceptions: Se alguma página não puder ser obtida.
+    """
+    url = assessments_url(quiz_id, page_size=page_size)
+    while url:
+        response = get_session().get(url, headers=HEADERS_USER)
+        if response.status_code != 200:
+            raise UnhandledExceptions(
+                f"Erro ao obter dados da aula! Código de status: {response.status_code}")
+        page = decode_json(response.content)
+        url = page.get('next')
+        yield page
+
+
+def get_quizzes(lecture_id:int, page_size: int = ASSESSMENTS_PAGE_SIZE):
+    """
+    Obtém todas as perguntas de um quiz, juntando todas as páginas.
+
+    Args:
+        lecture_id (int): ID do quiz.
+        page_size (int): Perguntas por página.
+
+    Returns:
+        dict: A primeira página com 'results' contendo as perguntas de todas as páginas (e 'next' None).
+    """
     from .authenticate import UdemyAuth
     auth = UdemyAuth()
     if not auth.verif_login():
         raise LoginException("Sessão expirada!")
     try:
-        # Faz a solicitação GET com os cabeçalhos
-        response = requests.get(get, headers=HEADERS_USER)
-        data = []
-        # Exibe o código de status
-        if response.status_code == 200:
-            a = json.loads(response.text)
-            return a
-        else:
-            raise UnhandledExceptions(
-                f"Erro ao obter dados da aula! Código de status: {response.status_code}")
+        pages = iter_assessment_pages(lecture_id, page_size=page_size)
+        data = next(pages)
+        results = data.get('results') or []
+        for page in pages:
+            results.extend(page.get('results') or [])
+        data['results'] = results
+        data['next'] = None
+        return data
 
     except requests.ConnectionError as e:
         raise UdemyUserApiExceptions(
@@ -447,14 +614,16 @@ def get_quizzes(lecture_id:int):
     except requests.HTTPError as e:
         raise UdemyUserApiExceptions(
             f"Erro HTTP: {e}")
+    except (CircuitOpenException, UnhandledExceptions):
+        raise
     except Exception as e:
         raise UnhandledExceptions(
             f"Erro ao obter mídias: {e}")
 
 
 def remove_tag(d: str):
-    new = d.replace("<p>", '').replace("</p>", '').replace('&nbsp;', ' ')
-    return new
+    """Converte o HTML de descrições e enunciados em texto puro (ver html_to_text)."""
+    return html_to_text(d)
 
 
 def get_external_liks(course_id: int, id_lecture, asset_id):
@@ -477,15 +646,14 @@ def get_external_liks(course_id: int, id_lecture, asset_id):
     auth = UdemyAuth()
     if not auth.verif_login():
         raise LoginException("Sessão expirada!")
-    url = (f'https://www.udemy.com/api-2.0/users/me/subscribed-courses/{course_id}/lectures/{id_lecture}/'
-           f'supplementary-assets/{asset_id}/?fields[asset]=external_url')
+    url = supplementary_asset_url(course_id, id_lecture, asset_id, field='external_url')
     try:
         # Faz a solicitação GET com os cabeçalhos
-        response = requests.get(url, headers=HEADERS_USER)
+        response = get_session().get(url, headers=HEADERS_USER)
         data = []
         # Exibe o código de status
         if response.status_code == 200:
-            a = json.loads(response.text)
+            a = decode_json(response.content)
             return a
         else:
             raise UnhandledExceptions(f"Erro ao obter dados de aulas! Código de status: {response.status_code}")
@@ -498,19 +666,23 @@ def get_external_liks(course_id: int, id_lecture, asset_id):
         raise UdemyUserApiExceptions(f"Limite de redirecionamentos excedido: {e}")
     except requests.HTTPError as e:
         raise UdemyUserApiExceptions(f"Erro HTTP: {e}")
+    except CircuitOpenException:
+        raise
     except Exception as e:
         raise UnhandledExceptions(f"Erro ao obter mídias: {e}")
 
 
-def extract_files(supplementary_assets: list) -> list:
+def extract_files(supplementary_assets: list, records: bool = False) -> list:
     """
     Obtém o ID da lecture, o ID do asset, o asset_type e o filename.
 
     Args:
         supplementary_assets (list): Lista de assets suplementares.
+        records (bool): Se True, retorna registros compactos e imutáveis (SupplementaryFile) em vez de
+            dicionários.
 
     Returns:
-        list: Lista de dicionários contendo informações dos assets.
+        list: Lista de dicionários (ou de SupplementaryFile) contendo informações dos assets.
     """
     files = []
     for item in supplementary_assets:
@@ -522,15 +694,16 @@ def extract_files(supplementary_assets: list) -> list:
         filename = asset.get('filename')
         title = asset.get('title')
         external_url = asset.get('is_external', None)
-        files.append({
-            'lecture_id': lecture_id,
-            'asset_id': asset_id,
-            'asset_type': asset_type,
-            'filename': filename,
-            'title': title,
-            'lecture_title': lecture_title,
-            'ExternalLink': external_url
-        })
+        file = SupplementaryFile(
+            lecture_id=lecture_id,
+            asset_id=asset_id,
+            asset_type=asset_type,
+            filename=filename,
+            title=title,
+            lecture_title=lecture_title,
+            external_link=external_url
+        )
+        files.append(file if records else file.to_dict())
     return files
 
 
@@ -659,6 +832,7 @@ def format_size(byte_size):
         return byte_size
 
 
+@memoized()
 def lecture_infor(course_id: int, id_lecture: int):
     """
     Obtém informações de uma aula específica.
@@ -678,11 +852,10 @@ def lecture_infor(course_id: int, id_lecture: int):
     auth = UdemyAuth()
     if not auth.verif_login():
         raise LoginException("Sessão expirada!")
-    edpoint = (f"https://www.udemy.com/api-2.0/users/me/subscribed-courses/{course_id}/lectures/{id_lecture}/?"
-               f"fields[asset]=media_license_token")
-    r = requests.get(edpoint, headers=HEADERS_USER)
+    edpoint = lecture_infor_url(course_id, id_lecture)
+    r = get_session().get(edpoint, headers=HEADERS_USER)
     if r.status_code == 200:
-        return json.loads(r.text)
+        return decode_json(r.content)
     else:
         raise ConnectionError(f"Erro ao obter informações da aula:{r.status_code}"
                               f"\n\n"
@@ -709,11 +882,10 @@ def assets_infor(course_id: int, id_lecture: int, assets_id: int):
     auth = UdemyAuth()
     if not auth.verif_login():
         raise LoginException("Sessão expirada!")
-    endpoint = (f'https://www.udemy.com/api-2.0/assets/{assets_id}/?fields[asset]=@min,status,delayed_asset_message,'
-                f'processing_errors,body&course_id={course_id}&lecture_id={id_lecture}')
-    r = requests.get(endpoint, headers=HEADERS_USER)
+    endpoint = article_url(course_id, id_lecture, assets_id)
+    r = get_session().get(endpoint, headers=HEADERS_USER)
     if r.status_code == 200:
-        dt = json.loads(r.text)
+        dt = decode_json(r.content)
         body = dt.get("body")
         title = lecture_infor(course_id=course_id, id_lecture=id_lecture).get("title")
         return save_html(body, title_lecture=title)
@@ -2,6 +2,8 @@ import http
 import json
 import os
 import pickle
+import threading
+import time
 import traceback
 from http.cookies import SimpleCookie
 
@@ -9,8 +11,84 @@ import cloudscraper
 import requests
 
 from .exeptions import UnhandledExceptions, UdemyUserApiExceptions, LoginException, Upstreamconnecterror
+from .session import get_session, decode_json
+from .singleflight import SingleFlight
 
 DEBUG = False
+LOGIN_CACHE_TTL = 300.0  # segundos em que uma verificação de login continua válida
+
+
+class _LoginCache:
+    """Cache da verificação de login compartilhado por todas as instâncias de UdemyAuth."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._key = None
+        self._value = None
+        self._expires = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self._lock:
+            if self._key is not None and self._key == key and time.monotonic() < self._expires:
+                self.hits += 1
+                return self._value
+            self.misses += 1
+            return None
+
+    def set(self, key, value: bool):
+        with self._lock:
+            if self.ttl <= 0:
+                return
+            self._key = key
+            self._value = value
+            self._expires = time.monotonic() + self.ttl
+
+    def invalidate(self):
+        with self._lock:
+            if self._key is not None:
+                self.invalidations += 1
+            self._key = None
+            self._value = None
+            self._expires = 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'invalidations': self.invalidations,
+                    'ttl': self.ttl, 'cached': self._key is not None and time.monotonic() < self._expires}
+
+
+_login_cache = _LoginCache(LOGIN_CACHE_TTL)
+login_flights = SingleFlight()
+
+
+def set_login_cache_ttl(ttl: float):
+    """
+    Define por quanto tempo (em segundos) o resultado de verif_login é reaproveitado.
+
+    Args:
+        ttl (float): Tempo de validade do cache. Use 0 para desativar o cache.
+    """
+    _login_cache.ttl = float(ttl)
+    _login_cache.invalidate()
+
+
+def invalidate_login_cache():
+    """Descarta a verificação de login em cache, forçando uma nova consulta na próxima chamada."""
+    _login_cache.invalidate()
+
+
+def login_cache_stats() -> dict:
+    """
+    Retorna as estatísticas do cache de verificação de login.
+
+    Returns:
+        dict: 'hits', 'misses', 'invalidations', 'ttl' e 'cached' (se há um resultado válido em cache).
+    """
+    return _login_cache.stats()
 
 
 def convert_cook(cookie_string):
@@ -64,9 +142,48 @@ class UdemyAuth:
         """
         Verifica se o usuário está logado.
 
+        O resultado é reaproveitado por LOGIN_CACHE_TTL segundos (ver set_login_cache_ttl) enquanto o arquivo
+        de cookies não mudar. O cache é descartado quando qualquer endpoint responde 401/403.
+
         Returns:
             bool: True se o usuário estiver logado, False caso contrário.
         """
+        cache_key = self.__login_cache_key()
+        if cache_key is None:
+            return False
+        cached = _login_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        def check():
+            value = self.__verif_login_remote()
+            _login_cache.set(cache_key, value)
+            return value
+
+        result, _ = login_flights.do(cache_key, check)
+        return result
+
+    def cached_login(self):
+        """
+        Retorna a verificação de login em cache, sem consultar a Udemy.
+
+        Returns:
+            bool | None: O resultado de verif_login ainda válido, ou None se for preciso chamar verif_login.
+        """
+        cache_key = self.__login_cache_key()
+        if cache_key is None:
+            return None
+        return _login_cache.get(cache_key)
+
+    def __login_cache_key(self):
+        # o cache vale enquanto o arquivo de cookies não mudar
+        try:
+            st = os.stat(self.__file_path)
+        except OSError:
+            return None
+        return self.__file_path, st.st_mtime_ns, st.st_size
+
+    def __verif_login_remote(self) -> bool:
 
         def verif_config():
             """
@@ -109,9 +226,9 @@ class UdemyAuth:
 
             try:
                 url = 'https://www.udemy.com/api-2.0/contexts/me/?header=true'
-                resp = requests.get(url=url, headers=headers)
+                resp = get_session().get(url=url, headers=headers)
                 if resp.status_code == 200:
-                    convert = json.loads(resp.text)
+                    convert = decode_json(resp.content)
                     isLoggedIn = convert.get('header', {}).get('isLoggedIn', False)
                     if isLoggedIn:
                         if isLoggedIn is True:
@@ -197,7 +314,7 @@ class UdemyAuth:
             if "returnUrl" in r.text:
                 self.__save_cookies(s.cookies)
             else:
-                login_error = r.json().get("error", {}).get("data", {}).get("formErrors", [])[0]
+                login_error = decode_json(r.content).get("error", {}).get("data", {}).get("formErrors", [])[0]
                 if login_error[0] == "Y":
                     raise LoginException("Você excedeu o número máximo de solicitações por hora.")
                 elif login_error[0] == "T":
@@ -273,10 +390,10 @@ class UdemyAuth:
         url = 'https://www.udemy.com/api-2.0/contexts/me/?header=true'
 
         try:
-            resp = requests.get(url=url, headers=headers)
+            resp = get_session().get(url=url, headers=headers)
             resp.raise_for_status() # Lança um HTTPError para respostas de status de erro (4xx ou 5xx)
 
-            convert = resp.json() # Usa resp.json() para parsear diretamente o JSON
+            convert = decode_json(resp.content)
             is_logged_in = convert.get('header', {}).get('isLoggedIn', None)
 
             if not is_logged_in:
@@ -302,6 +419,8 @@ class UdemyAuth:
                 pickle.dump(cookies, f)
         except Exception as e:
             raise LoginException(e)
+        finally:
+            invalidate_login_cache()
 
     def load_cookies(self) -> str:
         """Carrega cookies e retorna-os em uma string formatada"""
@@ -327,6 +446,7 @@ class UdemyAuth:
         if os.path.exists(self.__file_path):
             with open(self.__file_path, 'wb') as f:
                 f.write(b'')
+        invalidate_login_cache()
 
     def login_passwordless(self, email: str, locale: str = 'pt-BR', otp_callback=None):
         """
@@ -379,7 +499,7 @@ class UdemyAuth:
             response = session.post(login_url, data=data, allow_redirects=False)
 
             if 'error_message' in response.text:
-                erro_data: dict = response.json()
+                erro_data: dict = decode_json(response.content)
                 error_message = erro_data.get('error_message', {})
                 raise LoginException(error_message)
 
@@ -410,7 +530,7 @@ class UdemyAuth:
                     break  # Sai do loop se o login for bem-sucedido
                 else:
                     if 'error_message' in response.text:
-                        erro_data: dict = response.json()
+                        erro_data: dict = decode_json(response.content)
                         error_message = erro_data.get('error_message', {})
                         error_code = erro_data.get('error_code', {})
 
@@ -1,8 +1,22 @@
-from typing import Any
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
+from typing import Any, Iterator
 from .api import *
-from .exeptions import LoginException
+from .exeptions import LoginException, FieldNotFetchedException, UdemyUserApiExceptions, UnhandledExceptions
 from .mpd_analyzer import MPDParser
+from .records import Assessment, LectureRef, QuizRecord
 from .sections import get_course_infor
+from .search import CaptionIndex, get_caption_index
+from .session import get_session, decode_json
+from .vtt import CueTable, iter_cues, iter_lines
+
+MAX_WORKERS = 8  # threads usadas nas buscas em lote
+CAPTION_CHUNK_SIZE = 64 * 1024  # bytes gravados por vez ao baixar legendas
+CAPTIONS_MANIFEST = '.captions.json'  # validadores das legendas já baixadas em um diretório
 
 
 class DRM:
@@ -62,47 +76,73 @@ class Files:
         self.__id_course = id_course
 
     @property
-    def get_download_url(self) -> dict[str, Any | None] | list[dict[str, Any | None]]:
+    def get_download_url(self) -> list[dict[str, Any | None]]:
         """
-        Obtém a URL de download de um arquivo quando disponível.
+        Obtém a URL de download (ou o link externo) de todos os arquivos quando disponível.
 
         Returns:
-            dict[str, Any | None] | list[dict[str, Any | None]]: URL de download do arquivo.
+            list[dict[str, Any | None]]: Um dicionário por arquivo, na ordem dos arquivos recebidos (ver resolve).
+        """
+        return self.resolve()
+
+    def resolve(self, lecture_ids: list = None, max_workers: int = MAX_WORKERS) -> list[dict[str, Any | None]]:
+        """
+        Obtém as URLs de download e os links externos dos arquivos em paralelo.
+
+        Args:
+            lecture_ids (list): Se informado, resolve apenas os arquivos dessas aulas.
+            max_workers (int): Número máximo de requisições simultâneas.
+
+        Returns:
+            list[dict[str, Any | None]]: Um dicionário por arquivo, na ordem dos arquivos recebidos. Arquivos cuja
+                URL não pôde ser obtida trazem 'data-file' None e a exceção em 'error' (None nos demais), em vez
+                de interromper o lote.
+
+        Raises:
+            LoginException: Se a sessão estiver expirada.
         """
         from .authenticate import UdemyAuth
         auth = UdemyAuth()
         if not auth.verif_login():
             raise LoginException("Sessão expirada!")
-        download_urls = []
-        for files in self.__data:
-            lecture_id = files.get('lecture_id', None)
-            asset_id = files.get('asset_id', None)
-            title = files.get("title", None)
-            lecture_title = files.get('lecture_title', None)
-            external_link = files.get('ExternalLink', None)
+        files = self.__data
+        if lecture_ids is not None:
+            wanted = set(lecture_ids)
+            files = [file for file in files if file.get('lecture_id') in wanted]
+        if not files:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(files)))) as executor:
+            return list(executor.map(self.__resolve, files))
+
+    def __resolve(self, files: dict) -> dict:
+        lecture_id = files.get('lecture_id', None)
+        asset_id = files.get('asset_id', None)
+        title = files.get("title", None)
+        external_link = files.get('ExternalLink', None)
+        dt_file = {'title-file': title,
+                   'lecture_title': files.get('lecture_title', None),
+                   'lecture_id': lecture_id,
+                   'external_link': external_link,
+                   'data-file': None,
+                   'error': None}
+        try:
             if external_link:
                 lnk = get_external_liks(course_id=self.__id_course, id_lecture=lecture_id, asset_id=asset_id)
-                dt_file = {'title-file': title,
-                           'lecture_title': lecture_title,
-                           'lecture_id': lecture_id,
-                           'external_link': external_link,
-                           'data-file': lnk.get('external_url', None)}
-                return dt_file
-            if asset_id and title and lecture_id and not external_link:
-                resp = requests.get(
-                    f"https://www.udemy.com/api-2.0/users/me/subscribed-courses/{self.__id_course}/lectures/"
-                    f"{lecture_id}/supplementary-assets/{asset_id}/?fields[asset]=download_urls",
+                dt_file['data-file'] = lnk.get('external_url', None)
+            elif asset_id and title and lecture_id:
+                resp = get_session().get(
+                    supplementary_asset_url(self.__id_course, lecture_id, asset_id, field='download_urls'),
                     headers=HEADERS_USER)
-                if resp.status_code == 200:
-                    da = json.loads(resp.text)
-                    # Para cada dict de um arquivo colocar seu título:
-                    dt_file = {'title-file': title,
-                               'lecture_title': lecture_title,
-                               'lecture_id': lecture_id,
-                               'external_link': external_link,
-                               'data-file': da['download_urls']}
-                    download_urls.append(dt_file)
-        return download_urls
+                if resp.status_code != 200:
+                    raise UnhandledExceptions(f"Erro ao obter o arquivo! Código de status: {resp.status_code}")
+                dt_file['data-file'] = decode_json(resp.content)['download_urls']
+            else:
+                raise UdemyUserApiExceptions("Arquivo sem ID da aula, ID do asset ou título!")
+        except Exception as e:
+            dt_file['error'] = e
+        return dt_file
+
+
 class Caption:
     """Representa uma legenda."""
 
@@ -120,6 +160,11 @@ class Caption:
         """Retorna o idioma."""
         return self._caption.get('video_label', '')
 
+    @property
+    def locale_id(self) -> str:
+        """Retorna o ID do idioma (ex.: 'pt_BR')."""
+        return self._caption.get('locale_id', '')
+
     @property
     def status(self) -> str:
         """Retorna o status da legenda 1 ou 0"""
@@ -149,7 +194,7 @@ class Caption:
     def content(self) -> str:
         """Obtém o conteúdo da legenda."""
         if self.url:
-            r = requests.get(headers=HEADERS_USER, url=self.url)
+            r = get_session().get(headers=HEADERS_USER, url=self.url)
             if r.status_code == 200:
                 return r.text
             else:
@@ -161,6 +206,81 @@ class Caption:
                 'Não foi possível obter a URL da legenda!'
             )
 
+    def save(self, path: str, etag: str = None, last_modified: str = None,
+             chunk_size: int = CAPTION_CHUNK_SIZE) -> dict:
+        """
+        Baixa a legenda direto para um arquivo, em blocos, sem manter o VTT inteiro em memória.
+
+        Se o arquivo já existir, ele é mantido quando o servidor confirma que não mudou: por 304 (com os
+        validadores informados) ou por um Content-Length igual ao tamanho do arquivo local.
+
+        Args:
+            path (str): Caminho do arquivo de destino.
+            etag (str): ETag da versão já baixada, se houver.
+            last_modified (str): Last-Modified da versão já baixada, se houver.
+            chunk_size (int): Tamanho dos blocos gravados.
+
+        Returns:
+            dict: 'status' ('downloaded', 'not_modified' ou 'same_size'), 'bytes' baixados, 'size' do arquivo,
+                'etag' e 'last_modified' da resposta.
+
+        Raises:
+            FileNotFoundError: Se a legenda não tiver URL.
+            ConnectionError: Se o servidor responder com erro.
+        """
+        if not self.url:
+            raise FileNotFoundError('Não foi possível obter a URL da legenda!')
+        exists = os.path.isfile(path)
+        headers = dict(HEADERS_USER)
+        if exists and etag:
+            headers['If-None-Match'] = etag
+        if exists and last_modified:
+            headers['If-Modified-Since'] = last_modified
+        with get_session().get(self.url, headers=headers, stream=True) as r:
+            result = {'bytes': 0, 'size': os.path.getsize(path) if exists else 0,
+                      'etag': r.headers.get('ETag') or etag, 'last_modified': r.headers.get('Last-Modified') or last_modified}
+            if r.status_code == 304 and exists:
+                result['status'] = 'not_modified'
+                return result
+            if r.status_code != 200:
+                raise ConnectionError(
+                    f'status_code: {r.status_code}, Não foi possível obter o conteúdo da legenda!'
+                )
+            length = r.headers.get('Content-Length')
+            if exists and length is not None and 'Content-Encoding' not in r.headers and int(length) == result['size']:
+                result['status'] = 'same_size'
+                return result
+            partial = f'{path}.part'
+            with open(partial, 'wb') as file:
+                for chunk in r.iter_content(chunk_size=chunk_size):
+                    file.write(chunk)
+                    result['bytes'] += len(chunk)
+            os.replace(partial, path)
+        result['size'] = result['bytes']
+        result['status'] = 'downloaded'
+        return result
+
+    def cues(self) -> CueTable:
+        """
+        Baixa e interpreta a legenda em streaming, linha a linha, sem manter o VTT inteiro em memória.
+
+        Returns:
+            CueTable: A tabela de cues, com busca pelo instante (cue_at).
+
+        Raises:
+            FileNotFoundError: Se a legenda não tiver URL.
+            ConnectionError: Se o servidor responder com erro.
+        """
+        if not self.url:
+            raise FileNotFoundError('Não foi possível obter a URL da legenda!')
+        with get_session().get(self.url, headers=HEADERS_USER, stream=True) as r:
+            if r.status_code != 200:
+                raise ConnectionError(
+                    f'status_code: {r.status_code}, Não foi possível obter o conteúdo da legenda!'
+                )
+            r.encoding = 'utf-8'
+            return CueTable(iter_cues(iter_lines(r.iter_content(chunk_size=CAPTION_CHUNK_SIZE, decode_unicode=True))))
+
 class Captions:
     """Gerencia as legendas de um vídeo."""
 
@@ -173,6 +293,13 @@ class Captions:
         """
         self._caption_data = caption_data
 
+    def __iter__(self) -> Iterator[Caption]:
+        """Percorre as legendas da aula, uma por idioma."""
+        return (Caption(caption=caption) for caption in self._caption_data)
+
+    def __len__(self) -> int:
+        return len(self._caption_data)
+
     def languages(self) -> list[dict]:
         """Retorna a lista de idiomas disponíveis na aula."""
         langs = []
@@ -270,19 +397,39 @@ class Quiz:
 class Lecture:
     """Cria objetos aula (lecture) do curso e extrai os dados."""
 
-    def __init__(self, data: dict, course_id: int, additional_files):
+    def __init__(self, data: dict, course_id: int, additional_files, fields=None):
         """
         Inicializa o objeto Lecture.
 
         Args:
             data (dict): Um dicionário contendo os dados da aula.
             course_id (int): O ID do curso.
-            additional_files: Arquivos adicionais relacionados à aula.
+            additional_files: Arquivos adicionais relacionados à aula. None se os arquivos
+                suplementares não foram pedidos no currículo.
+            fields: Grupos de campos (LECTURE_FIELD_GROUPS) pedidos à API. None indica todos.
         """
         self.__course_id = course_id
         self.__data = data
         self.__additional_files = additional_files
         self.__asset = self.__data.get("asset", {})
+        self.__fields = select_fields(fields, LECTURE_FIELD_GROUPS)
+
+    @property
+    def fetched_fields(self) -> tuple:
+        """
+        Obtém os grupos de campos (LECTURE_FIELD_GROUPS) pedidos à API para esta aula.
+
+        Returns:
+            tuple: Os grupos de campos disponíveis.
+        """
+        return self.__fields
+
+    def _require(self, group: str):
+        """Falha com FieldNotFetchedException se o grupo de campos não foi pedido à API."""
+        if group not in self.__fields:
+            raise FieldNotFetchedException(
+                f"O grupo de campos '{group}' não foi pedido para a aula {self.get_lecture_id}! "
+                f"Inclua '{group}' em fields ao obter os detalhes da aula.")
 
     @property
     def get_lecture_id(self) -> int:
@@ -322,6 +469,7 @@ class Lecture:
         Returns:
             dict: Um dicionário contendo as URLs das miniaturas.
         """
+        self._require('thumbnail')
         thumbnail_sprite = self.__asset.get('thumbnail_sprite', {})
         return {
             'thumbnail_vtt_url': thumbnail_sprite.get('vtt_url',[]),
@@ -346,6 +494,7 @@ class Lecture:
         Returns:
             list: Uma lista contendo as fontes de mídia.
         """
+        self._require('media')
         return self.__asset.get('media_sources',[])
 
     @property
@@ -356,6 +505,7 @@ class Lecture:
         Returns:
             Captions: Objeto para gerenciar as legendas.
         """
+        self._require('captions')
         if self.__asset.get('captions', []):
             c = Captions(caption_data=self.__asset.get('captions', []))
             return c
@@ -372,6 +522,7 @@ class Lecture:
         Returns:
             list: Uma lista contendo os links externos.
         """
+        self._require('external')
         return self.__asset.get('external_url',[])
 
     @property
@@ -382,6 +533,7 @@ class Lecture:
         Returns:
             str: O token de acesso à aula.
         """
+        self._require('media')
         return self.__asset.get('media_license_token','')
 
     def course_is_drmed(self) -> DRM:
@@ -413,6 +565,7 @@ class Lecture:
         Returns:
             list: Uma lista contendo as URLs de download.
         """
+        self._require('downloads')
         return self.__asset.get('download_urls',[])
 
     @property
@@ -423,6 +576,7 @@ class Lecture:
         Returns:
             list: Uma lista contendo as URLs de slides.
         """
+        self._require('slides')
         return self.__asset.get('slide_urls',[])
 
     @property
@@ -433,6 +587,7 @@ class Lecture:
         Returns:
             list: Uma lista contendo os slides.
         """
+        self._require('slides')
         return self.__asset.get('slides',[])
 
     @property
@@ -456,7 +611,13 @@ class Lecture:
 
         Returns:
             Os recursos adicionais relacionados à aula.
+
+        Raises:
+            FieldNotFetchedException: Se o curso foi obtido sem o grupo 'supplementary'.
         """
+        if self.__additional_files is None:
+            raise FieldNotFetchedException("Os arquivos suplementares não foram pedidos no currículo! "
+                                           "Inclua 'supplementary' em fields ao obter o curso.")
         if self.__additional_files:
             files_add = get_files_aule(lecture_id_filter=self.get_lecture_id, data=self.__additional_files)
             f = Files(files=files_add, id_course=self.__course_id).get_download_url
@@ -464,23 +625,109 @@ class Lecture:
         else:
             return []
 
+class LectureResult:
+    """Resultado da busca de uma aula em lote (ver Course.get_details_lectures)."""
+
+    def __init__(self, lecture_id: int, lecture: Lecture = None, error: Exception = None):
+        """
+        Args:
+            lecture_id (int): O ID da aula.
+            lecture (Lecture): A aula obtida, ou None em caso de falha.
+            error (Exception): A exceção que impediu a busca, ou None em caso de sucesso.
+        """
+        self.lecture_id = lecture_id
+        self.lecture = lecture
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Retorna True se a aula foi obtida com sucesso."""
+        return self.error is None
+
+    def __repr__(self):
+        status = 'ok' if self.ok else f'error={self.error!r}'
+        return f'LectureResult(lecture_id={self.lecture_id}, {status})'
+
+
 class Course:
-    """Recebe um dicionário com os dados do curso."""
+    """Recebe um dicionário com os dados do curso.
 
-    def __init__(self, results: dict, course_id: int):
+    Os capítulos e os arquivos adicionais vêm do mesmo currículo recebido em 'results'. Eles e as informações
+    do curso só são processados/baixados no primeiro acesso a uma propriedade que precise deles; use
+    prefetch() para obter tudo de uma vez.
+    """
+
+    def __init__(self, results: dict, course_id: int, fields=None):
         """
         Inicializa o objeto Course.
 
         Args:
             results (dict): Um dicionário contendo os dados do curso.
             course_id (int): O ID do curso.
+            fields: Grupos de campos do currículo (CURRICULUM_FIELD_GROUPS) pedidos à API. None indica todos;
+                sem 'supplementary' os arquivos adicionais não são baixados.
+
+        Raises:
+            UdemyUserApiExceptions: Se os dados do curso estiverem vazios.
         """
-        self.__parser_chapers = parser_chapters(results=results)
-        self.__data:list = self.__parser_chapers
+        if not results:
+            raise UdemyUserApiExceptions("Não foi possível obter detalhes do curso!")
         self.__course_id = course_id
         self.__results = results
-        self.__additional_files_data = get_add_files(course_id)
-        self.__information = self.__load_infor_course()
+        self.__fields = select_fields(fields, CURRICULUM_FIELD_GROUPS)
+
+    @cached_property
+    def __data(self) -> list:
+        """Capítulos do curso, processados no primeiro acesso."""
+        return parser_chapters(results=self.__results, records=True)
+
+    @property
+    def __additional_files_data(self):
+        """Currículo com os arquivos suplementares: o próprio 'results' (None sem 'supplementary')."""
+        if 'supplementary' not in self.__fields:
+            return None
+        return self.__results
+
+    @cached_property
+    def __lectures(self) -> list:
+        """Aulas do curso no formato de get_lectures, montadas uma única vez."""
+        return [lecture.in_section(chapter.title, chapter.chapter_index)
+                for chapter in self.__data for lecture in chapter.lectures]
+
+    @cached_property
+    def __lecture_index(self) -> dict:
+        """Índice lecture_id -> aula (a primeira ocorrência, na ordem do currículo)."""
+        index = {}
+        for lecture in self.__lectures:
+            index.setdefault(lecture.get('lecture_id'), lecture)
+        return index
+
+    @cached_property
+    def __assets(self):
+        """Arquivos adicionais do curso (extract_files), montados uma única vez."""
+        return self.__load_assets()
+
+    @cached_property
+    def __files_index(self):
+        """Índice lecture_id -> arquivos adicionais da aula (None sem 'supplementary')."""
+        files = self.__assets
+        if files is None:
+            return None
+        index = {}
+        for file in files:
+            index.setdefault(file.get('lecture_id'), []).append(file)
+        return index
+
+    def __files_for(self, lecture_id):
+        index = self.__files_index
+        if index is None:
+            return None
+        return index.get(lecture_id, [])
+
+    @cached_property
+    def __information(self) -> dict:
+        """Informações gerais do curso, baixadas no primeiro acesso."""
+        return self.__load_infor_course()
 
     def __load_infor_course(self) -> dict:
         """
@@ -492,6 +739,17 @@ class Course:
         data = get_course_infor(self.__course_id)
         return data
 
+    def prefetch(self) -> 'Course':
+        """
+        Obtém de uma vez tudo o que o curso carrega sob demanda: capítulos e informações do curso.
+
+        Returns:
+            Course: O próprio curso, para encadear chamadas.
+        """
+        self.__data
+        self.__information
+        return self
+
     @property
     def title_course(self) -> str:
         """
@@ -590,48 +848,158 @@ class Course:
         Returns:
             list: Uma lista contendo todas as aulas.
         """
-        videos = []
+        return [lecture.to_dict() for lecture in self.__lectures]
 
-        for chapter in self.__data:
-            for video in chapter.get('lectures', []):
-                dt = {
-                    'section': chapter.get('title', ''),
-                    'title': video.get('title', ''),
-                    'lecture_id': video.get('lecture_id', ''),
-                    'asset_id': video.get('asset_id', ''),
-                    'asset_type': video.get('asset_type', ''),
-                    'section_order': chapter.get('chapter_index',1)
-                }
-                videos.append(dt)
+    @property
+    def lecture_records(self) -> list[LectureRef]:
+        """
+        Obtém as aulas como registros compactos e imutáveis (mesmas chaves de get_lectures), sem criar um
+        dicionário por aula.
 
-        return videos
-    def get_details_lecture(self, lecture_id: int) -> Lecture:
+        Returns:
+            list[LectureRef]: Uma lista contendo todas as aulas.
+        """
+        return list(self.__lectures)
+
+    def get_details_lecture(self, lecture_id: int, fields=None) -> Lecture:
         """
         Obtém detalhes de uma aula específica.
 
         Args:
             lecture_id (int): O ID da aula.
+            fields: Grupos de campos a pedir (chaves de LECTURE_FIELD_GROUPS, ex.: ('captions',)).
+                None pede todos. Acessores de grupos não pedidos levantam FieldNotFetchedException.
 
         Returns:
             Lecture: Um objeto Lecture contendo os detalhes da aula.
         """
-        type_lecture  = ''
-        links= {}
-        if not is_lecture_in_course(lecture_id=lecture_id,lectures=self.get_lectures):
+        lecture = self.__lecture_index.get(lecture_id)
+        if lecture is None:
             raise FileNotFoundError(
                 'Essa aula não existe nesse curso!'
             )
-        for l in self.get_lectures:
-            if lecture_id == l.get('lecture_id'):
-                type_lecture = l.get('asset_type')
+        return self.__fetch_lecture(lecture_id, lecture.get('asset_type'), fields)
+
+    def __fetch_lecture(self, lecture_id: int, type_lecture: str, fields=None) -> Lecture:
         if type_lecture.lower() ==  'video' or type_lecture.lower() == 'article':
-            links = get_links(course_id=self.__course_id, id_lecture=lecture_id)
+            fields = select_fields(fields, LECTURE_FIELD_GROUPS)
+            links = get_links(course_id=self.__course_id, id_lecture=lecture_id, fields=fields)
         else:
+            fields = None
             links = get_assessments(course_id=self.__course_id,lecture_id=lecture_id)
-        additional_files = self.__load_assets()
-        lecture = Lecture(data=links, course_id=self.__course_id, additional_files=additional_files)
+        lecture = Lecture(data=links, course_id=self.__course_id, additional_files=self.__files_for(lecture_id),
+                          fields=fields)
         return lecture
 
+    def __batch_jobs(self, lecture_ids):
+        types = {lecture_id: l.get('asset_type') or '' for lecture_id, l in self.__lecture_index.items()}
+        if lecture_ids is None:
+            return list(types.items())
+        # mantém a ordem do currículo; IDs desconhecidos ficam no final
+        order = {lecture_id: i for i, lecture_id in enumerate(types)}
+        ids = sorted(dict.fromkeys(lecture_ids), key=lambda x: order.get(x, len(order)))
+        return [(lecture_id, types.get(lecture_id)) for lecture_id in ids]
+
+    def __run_batch_job(self, lecture_id: int, type_lecture, fields=None) -> 'LectureResult':
+        if type_lecture is None:
+            return LectureResult(lecture_id, error=FileNotFoundError('Essa aula não existe nesse curso!'))
+        try:
+            return LectureResult(lecture_id, lecture=self.__fetch_lecture(lecture_id, type_lecture, fields))
+        except Exception as e:
+            return LectureResult(lecture_id, error=e)
+
+    def iter_details_lectures(self, lecture_ids: list = None, max_workers: int = MAX_WORKERS,
+                              fields=None) -> Iterator['LectureResult']:
+        """
+        Obtém os detalhes de várias aulas em paralelo, entregando cada uma assim que termina.
+
+        Args:
+            lecture_ids (list): IDs das aulas. Se None, obtém todas as aulas do curso.
+            max_workers (int): Número máximo de requisições simultâneas.
+            fields: Grupos de campos a pedir para cada aula (ver get_details_lecture). None pede todos.
+
+        Yields:
+            LectureResult: O resultado de cada aula, na ordem em que as requisições terminam.
+                Uma falha em uma aula é informada em LectureResult.error e não interrompe as demais.
+        """
+        jobs = self.__batch_jobs(lecture_ids)
+        if not jobs:
+            return
+        fields = select_fields(fields, LECTURE_FIELD_GROUPS)
+        self.__files_index  # monta o índice antes de dividir o trabalho entre as threads
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+            futures = [executor.submit(self.__run_batch_job, lecture_id, type_lecture, fields)
+                       for lecture_id, type_lecture in jobs]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def get_details_lectures(self, lecture_ids: list = None, max_workers: int = MAX_WORKERS,
+                             fields=None) -> list['LectureResult']:
+        """
+        Obtém os detalhes de várias aulas em paralelo.
+
+        Args:
+            lecture_ids (list): IDs das aulas. Se None, obtém todas as aulas do curso.
+            max_workers (int): Número máximo de requisições simultâneas.
+            fields: Grupos de campos a pedir para cada aula (ver get_details_lecture). None pede todos.
+
+        Returns:
+            list[LectureResult]: Um resultado por aula, na ordem do currículo. Aulas que falharam trazem a
+                exceção em LectureResult.error em vez de interromper o lote.
+        """
+        results = {r.lecture_id: r for r in self.iter_details_lectures(lecture_ids, max_workers=max_workers,
+                                                                         fields=fields)}
+        return [results[lecture_id] for lecture_id, _ in self.__batch_jobs(lecture_ids)]
+
+    def get_all_quizzes(self, max_workers: int = MAX_WORKERS, quiz_ids: list = None) -> list[QuizRecord]:
+        """
+        Obtém em paralelo os metadados e todas as perguntas dos quizzes do curso.
+
+        Os quizzes (inclusive testes práticos) vêm do currículo já carregado; para cada um, os metadados e as
+        perguntas são pedidos ao mesmo tempo, e as perguntas seguem a paginação até a última página.
+
+        Args:
+            max_workers (int): Número máximo de requisições simultâneas.
+            quiz_ids (list): IDs dos quizzes. Se None, obtém todos os quizzes do curso.
+
+        Returns:
+            list[QuizRecord]: Um registro por quiz, na ordem do currículo. A descrição e as perguntas ficam em
+                HTML, como a API as entrega, e 'duration' em segundos. Quizzes que falharam trazem a exceção
+                em 'error' em vez de interromper o lote.
+        """
+        quizzes = [lecture for lecture in self.__lecture_index.values()
+                   if (lecture.get('asset_type') or '').lower() == 'quiz']
+        if quiz_ids is not None:
+            wanted = set(quiz_ids)
+            quizzes = [quiz for quiz in quizzes if quiz.get('lecture_id') in wanted]
+        if not quizzes:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, 2 * len(quizzes)))) as executor:
+            jobs = [(quiz,
+                     executor.submit(get_assessments, course_id=self.__course_id, lecture_id=quiz.get('lecture_id')),
+                     executor.submit(self.__fetch_assessments, quiz.get('lecture_id')))
+                    for quiz in quizzes]
+            return [self.__quiz_record(quiz, metadata, assessments) for quiz, metadata, assessments in jobs]
+
+    @staticmethod
+    def __fetch_assessments(quiz_id: int) -> tuple:
+        # convertidas na própria thread: só os registros compactos ficam esperando a vez na lista
+        return tuple(Assessment.from_api(item) for item in get_quizzes(lecture_id=quiz_id).get('results') or ())
+
+    @staticmethod
+    def __quiz_record(quiz, metadata, assessments) -> QuizRecord:
+        base = {'quiz_id': quiz.get('lecture_id'), 'title': quiz.get('title'), 'section': quiz.get('section'),
+                'section_order': quiz.get('section_order')}
+        try:
+            data = metadata.result()
+            questions = assessments.result()
+        except Exception as e:
+            return QuizRecord(**base, assessments=(), error=e)
+        return QuizRecord(**dict(base, title=data.get('title') or base['title']), type=data.get('type', ''),
+                          description=data.get('description', ''), duration=data.get('duration', 0),
+                          pass_percent=data.get('pass_percent', 0), num_assessments=data.get('num_assessments', 0),
+                          assessments=questions)
+
     @property
     def get_additional_files(self) -> list:
         """
@@ -639,30 +1007,195 @@ class Course:
 
         Returns:
             list: Uma lista contendo os arquivos adicionais de um curso.
+
+        Raises:
+            FieldNotFetchedException: Se o curso foi obtido sem o grupo 'supplementary'.
         """
-        supplementary_assets = []
-        for item in self.__additional_files_data.get('results', []):
-            if item.get('_class') == 'lecture':
-                id_l = item.get('id', {})
-                title = item.get('title', {})
-                assets = item.get('supplementary_assets', [])
-                for asset in assets:
-                    supplementary_assets.append({
-                        'lecture_id': id_l,
-                        'lecture_title': title,
-                        'asset': asset
-                    })
-        files = extract_files(supplementary_assets)
-        files_objt = Files(files=files, id_course=self.__course_id).get_download_url
-        return files_objt
+        return self.resolve_additional_files()
+
+    def resolve_additional_files(self, lecture_ids: list = None, max_workers: int = MAX_WORKERS) -> list:
+        """
+        Obtém em paralelo as URLs de download (ou links externos) dos arquivos adicionais do curso.
+
+        Args:
+            lecture_ids (list): Se informado, resolve apenas os arquivos dessas aulas.
+            max_workers (int): Número máximo de requisições simultâneas.
+
+        Returns:
+            list: Um dicionário por arquivo, na ordem do currículo. Arquivos que falharam trazem a exceção em
+                'error' em vez de interromper o lote (ver Files.resolve).
+
+        Raises:
+            FieldNotFetchedException: Se o curso foi obtido sem o grupo 'supplementary'.
+        """
+        if self.__additional_files_data is None:
+            raise FieldNotFetchedException("Os arquivos suplementares não foram pedidos no currículo! "
+                                           "Inclua 'supplementary' em fields ao obter o curso.")
+        return Files(files=self.__assets, id_course=self.__course_id).resolve(lecture_ids=lecture_ids,
+                                                                              max_workers=max_workers)
+
+    def download_captions(self, locales: list = None, dest_dir: str = 'captions', max_workers: int = MAX_WORKERS,
+                          lecture_ids: list = None) -> dict:
+        """
+        Baixa as legendas das aulas de vídeo do curso direto para o disco.
+
+        Os detalhes das aulas (apenas o grupo 'captions') e os arquivos VTT são obtidos em paralelo; cada
+        legenda é gravada em blocos como '<dest_dir>/<lecture_id>_<locale_id>.vtt'. Os validadores (ETag,
+        Last-Modified) ficam em '<dest_dir>/.captions.json', e legendas já baixadas que não mudaram não são
+        baixadas de novo.
+
+        Args:
+            locales (list): IDs dos idiomas desejados (ex.: ['pt_BR', 'en_US']). None baixa todos.
+            dest_dir (str): Diretório de destino (criado se não existir).
+            max_workers (int): Número máximo de requisições simultâneas.
+            lecture_ids (list): IDs das aulas. Se None, usa todas as aulas de vídeo do curso.
+
+        Returns:
+            dict: Relatório com 'downloaded', 'skipped', 'without_captions', 'failed' (lista de
+                (lecture_id, locale_id, erro)), 'files' (caminhos na ordem do currículo), 'bytes',
+                'seconds' e 'bytes_per_second'.
+        """
+        started = time.monotonic()
+        if lecture_ids is None:
+            lecture_ids = [lecture_id for lecture_id, lecture in self.__lecture_index.items()
+                           if (lecture.get('asset_type') or '').lower() == 'video']
+        wanted = None if locales is None else set(locales)
+        os.makedirs(dest_dir, exist_ok=True)
+        manifest_path = os.path.join(dest_dir, CAPTIONS_MANIFEST)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            manifest = {}
+        lock = threading.Lock()
+        report = {'downloaded': 0, 'skipped': 0, 'without_captions': 0, 'failed': [], 'bytes': 0}
+        saved = {}  # (lecture_id, locale_id) -> caminho
+
+        def download(lecture_id, caption: Caption, locale_id):
+            name = f'{lecture_id}_{locale_id}.vtt'
+            path = os.path.join(dest_dir, name)
+            with lock:
+                known = manifest.get(name, {})
+            if (os.path.isfile(path) and not known.get('etag') and not known.get('last_modified')
+                    and known.get('size') == os.path.getsize(path)):
+                result = {'status': 'same_size', 'bytes': 0, 'size': known['size']}
+            else:
+                result = caption.save(path, etag=known.get('etag'), last_modified=known.get('last_modified'))
+            with lock:
+                manifest[name] = {'size': result['size'], 'etag': result.get('etag', known.get('etag')),
+                                  'last_modified': result.get('last_modified', known.get('last_modified'))}
+                report['bytes'] += result['bytes']
+                report['downloaded' if result['status'] == 'downloaded' else 'skipped'] += 1
+                saved[(lecture_id, locale_id)] = path
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            downloads = {}
+            for result in self.iter_details_lectures(lecture_ids, max_workers=max_workers, fields=('captions',)):
+                if not result.ok:
+                    report['failed'].append((result.lecture_id, None, result.error))
+                    continue
+                try:
+                    captions = result.lecture.get_captions
+                except FileNotFoundError:
+                    report['without_captions'] += 1
+                    continue
+                for caption in captions:
+                    locale_id = caption.locale_id
+                    if locale_id and (wanted is None or locale_id in wanted):
+                        future = executor.submit(download, result.lecture_id, caption, locale_id)
+                        downloads[future] = (result.lecture_id, locale_id)
+            for future in as_completed(downloads):
+                error = future.exception()
+                if error is not None:
+                    report['failed'].append((*downloads[future], error))
+
+        partial = f'{manifest_path}.part'
+        with open(partial, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file)
+        os.replace(partial, manifest_path)
+        order = {lecture_id: i for i, lecture_id in enumerate(self.__lecture_index)}
+        report['files'] = [saved[key] for key in sorted(saved, key=lambda k: (order.get(k[0], len(order)), k[1]))]
+        report['seconds'] = round(time.monotonic() - started, 3)
+        report['bytes_per_second'] = round(report['bytes'] / report['seconds']) if report['seconds'] else 0
+        return report
+
+    def index_captions(self, locales: list = None, index: CaptionIndex = None, max_workers: int = MAX_WORKERS,
+                       lecture_ids: list = None) -> dict:
+        """
+        Indexa as legendas das aulas de vídeo para busca (ver search_captions), uma aula por vez.
+
+        Para cada aula é indexada uma legenda: a do primeiro idioma de 'locales' disponível (ou a primeira da
+        aula). As legendas são lidas em streaming direto para o índice, sem passar pelo disco, e aulas cuja
+        legenda não mudou desde a última indexação não são baixadas de novo.
+
+        Args:
+            locales (list): IDs dos idiomas em ordem de preferência (ex.: ['pt_BR', 'en_US']).
+            index (CaptionIndex): Índice de destino. Padrão: o índice em .cache (get_caption_index()).
+            max_workers (int): Número máximo de requisições simultâneas.
+            lecture_ids (list): IDs das aulas. Se None, usa todas as aulas de vídeo do curso.
+
+        Returns:
+            dict: Relatório com 'indexed', 'skipped' (legenda inalterada), 'without_captions', 'failed' (lista de
+                (lecture_id, erro)), 'cues' e 'seconds'.
+        """
+        started = time.monotonic()
+        if index is None:
+            index = get_caption_index()
+        if lecture_ids is None:
+            lecture_ids = [lecture_id for lecture_id, lecture in self.__lecture_index.items()
+                           if (lecture.get('asset_type') or '').lower() == 'video']
+        preference = {locale: i for i, locale in enumerate(locales or ())}
+        report = {'indexed': 0, 'skipped': 0, 'without_captions': 0, 'failed': [], 'cues': 0}
+        jobs = {}
+
+        def store(future):
+            # as threads só baixam e interpretam; a gravação fica nesta thread, dentro de index.bulk()
+            lecture_id, locale_id, signature = jobs.pop(future)
+            try:
+                report['cues'] += index.add_lecture(self.__course_id, lecture_id, future.result(),
+                                                    locale=locale_id, signature=signature)
+                report['indexed'] += 1
+            except Exception as e:
+                report['failed'].append((lecture_id, e))
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor, index.bulk():
+            for result in self.iter_details_lectures(lecture_ids, max_workers=max_workers, fields=('captions',)):
+                if not result.ok:
+                    report['failed'].append((result.lecture_id, result.error))
+                    continue
+                try:
+                    captions = result.lecture.get_captions
+                except FileNotFoundError:
+                    captions = ()
+                captions = [c for c in captions if c.url and (not preference or c.locale_id in preference)]
+                if not captions:
+                    report['without_captions'] += 1
+                    continue
+                caption = min(captions, key=lambda c: preference.get(c.locale_id, 0))
+                locale_id = caption.locale_id
+                signature = f"{locale_id}:{caption.id}:{caption.created}"
+                if index.signature(self.__course_id, result.lecture_id) == signature:
+                    report['skipped'] += 1
+                    continue
+                future = executor.submit(caption.cues)
+                jobs[future] = (result.lecture_id, locale_id, signature)
+                for done in [f for f in jobs if f.done()]:
+                    store(done)
+            for future in as_completed(list(jobs)):
+                store(future)
+        report['seconds'] = round(time.monotonic() - started, 3)
+        return report
 
     def __load_assets(self):
         """
         Retorna a lista de arquivos adicionais de um curso.
 
         Returns:
-            list: Uma lista contendo os arquivos adicionais de um curso.
+            list: Uma lista contendo os arquivos adicionais de um curso, ou None se o currículo
+                foi obtido sem o grupo 'supplementary'.
         """
+        if self.__additional_files_data is None:
+            return None
         supplementary_assets = []
         for item in self.__additional_files_data.get('results', []):
             if item.get('_class') == 'lecture':
@@ -675,5 +1208,5 @@ class Course:
                         'lecture_title': title,
                         'asset': asset
                     })
-        files = extract_files(supplementary_assets)
+        files = extract_files(supplementary_assets, records=True)
         return files
@@ -0,0 +1,448 @@
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from .singleflight import SingleFlight
+
+VALIDATOR_MAX_BYTES = 64 * 1024 * 1024  # corpo máximo mantido para revalidação (64 MB)
+
+
+def account_identity(cookie: str) -> str:
+    """
+    Gera um identificador curto e não reversível da conta a partir do cabeçalho Cookie.
+
+    Args:
+        cookie (str): Valor do cabeçalho Cookie usado na requisição.
+
+    Returns:
+        str: Identificador da conta (hash), ou string vazia se não houver cookies.
+    """
+    if not cookie:
+        return ''
+    return hashlib.sha256(cookie.encode('utf-8')).hexdigest()[:16]
+
+
+class ValidatorStore:
+    """Guarda ETag/Last-Modified e o corpo das respostas para revalidação condicional (304).
+
+    As entradas são chaveadas por URL + conta e descartadas da mais antiga para a mais nova
+    quando o total de bytes passa de max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = VALIDATOR_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.revalidations = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+
+    def conditional_headers(self, key) -> dict:
+        """Retorna os cabeçalhos If-None-Match/If-Modified-Since para a chave, se houver validadores."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return {}
+            self.revalidations += 1
+            headers = {}
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+            return headers
+
+    def store(self, key, etag: str, last_modified: str, body: bytes, headers: dict):
+        """Guarda os validadores e o corpo de uma resposta 200."""
+        if not etag and not last_modified:
+            return
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old['body'])
+            self._entries[key] = {'etag': etag, 'last_modified': last_modified, 'body': body, 'headers': headers}
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted['body'])
+
+    def not_modified_entry(self, key):
+        """Registra um 304 e retorna a entrada guardada (ou None se ela já foi descartada)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.not_modified += 1
+            self.bytes_saved += len(entry['body'])
+            return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'stored_bytes': self._bytes,
+                'revalidations': self.revalidations,
+                'not_modified': self.not_modified,
+                'hit_rate': round(self.not_modified / self.revalidations, 4) if self.revalidations else 0.0,
+                'bytes_saved': self.bytes_saved,
+            }
+
+
+DISK_CACHE_FILE = 'responses.sqlite3'
+DISK_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+# Validade (segundos) por família de endpoint; famílias ausentes (ou com 0) não são gravadas em disco.
+# Detalhes de aulas e arquivos trazem URLs assinadas que expiram, por isso têm TTL curto ou nenhum.
+DISK_CACHE_TTLS = {
+    'curriculum': 6 * 3600,
+    'course': 24 * 3600,
+    'lecture': 10 * 60,
+    'quiz': 24 * 3600,
+    'captions': 7 * 24 * 3600,
+}
+_EVICT_EVERY = 50  # gravações entre verificações de tamanho
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normaliza uma URL para uso como chave de cache (esquema/host em minúsculas, query ordenada).
+
+    Args:
+        url (str): URL original.
+
+    Returns:
+        str: URL normalizada.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+class DiskCache:
+    """Cache persistente de respostas em SQLite, compartilhável entre threads e processos.
+
+    Cada thread usa sua própria conexão; o banco roda em modo WAL, permitindo leituras
+    simultâneas enquanto outro processo grava.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DISK_CACHE_MAX_BYTES, ttls: dict = None):
+        """
+        Args:
+            path (str): Caminho do arquivo SQLite.
+            max_bytes (int): Tamanho máximo dos corpos guardados; as entradas acessadas há mais tempo saem primeiro.
+            ttls (dict): Validade em segundos por família de endpoint (ver DISK_CACHE_TTLS).
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = dict(DISK_CACHE_TTLS if ttls is None else ttls)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        with self._connection() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS responses ('
+                         'key TEXT PRIMARY KEY, family TEXT, headers TEXT, body BLOB, size INTEGER, '
+                         'expires REAL, accessed REAL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def key(url: str, identity: str) -> str:
+        return f'{identity}|{normalize_url(url)}'
+
+    def ttl_for(self, family: str) -> float:
+        return self.ttls.get(family) or 0
+
+    def get(self, key: str):
+        """
+        Busca uma resposta válida.
+
+        Returns:
+            tuple[dict, bytes] | None: (cabeçalhos, corpo) ou None se ausente ou expirada.
+        """
+        now = time.time()
+        row = self._connection().execute('SELECT headers, body FROM responses WHERE key = ? AND expires > ?',
+                                         (key, now)).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            self._connection().execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+        except sqlite3.OperationalError:
+            pass  # banco ocupado por outro processo: atualizar o acesso é opcional
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, family: str, headers: dict, body: bytes):
+        """Grava uma resposta com a validade configurada para a família."""
+        ttl = self.ttl_for(family)
+        if not ttl or len(body) > self.max_bytes:
+            return
+        now = time.time()
+        self._connection().execute(
+            'INSERT OR REPLACE INTO responses (key, family, headers, body, size, expires, accessed) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (key, family, json.dumps(headers), sqlite3.Binary(body), len(body), now + ttl, now))
+        with self._lock:
+            self._writes += 1
+            check = self._writes % _EVICT_EVERY == 1
+        if check:
+            self.evict()
+
+    def evict(self):
+        """Remove entradas expiradas e, se o limite de tamanho for ultrapassado, as menos acessadas."""
+        conn = self._connection()
+        removed = conn.execute('DELETE FROM responses WHERE expires <= ?', (time.time(),)).rowcount
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total > self.max_bytes:
+            target = int(self.max_bytes * 0.9)
+            excess = total - target
+            rows = conn.execute('SELECT key, size FROM responses ORDER BY accessed').fetchall()
+            victims = []
+            for key, size in rows:
+                if excess <= 0:
+                    break
+                victims.append((key,))
+                excess -= size
+            conn.executemany('DELETE FROM responses WHERE key = ?', victims)
+            removed += len(victims)
+        with self._lock:
+            self.evictions += max(removed, 0)
+
+    def invalidate(self, pattern: str = None):
+        """
+        Remove entradas do cache.
+
+        Args:
+            pattern (str): Trecho da URL (ex.: '/courses/123/'); se None, limpa todo o cache.
+        """
+        if pattern is None:
+            self._connection().execute('DELETE FROM responses')
+        else:
+            self._connection().execute("DELETE FROM responses WHERE key LIKE ? ESCAPE '\\'",
+                                       ('%' + pattern.replace('\\', '\\\\').replace('%', '\\%')
+                                        .replace('_', '\\_') + '%',))
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def stats(self) -> dict:
+        row = self._connection().execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses').fetchone()
+        with self._lock:
+            return {'path': self.path, 'entries': row[0], 'stored_bytes': row[1], 'max_bytes': self.max_bytes,
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+MEMORY_CACHE_MAX_ENTRIES = 2048
+MEMORY_CACHE_MAX_BYTES = 128 * 1024 * 1024  # tamanho estimado dos objetos guardados (128 MB)
+MEMORY_CACHE_TTL = 300.0  # segundos
+
+
+def _approx_size(obj) -> int:
+    """Estimativa barata do tamanho em memória de um objeto JSON decodificado."""
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            size += 64 + 16 * len(item)
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            size += 56 + 8 * len(item)
+            stack.extend(item)
+        elif isinstance(item, (str, bytes)):
+            size += 49 + len(item)
+        else:
+            size += 28
+    return size
+
+
+def _detached(obj):
+    """Cópia profunda de um objeto JSON decodificado (bem mais rápida que copy.deepcopy para dicts e listas)."""
+    if isinstance(obj, dict):
+        return {key: _detached(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_detached(item) for item in obj]
+    if obj is None or isinstance(obj, (str, int, float, bytes)):
+        return obj
+    return copy.deepcopy(obj)
+
+
+class LRUCache:
+    """Cache em memória com política LRU, validade (TTL) e limites de entradas e de bytes.
+
+    Cada entrada pode ser marcada com o curso e a aula a que pertence, permitindo invalidação seletiva.
+    """
+
+    def __init__(self, max_entries: int = MEMORY_CACHE_MAX_ENTRIES, max_bytes: int = MEMORY_CACHE_MAX_BYTES,
+                 ttl: float = MEMORY_CACHE_TTL):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Returns:
+            tuple[bool, Any]: (True, valor) se houver uma entrada válida, (False, None) caso contrário.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, entry[0]
+                self._remove(key)
+            self.misses += 1
+            return False, None
+
+    def set(self, key, value, ttl: float = None, course_id=None, lecture_id=None):
+        if self.max_entries <= 0:
+            return
+        size = _approx_size(value)
+        if size > self.max_bytes:
+            return
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires, size, course_id, lecture_id)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry[2]
+
+    def invalidate(self, course_id=None, lecture_id=None):
+        """Remove as entradas do curso e/ou da aula informados; sem argumentos, limpa tudo."""
+        with self._lock:
+            if course_id is None and lecture_id is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            for key in [k for k, e in self._entries.items()
+                        if (course_id is None or str(e[3]) == str(course_id))
+                        and (lecture_id is None or str(e[4]) == str(lecture_id))]:
+                self._remove(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._bytes, 'max_entries': self.max_entries,
+                    'max_bytes': self.max_bytes, 'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions}
+
+
+memory_cache = LRUCache()
+memo_flights = SingleFlight()
+
+
+def memoized(ttl: float = None):
+    """
+    Decorador que guarda o resultado de uma função da API no cache em memória (memory_cache).
+
+    A chave é o nome da função mais os argumentos; os argumentos 'course_id' e 'id_lecture'/'lecture_id'
+    marcam a entrada para invalidação seletiva. Chamadas simultâneas com a mesma chave executam a função
+    uma única vez. O cache guarda sua própria cópia do resultado e cada chamada recebe uma cópia, então
+    modificar o que foi devolvido não afeta as próximas chamadas.
+
+    Args:
+        ttl (float): Validade das entradas desta função. Padrão: a validade do cache.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            key = (func.__qualname__, tuple((name, str(value)) for name, value in arguments.items()))
+            found, value = memory_cache.get(key)
+            if found:
+                return _detached(value)
+
+            def load():
+                result = func(*args, **kwargs)
+                stored = _detached(result)
+                memory_cache.set(key, stored, ttl=ttl, course_id=arguments.get('course_id'),
+                                 lecture_id=arguments.get('id_lecture', arguments.get('lecture_id')))
+                return result, stored
+
+            # quem executou fica com o original; as chamadas agrupadas copiam a versão guardada, que ninguém altera
+            (result, stored), shared = memo_flights.do(key, load)
+            return _detached(stored) if shared else result
+        return wrapper
+    return decorator
+
+
+def configure_memory_cache(max_entries: int = None, max_bytes: int = None, ttl: float = None):
+    """
+    Ajusta os limites do cache em memória.
+
+    Args:
+        max_entries (int): Número máximo de entradas (0 desativa o cache).
+        max_bytes (int): Tamanho máximo estimado dos objetos guardados.
+        ttl (float): Validade padrão das entradas, em segundos.
+    """
+    if max_entries is not None:
+        memory_cache.max_entries = max_entries
+    if max_bytes is not None:
+        memory_cache.max_bytes = max_bytes
+    if ttl is not None:
+        memory_cache.ttl = ttl
+    memory_cache.invalidate()
+
+
+def invalidate_memory_cache(course_id=None, lecture_id=None):
+    """
+    Descarta resultados guardados em memória.
+
+    Args:
+        course_id: Remove apenas as entradas deste curso.
+        lecture_id: Remove apenas as entradas desta aula.
+    """
+    memory_cache.invalidate(course_id=course_id, lecture_id=lecture_id)
+
+
+def memory_cache_stats() -> dict:
+    """Retorna entradas, bytes estimados, acertos, falhas e remoções do cache em memória."""
+    return memory_cache.stats()
@@ -20,3 +20,15 @@ class LoginException(Exception):
     def __init__(self, message="Error Login!"):
         self.message = message
         super().__init__(self.message)
+
+
+class CircuitOpenException(Exception):
+    def __init__(self, message="Circuito aberto: a Udemy está instável, tente novamente mais tarde!"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class FieldNotFetchedException(Exception):
+    def __init__(self, message="Esse campo não foi pedido à API!"):
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,123 @@
+import html
+import re
+from itertools import chain
+
+# um único padrão percorre o HTML: comentários, declarações (<!DOCTYPE>, <?xml?>) e tags de abertura/fechamento
+_TOKEN = re.compile(r'<!--.*?(?:-->|$)|<(/?)([a-zA-Z][a-zA-Z0-9:-]*)(?:[\s/][^>]*)?>|<[!?][^>]*>', re.S)
+_SPACES = re.compile(r'\s+')
+
+_PARAGRAPH_TAGS = frozenset({'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'pre', 'table', 'ul', 'ol',
+                             'dl', 'figure', 'hr'})  # separados por uma linha em branco
+_LINE_TAGS = frozenset({'div', 'section', 'article', 'header', 'footer', 'aside', 'nav', 'main', 'tr', 'dt', 'dd',
+                        'figcaption', 'address', 'details', 'summary', 'li', 'caption'})  # começam uma nova linha
+_SKIP_TAGS = frozenset({'script', 'style', 'head', 'template'})  # conteúdo descartado
+_CELL_TAGS = frozenset({'td', 'th'})
+_INLINE_TAGS = frozenset({'a', 'b', 'strong', 'i', 'em', 'u', 'code', 'span', 'sub', 'sup', 'small', 'mark', 'kbd',
+                          'img', 'font', 's', 'strike', 'del', 'ins', 'abbr', 'q', 'cite', 'var', 'samp', 'label'})
+
+
+def html_to_text(value) -> str:
+    """
+    Converte HTML (descrições, enunciados de quizzes, artigos) em texto puro, em uma única passada.
+
+    Tags de bloco viram quebras de linha (parágrafos e títulos separados por uma linha em branco), <br> quebra a
+    linha, itens de listas recebem '- ' (ou '1. ', '2. '... em <ol>) com recuo por nível, células de tabela são
+    separadas por tabulação e o conteúdo de <pre> é mantido como está. Todas as entidades HTML são decodificadas;
+    scripts, estilos e comentários são descartados e os demais espaços são colapsados.
+
+    Args:
+        value: O HTML (None ou vazio retorna '').
+
+    Returns:
+        str: O texto.
+    """
+    if not value:
+        return ''
+    value = str(value)
+    if '<' not in value:
+        if '&' in value:
+            value = html.unescape(value)
+        return _SPACES.sub(' ', value).strip()
+    out = []
+    pending = 0  # quebras de linha aguardando o próximo texto (0, 1 ou 2)
+    line_start = True  # o próximo texto começa uma linha: espaços iniciais são descartados
+    marker = None  # marcador do item de lista aberto, escrito antes do primeiro texto do item
+    lists = []  # pilha de listas abertas: contador do <ol> ou None para <ul>
+    pre = 0  # profundidade de <pre>
+    skip = None  # tag cujo conteúdo está sendo descartado
+    position = 0
+    for match in chain(_TOKEN.finditer(value), (None,)):  # None: o texto depois da última tag
+        start = match.start() if match is not None else len(value)
+        if start > position and skip is None:
+            chunk = value[position:start]
+            if not pre and ('  ' in chunk or not chunk.isprintable()):  # \n, \t, \xa0... precisam ser colapsados
+                chunk = _SPACES.sub(' ', chunk)
+            if '&' in chunk:
+                chunk = html.unescape(chunk)
+                if '\xa0' in chunk:
+                    chunk = chunk.replace('\xa0', ' ')
+            if not pre and (line_start or pending) and chunk[:1] == ' ':
+                chunk = chunk.lstrip(' ')
+            if chunk:
+                if pending and out:
+                    out[-1] = out[-1].rstrip(' \n')  # o <pre> pode terminar com sua própria quebra
+                    out.append('\n' * pending)
+                pending = 0
+                if marker is not None:
+                    out.append(marker)
+                    marker = None
+                out.append(chunk)
+                line_start = chunk[-1] == '\n' if pre else False
+        if match is None:
+            break
+        position = match.end()
+        closing, name = match.group(1, 2)
+        if name is None:
+            continue  # comentário ou declaração
+        name = name.lower()
+        if skip is not None:
+            if closing and name == skip:
+                skip = None
+            continue
+        if name in _INLINE_TAGS:
+            continue  # não alteram o texto
+        if name == 'br':
+            if pending < 2:
+                pending += 1
+            line_start = True
+            continue
+        if name in _CELL_TAGS:
+            if not closing and out and not line_start and not pending:
+                out.append('\t')
+                line_start = True
+            continue
+        if name in _SKIP_TAGS:
+            if not closing and not match.group(0).endswith('/>'):
+                skip = name
+            continue
+        if name in _PARAGRAPH_TAGS:
+            level = 1 if lists and name != 'pre' else 2  # listas aninhadas não abrem parágrafo
+            if name == 'ul' or name == 'ol':
+                if closing:
+                    if lists:
+                        lists.pop()
+                else:
+                    lists.append(0 if name == 'ol' else None)
+            elif name == 'pre':
+                pre = pre - 1 if closing and pre else pre + (not closing)
+        elif name in _LINE_TAGS:
+            level = 1
+            if name == 'li' and not closing:
+                if lists and lists[-1] is not None:
+                    lists[-1] += 1
+                    bullet = f'{lists[-1]}. '
+                else:
+                    bullet = '- '
+                marker = '  ' * (len(lists) - 1 if lists else 0) + bullet
+        else:
+            continue  # outras tags inline
+        if (marker is None or name == 'li') and out and pending < level:
+            pending = level
+        line_start = True
+    # no início só sobram quebras de linha: os espaços iniciais de fora do <pre> já foram descartados
+    return ''.join(out).lstrip('\n').rstrip()
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+# Limites padrão por família de endpoint: (requisições por segundo, rajada máxima)
+DEFAULT_LIMITS = {
+    'curriculum': (10.0, 10),
+    'course': (10.0, 10),
+    'lecture': (20.0, 20),
+    'quiz': (20.0, 20),
+    'supplementary': (50.0, 50),
+    'captions': (30.0, 30),
+    'auth': (5.0, 5),
+    'default': (20.0, 20),
+}
+MIN_RATE = 0.5  # piso da taxa após sucessivas reduções por throttling
+DECREASE_FACTOR = 0.5  # redução multiplicativa da taxa ao receber 429/503
+INCREASE_STEP = 0.02  # fração da taxa configurada recuperada a cada resposta bem-sucedida
+MAX_RETRY_AFTER = 120.0  # maior pausa (em segundos) aceita de um Retry-After
+
+
+def parse_retry_after(value, default: float = 1.0) -> float:
+    """
+    Converte o cabeçalho Retry-After (segundos ou data HTTP) em segundos de espera.
+
+    Args:
+        value: Valor do cabeçalho (ou None).
+        default (float): Espera usada quando o cabeçalho está ausente ou é inválido.
+
+    Returns:
+        float: Segundos a aguardar, limitados a MAX_RETRY_AFTER.
+    """
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError, IndexError):
+            return default
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class TokenBucket:
+    """Balde de tokens com taxa ajustável (aumento aditivo, redução multiplicativa)."""
+
+    def __init__(self, rate: float, burst: int):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = max(int(burst), 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """Reserva um token e retorna quantos segundos esperar até que ele esteja disponível."""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1.0
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    def slow_down(self):
+        self.rate = max(MIN_RATE, self.rate * DECREASE_FACTOR)
+
+    def speed_up(self):
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * INCREASE_STEP)
+
+
+class RateLimiter:
+    """Limitador de requisições compartilhado por todas as threads (e pelo cliente assíncrono).
+
+    Cada família de endpoint tem seu próprio balde de tokens. Um Retry-After recebido em qualquer
+    família pausa todas as famílias até o prazo indicado.
+    """
+
+    def __init__(self, limits: dict = None):
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._paused_until = 0.0
+        self.enabled = True
+        self.throttled = 0
+        self.waited = 0.0
+        for family, (rate, burst) in (limits or DEFAULT_LIMITS).items():
+            self.configure(family, rate, burst)
+
+    def configure(self, family: str, rate: float = None, burst: int = None):
+        """
+        Define a taxa de uma família de endpoints.
+
+        Args:
+            family (str): Família ('curriculum', 'lecture', 'captions', 'supplementary', ...).
+            rate (float): Requisições por segundo. None remove o limite próprio da família, que passa a usar o
+                de 'default' (use rate_limiter.enabled = False para desligar o rate limiter).
+            burst (int): Rajada máxima permitida. Padrão: igual à taxa.
+        """
+        with self._lock:
+            if rate is None:
+                self._buckets.pop(family, None)
+            else:
+                self._buckets[family] = TokenBucket(rate, burst if burst is not None else max(rate, 1))
+
+    def reserve(self, family: str) -> float:
+        """Reserva uma requisição para a família e retorna quantos segundos aguardar antes de enviá-la."""
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._buckets.get(family) or self._buckets.get('default')
+            delay = bucket.reserve(now) if bucket else 0.0
+            delay = max(delay, self._paused_until - now)
+            self.waited += delay
+            return delay
+
+    def acquire(self, family: str):
+        """Bloqueia a thread atual até que a requisição possa ser enviada."""
+        delay = self.reserve(family)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, family: str):
+        """Versão assíncrona de acquire."""
+        delay = self.reserve(family)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def throttle(self, family: str, retry_after: float):
+        """Registra uma resposta 429/503: pausa todas as famílias e reduz a taxa da família afetada."""
+        with self._lock:
+            self.throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            bucket = self._buckets.get(family) or self._buckets.get('default')
+            if bucket:
+                bucket.slow_down()
+
+    def success(self, family: str):
+        """Registra uma resposta bem-sucedida, recuperando gradualmente a taxa da família."""
+        with self._lock:
+            bucket = self._buckets.get(family) or self._buckets.get('default')
+            if bucket:
+                bucket.speed_up()
+
+    def stats(self) -> dict:
+        """Retorna as taxas atuais por família e os contadores de throttling e espera."""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'throttled': self.throttled,
+                'waited_seconds': round(self.waited, 3),
+                'paused_for': max(0.0, round(self._paused_until - time.monotonic(), 3)),
+                'rates': {family: round(b.rate, 3) for family, b in self._buckets.items()},
+            }
@@ -0,0 +1,178 @@
+import sys
+from collections.abc import Mapping
+from .htmltext import html_to_text
+
+_MISSING = object()  # marca campos opcionais ausentes (não aparecem na visão de dicionário)
+
+
+class Record(Mapping):
+    """Registro imutável e compacto (__slots__) que também se comporta como um dicionário somente leitura.
+
+    Os campos são lidos como atributos (record.title) ou como chaves (record['title'], record.get('title'),
+    dict(record)), de modo que o código que recebia dicionários continua funcionando. Valores que se repetem
+    muito (listados em _interned) são internados para que milhares de registros compartilhem a mesma string.
+    """
+
+    __slots__ = ()
+    _keys = ()  # chave do dicionário equivalente de cada campo, na ordem de __slots__
+    _optional = ()  # campos omitidos da visão de dicionário quando não informados
+    _interned = ()  # campos de texto internados com sys.intern
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            value = values.pop(name, _MISSING if name in self._optional else None)
+            if name in self._interned and type(value) is str:
+                value = sys.intern(value)
+            object.__setattr__(self, name, value)
+        if values:
+            raise TypeError(f"{type(self).__name__} não tem o(s) campo(s): {', '.join(values)}")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._key_to_name = dict(zip(cls._keys, cls.__slots__))
+
+    def __getitem__(self, key):
+        name = self._key_to_name.get(key)
+        if name is None:
+            raise KeyError(key)
+        value = getattr(self, name)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        for key, name in zip(self._keys, self.__slots__):
+            if getattr(self, name) is not _MISSING:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} é imutável!")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} é imutável!")
+
+    def __reduce__(self):
+        return _restore, (type(self), {name: getattr(self, name) for name in self.__slots__
+                                       if getattr(self, name) is not _MISSING})
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__
+                           if getattr(self, name) is not _MISSING)
+        return f'{type(self).__name__}({fields})'
+
+    def to_dict(self) -> dict:
+        """Retorna uma cópia em dicionário comum (mutável)."""
+        return dict(self)
+
+
+def _restore(cls, values: dict):
+    return cls(**values)
+
+
+class LectureRef(Record):
+    """Referência a uma aula ou quiz do currículo.
+
+    Em parser_chapters traz 'asset_type', 'title', 'lecture_id', 'asset_id' (e 'type' nos quizzes);
+    em Course.get_lectures traz também 'section' e 'section_order'.
+    """
+
+    __slots__ = ('section', 'title', 'lecture_id', 'asset_id', 'asset_type', 'type', 'section_order')
+    _keys = __slots__
+    _optional = ('section', 'type', 'section_order')
+    _interned = ('asset_type', 'type')
+
+    def in_section(self, section: str, section_order) -> 'LectureRef':
+        """Retorna a aula no formato de Course.get_lectures, com o título e a ordem do capítulo."""
+        return LectureRef(section=section, title=self.title, lecture_id=self.lecture_id, asset_id=self.asset_id,
+                          asset_type=self.asset_type, section_order=section_order)
+
+
+class Chapter(Record):
+    """Capítulo do curso com suas aulas e quizzes (tupla de LectureRef)."""
+
+    __slots__ = ('title', 'chapter_index', 'lectures')
+    _keys = __slots__
+
+    def to_dict(self) -> dict:
+        data = dict(self)
+        data['lectures'] = [lecture.to_dict() for lecture in self.lectures]
+        return data
+
+
+class SupplementaryFile(Record):
+    """Arquivo suplementar (ou link externo) de uma aula, como retornado por extract_files."""
+
+    __slots__ = ('lecture_id', 'asset_id', 'asset_type', 'filename', 'title', 'lecture_title', 'external_link')
+    _keys = ('lecture_id', 'asset_id', 'asset_type', 'filename', 'title', 'lecture_title', 'ExternalLink')
+    _interned = ('asset_type',)
+
+
+class Assessment(Record):
+    """Pergunta de um quiz, como retornada por Course.get_all_quizzes.
+
+    O enunciado, as alternativas e os comentários vêm do 'prompt' da API (em HTML); 'related_lectures'
+    traz os IDs das aulas relacionadas.
+    """
+
+    __slots__ = ('id', 'assessment_type', 'question', 'answers', 'feedbacks', 'explanation', 'correct_response',
+                 'section', 'question_plain', 'related_lectures')
+    _keys = __slots__
+    _interned = ('assessment_type', 'section')
+
+    @classmethod
+    def from_api(cls, data: dict) -> 'Assessment':
+        """Monta a pergunta a partir de um item de 'results' das perguntas do quiz."""
+        prompt = data.get('prompt') or {}
+        related = data.get('related_lectures') or ()
+        return cls(id=data.get('id'), assessment_type=data.get('assessment_type', ''),
+                   question=prompt.get('question', ''), answers=tuple(prompt.get('answers') or ()),
+                   feedbacks=tuple(prompt.get('feedbacks') or ()), explanation=prompt.get('explanation', ''),
+                   correct_response=tuple(data.get('correct_response') or ()), section=data.get('section', ''),
+                   question_plain=data.get('question_plain', ''),
+                   related_lectures=tuple(r.get('id') if isinstance(r, dict) else r for r in related))
+
+    @property
+    def question_text(self) -> str:
+        """Enunciado em texto puro."""
+        return html_to_text(self.question)
+
+    @property
+    def answers_text(self) -> tuple:
+        """Alternativas em texto puro."""
+        return tuple(html_to_text(answer) for answer in self.answers)
+
+    @property
+    def explanation_text(self) -> str:
+        """Explicação da resposta em texto puro."""
+        return html_to_text(self.explanation)
+
+
+class QuizRecord(Record):
+    """Quiz do curso com seus metadados e todas as perguntas (tupla de Assessment).
+
+    Quizzes que não puderam ser obtidos trazem a exceção em 'error' e nenhuma pergunta.
+    """
+
+    __slots__ = ('quiz_id', 'title', 'type', 'section', 'section_order', 'description', 'duration',
+                 'pass_percent', 'num_assessments', 'assessments', 'error')
+    _keys = __slots__
+    _optional = ('error',)
+    _interned = ('type',)
+
+    @property
+    def ok(self) -> bool:
+        """Retorna True se o quiz foi obtido com sucesso."""
+        return self.get('error') is None
+
+    @property
+    def description_text(self) -> str:
+        """Descrição do quiz em texto puro."""
+        return html_to_text(self.description)
+
+    def to_dict(self) -> dict:
+        data = dict(self)
+        data['assessments'] = [assessment.to_dict() for assessment in self.assessments]
+        return data
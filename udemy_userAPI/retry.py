@@ -0,0 +1,262 @@
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .exeptions import CircuitOpenException
+from .ratelimit import parse_retry_after
+
+MAX_ATTEMPTS = 4  # tentativas totais de um GET (1 original + 3 novas tentativas)
+BACKOFF_BASE = 0.5  # espera base (segundos) da primeira nova tentativa
+BACKOFF_MAX = 20.0  # maior espera entre tentativas
+RETRY_STATUS = (500, 502, 503, 504)  # respostas consideradas falhas transitórias
+THROTTLE_STATUS = (429, 503)  # respostas tratadas como pedido para desacelerar
+THROTTLE_RETRIES = 3  # reenvios de um GET após respeitar o Retry-After
+BUDGET_RATIO = 0.2  # novas tentativas permitidas por requisição enviada (20%)
+BUDGET_RESERVE = 10.0  # saldo inicial (e mínimo garantido) de novas tentativas
+FAILURE_THRESHOLD = 5  # falhas consecutivas que abrem o circuito
+RESET_TIMEOUT = 30.0  # segundos com o circuito aberto antes de uma requisição de teste
+
+
+class RetryPolicy:
+    """Política de novas tentativas com backoff exponencial, jitter e orçamento global.
+
+    O orçamento impede que uma falha generalizada multiplique o tráfego: cada requisição enviada
+    deposita BUDGET_RATIO no saldo e cada nova tentativa consome 1.
+    """
+
+    def __init__(self, max_attempts: int = MAX_ATTEMPTS, backoff_base: float = BACKOFF_BASE,
+                 backoff_max: float = BACKOFF_MAX, budget_ratio: float = BUDGET_RATIO,
+                 budget_reserve: float = BUDGET_RESERVE):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.budget_ratio = budget_ratio
+        self.budget_reserve = budget_reserve
+        self._lock = threading.Lock()
+        self._budget = budget_reserve
+        self.retries = 0
+        self.exhausted = 0
+
+    def record_request(self):
+        """Registra uma requisição original, alimentando o orçamento de novas tentativas."""
+        with self._lock:
+            self._budget = min(self._budget + self.budget_ratio, self.budget_reserve * 10)
+
+    def should_retry(self, attempt: int) -> bool:
+        """
+        Decide se uma requisição que falhou pode ser tentada novamente.
+
+        Args:
+            attempt (int): Número de tentativas já feitas (a original conta como 1).
+
+        Returns:
+            bool: True se ainda há tentativas e orçamento disponíveis (o orçamento é consumido).
+        """
+        if attempt >= self.max_attempts:
+            return False
+        return self.spend_budget()
+
+    def spend_budget(self) -> bool:
+        """Consome uma nova tentativa do orçamento; retorna False se não houver saldo."""
+        with self._lock:
+            if self._budget < 1.0:
+                self.exhausted += 1
+                return False
+            self._budget -= 1.0
+            self.retries += 1
+            return True
+
+    def backoff(self, attempt: int) -> float:
+        """Retorna a espera antes da próxima tentativa (backoff exponencial com jitter completo)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'retries': self.retries, 'budget_exhausted': self.exhausted, 'budget': round(self._budget, 2)}
+
+
+class CircuitBreaker:
+    """Disjuntor por host: após FAILURE_THRESHOLD falhas seguidas, recusa requisições por RESET_TIMEOUT segundos.
+
+    Passado esse tempo, uma única requisição de teste é liberada; se ela funcionar o circuito fecha,
+    caso contrário volta a abrir.
+    """
+
+    def __init__(self, host: str, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = 'closed'
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def before_request(self):
+        """
+        Verifica se a requisição pode ser enviada.
+
+        Raises:
+            CircuitOpenException: Se o circuito estiver aberto.
+        """
+        with self._lock:
+            if self._state == 'open' and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = 'half_open'
+                self._trial = False
+            if self._state == 'half_open' and not self._trial:
+                self._trial = True
+                return
+            if self._state == 'closed':
+                return
+            self.rejected += 1
+            remaining = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenException(f"Circuito aberto para {self.host}: a Udemy está instável, "
+                                   f"nova tentativa em {remaining:.0f}s.")
+
+    def record_success(self):
+        with self._lock:
+            self._state = 'closed'
+            self._failures = 0
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == 'half_open' or self._failures >= self.failure_threshold:
+                self._state = 'open'
+                self._opened_at = time.monotonic()
+                self._trial = False
+
+
+class CircuitBreakers:
+    """Registro de disjuntores, um por host."""
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._breakers = {}
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(host, self.failure_threshold, self.reset_timeout)
+                self._breakers[host] = breaker
+            return breaker
+
+    def reset(self):
+        with self._lock:
+            self._breakers.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {host: {'state': b.state, 'rejected': b.rejected} for host, b in self._breakers.items()}
+
+
+class RequestAttempts:
+    """Decide, a cada tentativa de uma requisição, se e quando ela deve ser reenviada.
+
+    Reúne o rate limiter, a política de novas tentativas e o disjuntor do host em um único lugar, usado pelo
+    cliente síncrono (UdemyAdapter) e pelo assíncrono (AsyncUdemy), que só enviam e aguardam:
+
+        attempts = RequestAttempts(url, family, retry_policy, circuit_breakers, rate_limiter)
+        while True:
+            sleep(attempts.before_send())
+            ... envia; em erro de conexão: delay = attempts.on_error() ...
+            delay = attempts.on_response(status, retry_after)
+            if delay is None: return resposta
+            sleep(delay)
+
+    - 429/503: respeita o Retry-After (pausa global) e reenvia até THROTTLE_RETRIES vezes; esses reenvios não
+      contam no limite de tentativas, mas consomem o orçamento da RetryPolicy.
+    - Erros de conexão, timeouts e 5xx: novas tentativas com backoff exponencial e jitter.
+    - Requisições não idempotentes (retryable=False) nunca são reenviadas.
+    """
+
+    def __init__(self, url: str, family: str, policy: RetryPolicy, breakers: CircuitBreakers, limiter,
+                 retryable: bool = True):
+        """
+        Args:
+            url (str): URL da requisição (escolhe o disjuntor do host).
+            family (str): Família do endpoint no rate limiter.
+            policy (RetryPolicy): Política de novas tentativas.
+            breakers (CircuitBreakers): Disjuntores por host.
+            limiter (RateLimiter): Limitador de requisições.
+            retryable (bool): Se False (ex.: POST), a requisição é enviada uma única vez.
+        """
+        self.family = family
+        self.policy = policy
+        self.limiter = limiter
+        self.retryable = retryable
+        self.breaker = breakers.for_url(url)
+        self.attempts = 0
+        self.throttles = 0
+        policy.record_request()
+
+    def before_send(self) -> float:
+        """
+        Verifica o disjuntor e reserva a vez da tentativa no rate limiter.
+
+        Returns:
+            float: Segundos a aguardar antes de enviar.
+
+        Raises:
+            CircuitOpenException: Se o circuito do host estiver aberto.
+        """
+        self.breaker.before_request()
+        self.attempts += 1
+        return self.limiter.reserve(self.family)
+
+    def on_error(self, transient: bool = True):
+        """
+        Registra um erro de envio.
+
+        Args:
+            transient (bool): True para erros de conexão e timeouts, que podem passar numa nova tentativa.
+
+        Returns:
+            float | None: Segundos a aguardar antes de reenviar, ou None para desistir e propagar o erro.
+        """
+        self.breaker.record_failure()
+        if transient and self.retryable and self.policy.should_retry(self.attempts):
+            return self.policy.backoff(self.attempts)
+        return None
+
+    def on_response(self, status: int, retry_after=None):
+        """
+        Registra a resposta de uma tentativa.
+
+        Args:
+            status (int): Código de status HTTP.
+            retry_after: Cabeçalho Retry-After da resposta (ou None).
+
+        Returns:
+            float | None: Segundos a aguardar antes de reenviar, ou None para entregar a resposta.
+        """
+        if status in THROTTLE_STATUS:
+            self.limiter.throttle(self.family, parse_retry_after(retry_after))
+            if status == 429:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+            if self.retryable and self.throttles < THROTTLE_RETRIES and self.policy.spend_budget():
+                self.throttles += 1
+                self.attempts -= 1
+                return 0.0  # a pausa do Retry-After é aplicada pelo rate limiter em before_send
+            return None
+        if status in RETRY_STATUS:
+            self.breaker.record_failure()
+            if self.retryable and self.policy.should_retry(self.attempts):
+                return self.policy.backoff(self.attempts)
+            return None
+        self.breaker.record_success()
+        self.limiter.success(self.family)
+        return None
@@ -0,0 +1,298 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+from typing import Iterable
+
+SEARCH_INDEX_FILE = 'captions_index.sqlite3'
+SEARCH_INDEX_CACHE_KB = 32 * 1024  # cache de páginas do SQLite por conexão
+BULK_COMMIT_EVERY = 200  # aulas por transação em CaptionIndex.bulk()
+SEARCH_INDEX_VERSION = 2  # índices de outra versão são recriados ao abrir
+_WORD = re.compile(r'\w+')
+
+caption_index = None  # índice padrão, criado em get_caption_index()
+_index_lock = threading.Lock()
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Divide um texto em termos de busca: minúsculas, sem acentos, apenas letras e números.
+
+    Args:
+        text (str): O texto.
+
+    Returns:
+        list[str]: Os termos, na ordem do texto.
+    """
+    text = text.casefold()
+    if not text.isascii():
+        text = ''.join(ch for ch in unicodedata.normalize('NFKD', text) if not unicodedata.combining(ch))
+    return _WORD.findall(text)
+
+
+class CaptionIndex:
+    """Índice invertido (SQLite) das legendas: cada termo aponta para (curso, aula, início da cue).
+
+    É montado aula por aula; cada aula guarda uma assinatura da legenda indexada (id, idioma e data), de modo
+    que reconstruir o índice de um curso só baixa as legendas novas ou alteradas. Como o DiskCache, cada
+    thread usa sua própria conexão e o banco roda em modo WAL.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Caminho do arquivo SQLite.
+        """
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._terms = {}  # termo -> id
+        conn = self._connection()
+        if conn.execute('PRAGMA user_version').fetchone()[0] != SEARCH_INDEX_VERSION:
+            # a versão 1 chaveava as cues pelo início, e cues que começam juntas se sobrescreviam
+            for table in ('terms', 'postings', 'cues', 'lectures'):
+                conn.execute(f'DROP TABLE IF EXISTS {table}')
+            conn.execute(f'PRAGMA user_version = {SEARCH_INDEX_VERSION}')
+        conn.execute('CREATE TABLE IF NOT EXISTS terms (id INTEGER PRIMARY KEY, term TEXT UNIQUE NOT NULL)')
+        conn.execute('CREATE TABLE IF NOT EXISTS postings ('
+                     'term_id INTEGER, course_id INTEGER, lecture_id INTEGER, seq INTEGER, '
+                     'PRIMARY KEY (term_id, course_id, lecture_id, seq)) WITHOUT ROWID')
+        conn.execute('CREATE TABLE IF NOT EXISTS cues ('
+                     'course_id INTEGER, lecture_id INTEGER, seq INTEGER, start_ms INTEGER, end_ms INTEGER, text TEXT, '
+                     'PRIMARY KEY (course_id, lecture_id, seq)) WITHOUT ROWID')  # seq: ordem da cue na aula
+        conn.execute('CREATE TABLE IF NOT EXISTS lectures ('
+                     'course_id INTEGER, lecture_id INTEGER, locale TEXT, signature TEXT, cues INTEGER, '
+                     'indexed_at REAL, PRIMARY KEY (course_id, lecture_id))')
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(f'PRAGMA cache_size=-{SEARCH_INDEX_CACHE_KB}')
+            self._local.conn = conn
+        return conn
+
+    def signature(self, course_id: int, lecture_id: int):
+        """Retorna a assinatura da legenda indexada para a aula, ou None se ela ainda não foi indexada."""
+        row = self._connection().execute('SELECT signature FROM lectures WHERE course_id = ? AND lecture_id = ?',
+                                         (course_id, lecture_id)).fetchone()
+        return row[0] if row else None
+
+    def add_lecture(self, course_id: int, lecture_id: int, cues: Iterable, locale: str = None,
+                    signature: str = None) -> int:
+        """
+        Indexa (ou reindexa) as cues de uma aula, substituindo o que havia para ela.
+
+        Args:
+            course_id (int): ID do curso.
+            lecture_id (int): ID da aula.
+            cues (Iterable): Cues da legenda (CueTable ou tuplas (início_ms, fim_ms, texto)).
+            locale (str): Idioma da legenda.
+            signature (str): Identifica a versão da legenda; usada para pular aulas que não mudaram.
+
+        Returns:
+            int: Número de cues indexadas.
+        """
+        rows, words = [], {}
+        for seq, (start, end, text) in enumerate(cues):
+            rows.append((course_id, lecture_id, seq, start, end, text))
+            for term in set(tokenize(text)):
+                words.setdefault(term, []).append(seq)
+
+        def write(conn):
+            self.__delete(conn, 'course_id = ? AND lecture_id = ?', (course_id, lecture_id))
+            ids = self.__ids(conn, list(words), create=True)
+            # em ordem de chave as inserções caem nas mesmas páginas da árvore
+            conn.executemany('INSERT INTO postings VALUES (?, ?, ?, ?)',
+                             sorted((ids[term], course_id, lecture_id, seq)
+                                    for term, seqs in words.items() for seq in seqs))
+            conn.executemany('INSERT INTO cues VALUES (?, ?, ?, ?, ?, ?)', rows)
+            conn.execute('INSERT OR REPLACE INTO lectures VALUES (?, ?, ?, ?, ?, ?)',
+                         (course_id, lecture_id, locale, signature, len(rows), time.time()))
+
+        self.__write(write)
+        return len(rows)
+
+    def remove_course(self, course_id: int):
+        """Remove do índice todas as aulas de um curso."""
+        self.__write(lambda conn: self.__delete(conn, 'course_id = ?', (course_id,)))
+
+    @contextmanager
+    def bulk(self, commit_every: int = BULK_COMMIT_EVERY):
+        """
+        Agrupa as gravações feitas dentro do bloco em transações de várias aulas.
+
+        Uma aula toca centenas de páginas do índice (uma por termo); confirmando várias aulas juntas, cada
+        página é gravada uma vez por transação em vez de uma vez por aula. Outras threads que gravarem no
+        índice aguardam o fim do bloco.
+
+        Args:
+            commit_every (int): Número de aulas por transação; o restante é confirmado ao sair do bloco.
+        """
+        with self._write_lock:
+            conn = self._connection()
+            conn.execute('BEGIN IMMEDIATE')
+            self._local.bulk = [0, max(1, commit_every)]
+            try:
+                yield self
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                self._terms.clear()
+                raise
+            finally:
+                self._local.bulk = None
+
+    def __write(self, func):
+        with self._write_lock:
+            conn = self._connection()
+            bulk = getattr(self._local, 'bulk', None)
+            if bulk is None:
+                conn.execute('BEGIN IMMEDIATE')
+                end, undo = 'COMMIT', 'ROLLBACK'
+            else:
+                conn.execute('SAVEPOINT lecture')
+                end, undo = 'RELEASE lecture', 'ROLLBACK TO lecture'
+            try:
+                func(conn)
+            except BaseException:
+                conn.execute(undo)
+                if bulk is not None:
+                    conn.execute('RELEASE lecture')
+                self._terms.clear()  # ids de termos criados na transação desfeita deixaram de existir
+                raise
+            conn.execute(end)
+            if bulk is not None:
+                bulk[0] += 1
+                if bulk[0] % bulk[1] == 0:
+                    conn.execute('COMMIT')
+                    conn.execute('BEGIN IMMEDIATE')
+
+    def __delete(self, conn: sqlite3.Connection, where: str, params: tuple):
+        # as postings são chaveadas pelo termo: os termos a remover saem do texto das cues antigas
+        old = {}
+        for course_id, lecture_id, text in conn.execute(f'SELECT course_id, lecture_id, text FROM cues WHERE {where}',
+                                                        params):
+            old.setdefault((course_id, lecture_id), set()).update(tokenize(text))
+        for (course_id, lecture_id), terms in old.items():
+            ids = self.__ids(conn, list(terms))
+            conn.executemany('DELETE FROM postings WHERE term_id = ? AND course_id = ? AND lecture_id = ?',
+                             ((ids[term], course_id, lecture_id) for term in terms if term in ids))
+        conn.execute(f'DELETE FROM cues WHERE {where}', params)
+        conn.execute(f'DELETE FROM lectures WHERE {where}', params)
+
+    def __ids(self, conn: sqlite3.Connection, terms: list, create: bool = False) -> dict:
+        # os termos nunca são apagados, então o id de cada um pode ficar em memória
+        missing = [term for term in terms if term not in self._terms]
+        if missing:
+            if create:
+                conn.executemany('INSERT OR IGNORE INTO terms (term) VALUES (?)', ((term,) for term in missing))
+            self._terms.update(self.__term_ids(conn, missing))
+        return self._terms
+
+    @staticmethod
+    def __term_ids(conn: sqlite3.Connection, terms: list) -> dict:
+        ids = {}
+        for i in range(0, len(terms), 500):  # limite de parâmetros por consulta do SQLite
+            chunk = terms[i:i + 500]
+            ids.update(conn.execute(f'SELECT term, id FROM terms WHERE term IN ({",".join("?" * len(chunk))})',
+                                    chunk).fetchall())
+        return ids
+
+    def search(self, query: str, course_ids: list = None, limit: int = 50) -> list[dict]:
+        """
+        Procura as cues que contêm todos os termos da consulta.
+
+        Args:
+            query (str): Os termos (maiúsculas e acentos são ignorados).
+            course_ids (list): Restringe a busca a esses cursos. None busca em todos.
+            limit (int): Número máximo de resultados.
+
+        Returns:
+            list[dict]: 'course_id', 'lecture_id', 'start_ms', 'end_ms' e 'text' de cada cue encontrada,
+                ordenadas por curso, aula e posição na legenda.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        conn = self._connection()
+        ids = self.__ids(conn, terms)
+        if any(term not in ids for term in terms):
+            return []
+        # começa pelo termo mais raro: as demais listas só são consultadas para os candidatos dele
+        counts = {term: conn.execute('SELECT COUNT(*) FROM (SELECT 1 FROM postings WHERE term_id = ? LIMIT 100000)',
+                                     (ids[term],)).fetchone()[0] for term in terms}
+        terms.sort(key=counts.__getitem__)
+        course_filter, params = '', []
+        if course_ids is not None:
+            course_ids = list(course_ids)
+            if not course_ids:
+                return []
+            course_filter = f' AND p0.course_id IN ({",".join("?" * len(course_ids))})'
+            params = course_ids
+        joins = ''.join(f' JOIN postings p{i} ON p{i}.term_id = ? AND p{i}.course_id = p0.course_id '
+                        f'AND p{i}.lecture_id = p0.lecture_id AND p{i}.seq = p0.seq'
+                        for i in range(1, len(terms)))
+        sql = ('SELECT c.course_id, c.lecture_id, c.start_ms, c.end_ms, c.text FROM postings p0' + joins +
+               ' JOIN cues c ON c.course_id = p0.course_id AND c.lecture_id = p0.lecture_id '
+               'AND c.seq = p0.seq WHERE p0.term_id = ?' + course_filter +
+               ' ORDER BY p0.course_id, p0.lecture_id, p0.seq LIMIT ?')
+        rows = conn.execute(sql, [ids[term] for term in terms[1:]] + [ids[terms[0]]] + params + [limit])
+        return [{'course_id': course_id, 'lecture_id': lecture_id, 'start_ms': start, 'end_ms': end, 'text': text}
+                for course_id, lecture_id, start, end, text in rows]
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def stats(self) -> dict:
+        conn = self._connection()
+        courses, lectures, cues = conn.execute(
+            'SELECT COUNT(DISTINCT course_id), COUNT(*), COALESCE(SUM(cues), 0) FROM lectures').fetchone()
+        terms = conn.execute('SELECT COUNT(*) FROM terms').fetchone()[0]
+        return {'path': self.path, 'courses': courses, 'lectures': lectures, 'cues': cues, 'terms': terms,
+                'size': os.path.getsize(self.path) if os.path.isfile(self.path) else 0}
+
+
+def get_caption_index(path: str = None) -> CaptionIndex:
+    """
+    Retorna o índice de legendas padrão, criando-o no primeiro uso.
+
+    Args:
+        path (str): Arquivo SQLite. Padrão: 'captions_index.sqlite3' no diretório .cache da biblioteca.
+            Informar um caminho diferente do atual troca o índice padrão.
+
+    Returns:
+        CaptionIndex: O índice.
+    """
+    global caption_index
+    if path is None:
+        cache_dir = os.path.join(os.path.dirname(__file__), '.cache')
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, SEARCH_INDEX_FILE)
+    with _index_lock:
+        if caption_index is None or caption_index.path != path:
+            caption_index = CaptionIndex(path)
+        return caption_index
+
+
+def search_captions(query: str, course_ids: list = None, limit: int = 50) -> list[dict]:
+    """
+    Procura um trecho nas legendas já indexadas (ver Course.index_captions).
+
+    Args:
+        query (str): Os termos procurados.
+        course_ids (list): Restringe a busca a esses cursos. None busca em todos.
+        limit (int): Número máximo de resultados.
+
+    Returns:
+        list[dict]: 'course_id', 'lecture_id', 'start_ms', 'end_ms' e 'text' de cada cue encontrada.
+    """
+    return get_caption_index().search(query, course_ids=course_ids, limit=limit)
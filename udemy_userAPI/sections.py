@@ -1,6 +1,29 @@
-import json
+import math
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterator
 import requests
-from .exeptions import UdemyUserApiExceptions, LoginException
+from .exeptions import UdemyUserApiExceptions, LoginException, CircuitOpenException
+from .cache import memoized
+from .session import get_session, decode_json
+
+PAGE_WORKERS = 8  # páginas do currículo baixadas em paralelo
+CURRICULUM_PAGE_SIZE = 1000
+
+SUBSCRIBED_COURSES_URL = ("https://www.udemy.com/api-2.0/users/me/subscribed-courses/?page_size=1000"
+                          "&ordering=-last_accessed&fields[course]=image_240x135,title,completion_ratio&"
+                          "is_archived=false")
+SUBSCRIPTION_ENROLLMENTS_URL = (
+    "https://www.udemy.com/api-2.0/users/me/subscription-course-enrollments/?"
+    "fields[course]=@min,visible_instructors,image_240x135,image_480x270,completion_ratio,"
+    "last_accessed_time,enrollment_time,is_practice_test_course,features,num_collections,"
+    "published_title,buyable_object_type,remaining_time,is_assigned,next_to_watch_item,"
+    "is_in_user_subscription&fields[user]=@min&ordering=-last_accessed&page_size=1000&"
+    "max_progress=99.9&fields[lecture]=@min,content_details,asset,url,thumbnail_url,"
+    "last_watched_second,object_index&fields[quiz]=@min,content_details,asset,url,object_index&"
+    "fields[practice]=@min,content_details,asset,estimated_duration,learn_url,object_index")
 
 
 def get_courses_plan(tipe: str) -> list:
@@ -15,48 +38,145 @@ def get_courses_plan(tipe: str) -> list:
         raise LoginException("Sessão expirada!")
     courses_data = []
     if tipe == 'default':
-        response = requests.get(f"https://www.udemy.com/api-2.0/users/me/subscribed-courses/?page_size=1000"
-                                f"&ordering=-last_accessed&fields[course]=image_240x135,title,completion_ratio&"
-                                f"is_archived=false",
-                                headers=HEADERS_USER)
+        response = get_session().get(SUBSCRIBED_COURSES_URL, headers=HEADERS_USER)
         if response.status_code == 200:
-            r = json.loads(response.text)
+            r = decode_json(response.content)
             results = r.get("results", None)
             if results:
                 courses_data.append(results)
         else:
-            r = json.loads(response.text)
+            r = decode_json(response.content)
             raise UdemyUserApiExceptions(f"Error obtain courses 'default' -> {r}")
     elif tipe == 'plan':
-        response2 = requests.get(
-            url="https://www.udemy.com/api-2.0/users/me/subscription-course-enrollments/?"
-                "fields[course]=@min,visible_instructors,image_240x135,image_480x270,completion_ratio,"
-                "last_accessed_time,enrollment_time,is_practice_test_course,features,num_collections,"
-                "published_title,buyable_object_type,remaining_time,is_assigned,next_to_watch_item,"
-                "is_in_user_subscription&fields[user]=@min&ordering=-last_accessed&page_size=1000&"
-                "max_progress=99.9&fields[lecture]=@min,content_details,asset,url,thumbnail_url,"
-                "last_watched_second,object_index&fields[quiz]=@min,content_details,asset,url,object_index&"
-                "fields[practice]=@min,content_details,asset,estimated_duration,learn_url,object_index",
-            headers=HEADERS_USER)
+        response2 = get_session().get(url=SUBSCRIPTION_ENROLLMENTS_URL, headers=HEADERS_USER)
         if response2.status_code == 200:
-            r = json.loads(response2.text)
+            r = decode_json(response2.content)
             results2 = r.get("results", None)
             if results2:
                 courses_data.append(results2)
         else:
-            r = json.loads(response2.text)
+            r = decode_json(response2.content)
             raise UdemyUserApiExceptions(f"Error obtain courses 'plan' -> {r}")
     else:
         raise UdemyUserApiExceptions("Atenção dev! os parametros são : 'plan' e 'default'")
     return courses_data
 
 
-def get_details_courses(course_id):
+def remaining_page_urls(first_page: dict, page_size: int) -> list[str]:
+    """
+    Calcula as URLs das páginas restantes de um recurso paginado a partir da primeira página.
+
+    Usa o campo 'count' da primeira resposta e o link 'next' como modelo, permitindo que as
+    páginas restantes sejam pedidas simultaneamente. O número de páginas é calculado com o tamanho que
+    o servidor de fato usou (os itens da primeira página), já que a Udemy pode limitar o page_size pedido.
+
+    Args:
+        first_page (dict): Primeira página já decodificada (com 'count', 'next' e 'results').
+        page_size (int): Tamanho de página pedido, usado apenas se a primeira página vier sem itens.
+
+    Returns:
+        list[str]: URLs das páginas 2..N, ou lista vazia se não houver próxima página ou 'count'.
+    """
+    next_page = first_page.get('next')
+    count = first_page.get('count')
+    if not next_page or not count:
+        return []
+    # havendo próxima página, a primeira está cheia: seu tamanho é o que o servidor aplicou
+    page_size = len(first_page.get('results') or ()) or page_size
+    total_pages = math.ceil(count / page_size)
+    if re.search(r'[?&]page=\d+', next_page):
+        return [re.sub(r'([?&])page=\d+', rf'\g<1>page={page}', next_page, count=1)
+                for page in range(2, total_pages + 1)]
+    sep = '&' if '?' in next_page else '?'
+    return [f'{next_page}{sep}page={page}' for page in range(2, total_pages + 1)]
+
+
+def _get_curriculum_page(url: str) -> dict:
+    """Baixa e decodifica uma página do currículo."""
+    from .api import HEADERS_USER
+    try:
+        resp = get_session().get(url, headers=HEADERS_USER)
+    except requests.RequestException as e:
+        raise UdemyUserApiExceptions(f"Erro ao obter página do currículo! {e}")
+    if resp.status_code != 200:
+        # Falhas transitórias já foram repetidas pela sessão (ver retry.py); um currículo
+        # truncado é pior que um erro.
+        raise UdemyUserApiExceptions(
+            f"Erro ao obter página do currículo! Código de status: {resp.status_code}")
+    return decode_json(resp.content)
+
+
+def _follow_next_pages(next_page: str) -> Iterator[dict]:
+    """Segue os links 'next' um a um, a partir de next_page."""
+    while next_page:
+        page = _get_curriculum_page(next_page)
+        next_page = page.get('next')
+        yield page
+
+
+def iter_curriculum_pages(course_id, fields=None, page_size: int = CURRICULUM_PAGE_SIZE) -> Iterator[dict]:
+    """
+    Entrega as páginas do currículo de um curso, em ordem, à medida que chegam.
+
+    Com o 'count' da primeira página, as seguintes são baixadas em paralelo, mas no máximo PAGE_WORKERS
+    páginas ficam adiantadas, de modo que a memória não cresce com o tamanho do curso. Se a última página
+    calculada ainda apontar para uma próxima, os links 'next' são seguidos até o fim.
+
+    Args:
+        course_id (int): ID do curso.
+        fields: Grupos de campos opcionais do currículo (chaves de CURRICULUM_FIELD_GROUPS). None pede todos.
+        page_size (int): Itens por página.
+
+    Yields:
+        dict: Cada página decodificada (com 'count', 'next' e 'results').
+
+    Raises:
+        LoginException: Se a sessão estiver expirada.
+        UdemyUserApiExceptions: Se alguma página não puder ser obtida.
+    """
+    from .api import curriculum_url
+    from .authenticate import UdemyAuth
+    auth = UdemyAuth()
+    if not auth.verif_login():
+        raise LoginException("Sessão expirada!")
+
+    first_page = _get_curriculum_page(curriculum_url(course_id, page_size=page_size, fields=fields))
+    pages = remaining_page_urls(first_page, page_size)
+    next_page = first_page.get('next')
+    yield first_page
+    del first_page
+
+    if pages:
+        # Janela deslizante: ao consumir uma página, a próxima da fila é pedida
+        urls = iter(pages)
+        with ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, len(pages))) as executor:
+            pending = deque(executor.submit(_get_curriculum_page, url) for url in islice(urls, PAGE_WORKERS))
+            try:
+                while pending:
+                    page = pending.popleft().result()
+                    url = next(urls, None)
+                    if url is not None:
+                        pending.append(executor.submit(_get_curriculum_page, url))
+                    next_page = page.get('next')
+                    yield page
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    # Sem 'count' (ou com mais páginas que o previsto), segue os links 'next' um a um
+    yield from _follow_next_pages(next_page)
+
+
+def get_details_courses(course_id, fields=None):
     """
     Obtém detalhes de um curso específico, realizando paginação caso haja múltiplas páginas.
 
+    Se a quantidade de itens obtidos não bater com o 'count' da primeira página, a paginação é refeita
+    seguindo os links 'next' um a um, em vez de devolver um currículo incompleto.
+
     Args:
         course_id (int): ID do curso.
+        fields: Grupos de campos opcionais do currículo (chaves de CURRICULUM_FIELD_GROUPS). None pede todos.
 
     Returns:
         dict: Dicionário contendo os detalhes do curso com todos os itens concatenados.
@@ -65,54 +185,37 @@ def get_details_courses(course_id):
         LoginException: Se a sessão estiver expirada.
         UdemyUserApiExceptions: Se houver erro ao obter os detalhes do curso.
     """
-    from .api import HEADERS_USER
     from .authenticate import UdemyAuth
     auth = UdemyAuth()
     if not auth.verif_login():
         raise LoginException("Sessão expirada!")
 
-    # URL base com parâmetros
-    base_url = (
-        f"https://www.udemy.com/api-2.0/courses/{course_id}/subscriber-curriculum-items/?"
-        f"page_size=1000&"
-        f"fields[lecture]=title,object_index,is_published,sort_order,created,asset,supplementary_assets,is_free&"
-        f"fields[quiz]=title,object_index,is_published,sort_order,type&"
-        f"fields[practice]=title,object_index,is_published,sort_order&"
-        f"fields[chapter]=title,object_index,is_published,sort_order&"
-        f"fields[asset]=title,filename,asset_type,status,time_estimation,is_external&"
-        f"caching_intent=True"
-    )
-
     try:
-        response = requests.get(base_url, headers=HEADERS_USER)
-        if response.status_code != 200:
-            raise UdemyUserApiExceptions(
-                f"Erro ao obter detalhes do curso! Código de status: {response.status_code}")
-
-        data = json.loads(response.text)
-        all_results = data.get('results', [])
-        next_page = data.get('next', '')
-
-        # Enquanto houver próxima página, faz requisição e junta os resultados
-        while next_page:
-            response = requests.get(next_page, headers=HEADERS_USER)
-            if response.status_code != 200:
-                # Caso ocorra erro na próxima página, pode-se optar por interromper ou registrar o erro.....por enquanto
-                # irei parar..mais se por acaso futuramente não der certo mudarei esta implementação!
-                # @pauloCesarDev404
-                break
-            next_data = json.loads(response.text)
-            all_results.extend(next_data.get('results', []))
-            next_page = next_data.get('next', '')
+        pages = iter_curriculum_pages(course_id, fields=fields)
+        data = next(pages)
+        first_results = data.get('results', [])
+        all_results = list(first_results)
+        # As páginas chegam na ordem do servidor (por sort_order)
+        for page in pages:
+            all_results.extend(page.get('results', []))
+        count = data.get('count')
+        if count and len(all_results) != count and data.get('next'):
+            all_results = list(first_results)
+            for page in _follow_next_pages(data.get('next')):
+                all_results.extend(page.get('results', []))
 
         # Atualiza o dicionário final com todos os itens concatenados
         data['results'] = all_results
+        data['next'] = None
         return data
 
+    except CircuitOpenException:
+        raise
     except Exception as e:
         raise UdemyUserApiExceptions(f"Erro ao obter detalhes do curso! {e}")
 
 
+@memoized(ttl=3600)
 def get_course_infor(course_id):
     """
     Obtém informações de um curso específico.
@@ -127,17 +230,14 @@ def get_course_infor(course_id):
         LoginException: Se a sessão estiver expirada.
         UdemyUserApiExceptions: Se houver erro ao obter as informações do curso.
     """
-    from .api import HEADERS_USER
+    from .api import HEADERS_USER, course_infor_url
     from .authenticate import UdemyAuth
     auth = UdemyAuth()
     if not auth.verif_login():
         raise LoginException("Sessão expirada!")
-    end_point = (
-        f'https://www.udemy.com/api-2.0/courses/{course_id}/?fields[course]=title,context_info,primary_category,'
-        'primary_subcategory,avg_rating_recent,visible_instructors,locale,estimated_content_length,'
-        'num_subscribers')
-    response = requests.get(end_point, headers=HEADERS_USER)
+    end_point = course_infor_url(course_id)
+    response = get_session().get(end_point, headers=HEADERS_USER)
     if response.status_code == 200:
-        return json.loads(response.text)
+        return decode_json(response.content)
     else:
         raise UdemyUserApiExceptions("Erro ao obter informações do curso!")
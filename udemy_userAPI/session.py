@@ -0,0 +1,443 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import orjson
+except ImportError:  # dependência opcional: pip install udemy_userAPI[speed]
+    orjson = None
+
+from .cache import ValidatorStore, DiskCache, account_identity, normalize_url, DISK_CACHE_FILE, DISK_CACHE_MAX_BYTES
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, CircuitBreakers, RequestAttempts, THROTTLE_STATUS, THROTTLE_RETRIES
+from .singleflight import SingleFlight
+
+# Padrões do pool de conexões HTTP
+POOL_CONNECTIONS = 10  # quantidade de hosts mantidos em cache no pool
+POOL_MAXSIZE = 32  # conexões simultâneas mantidas por host
+POOL_BLOCK = False  # se True, aguarda uma conexão livre em vez de abrir conexões extras
+
+CONDITIONAL_FAMILIES = ('curriculum', 'course')  # endpoints revalidados com ETag/Last-Modified
+DEFAULT_TIMEOUT = (10, 60)  # (conexão, leitura) em segundos, usado quando a chamada não define timeout
+# Compressões aceitas: gzip/deflate sempre; br (e zstd) quando os módulos brotli/zstandard estão instalados
+ACCEPT_ENCODING = ACCEPT_ENCODING.replace(',', ', ')
+
+_lock = threading.Lock()
+_session = None
+_config = {
+    'pool_connections': POOL_CONNECTIONS,
+    'pool_maxsize': POOL_MAXSIZE,
+    'pool_block': POOL_BLOCK,
+    'keep_alive': True,
+}
+
+
+rate_limiter = RateLimiter()
+retry_policy = RetryPolicy()
+circuit_breakers = CircuitBreakers()
+validators = ValidatorStore()
+disk_cache = None  # DiskCache ativado por enable_disk_cache
+flights = SingleFlight()
+
+_FAMILY_PATTERNS = (
+    ('curriculum', re.compile(r'/subscriber-curriculum-items/')),
+    ('supplementary', re.compile(r'/supplementary-assets/')),
+    ('quiz', re.compile(r'/quizzes/|/assessments/')),
+    ('lecture', re.compile(r'/lectures/\d+/|/assets/\d+/')),
+    ('captions', re.compile(r'\.vtt(\?|$)|vtt-c\.udemycdn\.com')),
+    ('course', re.compile(r'/courses/\d+/\?|/subscribed-courses/\?|/subscription-course-enrollments/')),
+    ('auth', re.compile(r'/contexts/me/')),
+)
+
+
+def decode_json(body: bytes):
+    """
+    Decodifica um corpo JSON direto dos bytes da resposta.
+
+    Com orjson instalado (pip install udemy_userAPI[speed]) o JSON é lido dos bytes sem criar uma cópia em
+    texto (str) do corpo, o que reduz o pico de memória em currículos grandes. Sem ele usa json.loads, que
+    aceita bytes mas decodifica o corpo inteiro para str antes de ler: o pico de memória é o mesmo de
+    json.loads(response.text).
+
+    Args:
+        body (bytes): Corpo da resposta (response.content).
+
+    Returns:
+        Any: O objeto decodificado.
+
+    Raises:
+        json.JSONDecodeError: Se o corpo não for um JSON válido.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def endpoint_family(url: str) -> str:
+    """
+    Classifica uma URL da API em uma família de endpoints.
+
+    Args:
+        url (str): URL da requisição.
+
+    Returns:
+        str: 'curriculum', 'supplementary', 'quiz', 'lecture', 'captions', 'course', 'auth' ou 'default'.
+    """
+    for family, pattern in _FAMILY_PATTERNS:
+        if pattern.search(url):
+            return family
+    return 'default'
+
+
+def configure_rate_limit(family: str, rate: float = None, burst: int = None):
+    """
+    Ajusta o limite de requisições de uma família de endpoints (ver endpoint_family).
+
+    Args:
+        family (str): Família de endpoints ('curriculum', 'lecture', 'captions', 'supplementary', ...).
+        rate (float): Requisições por segundo. None remove o limite próprio da família, que passa a usar o
+            de 'default' (use rate_limiter.enabled = False para desligar o rate limiter).
+        burst (int): Rajada máxima permitida.
+    """
+    rate_limiter.configure(family, rate=rate, burst=burst)
+
+
+def rate_limit_stats() -> dict:
+    """Retorna as taxas atuais por família e quantas vezes a Udemy pediu para desacelerar."""
+    return rate_limiter.stats()
+
+
+def configure_retry(max_attempts: int = None, backoff_base: float = None, backoff_max: float = None,
+                    budget_ratio: float = None, failure_threshold: int = None, reset_timeout: float = None):
+    """
+    Ajusta a política de novas tentativas e o disjuntor (circuit breaker) das requisições GET.
+
+    Args:
+        max_attempts (int): Tentativas totais por requisição (1 desativa novas tentativas).
+        backoff_base (float): Espera base, em segundos, dobrada a cada nova tentativa.
+        backoff_max (float): Maior espera entre tentativas.
+        budget_ratio (float): Novas tentativas permitidas por requisição enviada (ex.: 0.2 = 20%).
+        failure_threshold (int): Falhas consecutivas que abrem o circuito de um host.
+        reset_timeout (float): Segundos com o circuito aberto antes de liberar uma requisição de teste.
+    """
+    if max_attempts is not None:
+        retry_policy.max_attempts = max(1, int(max_attempts))
+    if backoff_base is not None:
+        retry_policy.backoff_base = backoff_base
+    if backoff_max is not None:
+        retry_policy.backoff_max = backoff_max
+    if budget_ratio is not None:
+        retry_policy.budget_ratio = budget_ratio
+    if failure_threshold is not None:
+        circuit_breakers.failure_threshold = failure_threshold
+    if reset_timeout is not None:
+        circuit_breakers.reset_timeout = reset_timeout
+    if failure_threshold is not None or reset_timeout is not None:
+        circuit_breakers.reset()
+
+
+def revalidation_stats() -> dict:
+    """
+    Retorna as métricas de revalidação condicional (ETag/Last-Modified) do currículo e das informações do curso.
+
+    Returns:
+        dict: 'revalidations' (requisições condicionais enviadas), 'not_modified' (respostas 304),
+              'hit_rate', 'bytes_saved' (bytes servidos do corpo guardado) e o uso do armazenamento.
+    """
+    return validators.stats()
+
+
+def enable_disk_cache(path: str = None, max_bytes: int = DISK_CACHE_MAX_BYTES, ttls: dict = None) -> DiskCache:
+    """
+    Ativa o cache persistente (SQLite) de respostas, lido de forma transparente por todas as chamadas GET.
+
+    As entradas são chaveadas pela URL normalizada e pela conta (hash dos cookies), então trocar de
+    conta não reaproveita respostas de outra.
+
+    Args:
+        path (str): Arquivo SQLite. Padrão: 'responses.sqlite3' no diretório .cache da biblioteca.
+        max_bytes (int): Tamanho máximo do cache; as entradas acessadas há mais tempo são removidas primeiro.
+        ttls (dict): Validade em segundos por família ('curriculum', 'course', 'lecture', 'quiz', 'captions').
+            Famílias ausentes não são gravadas.
+
+    Returns:
+        DiskCache: O cache ativado.
+    """
+    global disk_cache
+    if path is None:
+        cache_dir = os.path.join(os.path.dirname(__file__), '.cache')
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, DISK_CACHE_FILE)
+    disk_cache = DiskCache(path, max_bytes=max_bytes, ttls=ttls)
+    return disk_cache
+
+
+def disable_disk_cache():
+    """Desativa o cache persistente (o arquivo é mantido)."""
+    global disk_cache
+    disk_cache = None
+
+
+def clear_disk_cache(pattern: str = None):
+    """
+    Remove respostas do cache persistente.
+
+    Args:
+        pattern (str): Trecho da URL a remover (ex.: '/courses/123/'); se None, limpa tudo.
+    """
+    if disk_cache is not None:
+        disk_cache.invalidate(pattern)
+
+
+def disk_cache_stats() -> dict:
+    """Retorna entradas, bytes, acertos, falhas e remoções do cache persistente (vazio se desativado)."""
+    return disk_cache.stats() if disk_cache is not None else {}
+
+
+def _stored_headers(response) -> dict:
+    # o corpo guardado já está descompactado
+    return {k: v for k, v in response.headers.items()
+            if k.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')}
+
+
+def single_flight_stats() -> dict:
+    """
+    Retorna quantas chamadas simultâneas idênticas foram agrupadas em uma só.
+
+    Returns:
+        dict: Para cada camada ('http', 'functions', 'login'): 'executed' (execuções reais),
+              'shared' (chamadas duplicadas evitadas) e 'in_flight'; e 'avoided' com o total evitado.
+    """
+    from .authenticate import login_flights
+    from .cache import memo_flights
+    stats = {'http': flights.stats(), 'functions': memo_flights.stats(), 'login': login_flights.stats()}
+    stats['avoided'] = sum(layer['shared'] for layer in stats.values())
+    return stats
+
+
+def retry_stats() -> dict:
+    """Retorna os contadores de novas tentativas e o estado dos disjuntores por host."""
+    stats = retry_policy.stats()
+    stats['circuits'] = circuit_breakers.stats()
+    return stats
+
+
+class UdemyAdapter(HTTPAdapter):
+    """HTTPAdapter com limitador de requisições, novas tentativas com backoff e disjuntor por host.
+
+    - GETs idênticos simultâneos (mesma URL normalizada e conta) compartilham uma única requisição.
+    - Com o cache persistente ativo (enable_disk_cache), GETs ainda válidos são servidos do disco.
+    - Currículo e informações do curso: reenvia ETag/Last-Modified guardados e, num 304, devolve o corpo
+      guardado como uma resposta 200 comum.
+    - 429/503: respeita o Retry-After (pausa global) e reenvia o GET até THROTTLE_RETRIES vezes, dentro do
+      orçamento de novas tentativas.
+    - Erros de conexão, timeouts e 5xx: novas tentativas com backoff exponencial e jitter (ver RequestAttempts).
+    - Falhas consecutivas abrem o circuito do host e as próximas requisições falham na hora
+      com CircuitOpenException.
+    """
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET' or kwargs.get('stream'):
+            return self._send_cached(request, **kwargs)
+        key = (normalize_url(request.url), account_identity(request.headers.get('Cookie', '')))
+
+        def leader():
+            resp = self._send_cached(request, **kwargs)
+            resp.content  # lê o corpo para que as chamadas agrupadas possam reaproveitá-lo
+            return resp
+
+        response, shared = flights.do(key, leader)
+        if shared:
+            return self._cached_response(request, _stored_headers(response), response.content,
+                                         status=response.status_code, reason=response.reason)
+        return response
+
+    def _send_cached(self, request, **kwargs):
+        family = endpoint_family(request.url)
+        cache = disk_cache
+        disk_key = None
+        if cache is not None and request.method == 'GET' and not kwargs.get('stream') and cache.ttl_for(family):
+            disk_key = cache.key(request.url, account_identity(request.headers.get('Cookie', '')))
+            try:
+                hit = cache.get(disk_key)
+            except sqlite3.Error:
+                hit = None
+            if hit is not None:
+                return self._cached_response(request, *hit)
+        response = self._send_conditional(request, family, **kwargs)
+        if disk_key is not None and response.status_code == 200:
+            try:
+                cache.set(disk_key, family, _stored_headers(response), response.content)
+            except sqlite3.Error:
+                pass  # falha ao gravar o cache não deve derrubar a requisição
+        return response
+
+    def _cached_response(self, request, headers: dict, body: bytes, status: int = 200, reason: str = 'OK'):
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def _send_conditional(self, request, family: str, **kwargs):
+        if family not in CONDITIONAL_FAMILIES or request.method != 'GET' or kwargs.get('stream'):
+            return self._send_with_policy(request, **kwargs)
+        key = (request.url, account_identity(request.headers.get('Cookie', '')))
+        conditional = {}
+        if 'If-None-Match' not in request.headers and 'If-Modified-Since' not in request.headers:
+            conditional = validators.conditional_headers(key)
+            request.headers.update(conditional)
+        response = self._send_with_policy(request, **kwargs)
+        if response.status_code == 304 and conditional:
+            entry = validators.not_modified_entry(key)
+            if entry is None:
+                # o corpo guardado foi descartado entre o envio e a resposta: pede o recurso completo
+                response.close()
+                request.headers.pop('If-None-Match', None)
+                request.headers.pop('If-Modified-Since', None)
+                response = self._send_with_policy(request, **kwargs)
+            else:
+                response.status_code = 200
+                response.reason = 'OK'
+                response.headers = CaseInsensitiveDict(entry['headers'])
+                response._content = entry['body']
+                response._content_consumed = True
+        elif response.status_code == 200:
+            validators.store(key, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                             response.content, _stored_headers(response))
+        return response
+
+    def _send_with_policy(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = DEFAULT_TIMEOUT
+        attempts = RequestAttempts(request.url, endpoint_family(request.url), retry_policy, circuit_breakers,
+                                   rate_limiter, retryable=request.method in ('GET', 'HEAD'))
+        while True:
+            delay = attempts.before_send()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = attempts.on_error()
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            except requests.RequestException:
+                attempts.on_error(transient=False)
+                raise
+            delay = attempts.on_response(response.status_code, response.headers.get('Retry-After'))
+            if delay is None:
+                return response
+            response.close()
+            time.sleep(delay)
+
+
+def _invalidate_login_on_auth_error(response, *args, **kwargs):
+    """Hook de resposta: descarta o cache de login quando a Udemy recusa a sessão."""
+    if response.status_code in (401, 403):
+        from .authenticate import invalidate_login_cache
+        invalidate_login_cache()
+    return response
+
+
+def _build_session(pool_connections: int, pool_maxsize: int, pool_block: bool, keep_alive: bool) -> requests.Session:
+    session = requests.Session()
+    adapter = UdemyAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    session.hooks['response'].append(_invalidate_login_on_auth_error)
+    return session
+
+
+def configure_session(pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE,
+                      pool_block: bool = POOL_BLOCK, keep_alive: bool = True) -> requests.Session:
+    """
+    Configura o pool de conexões HTTP compartilhado por todas as chamadas da API.
+
+    A sessão anterior (se existir) é fechada e substituída.
+
+    Args:
+        pool_connections (int): Quantidade de hosts mantidos em cache no pool.
+        pool_maxsize (int): Número máximo de conexões mantidas por host.
+        pool_block (bool): Se True, as requisições aguardam uma conexão livre quando o pool estiver cheio.
+        keep_alive (bool): Se False, as conexões são encerradas após cada requisição.
+
+    Returns:
+        requests.Session: A nova sessão compartilhada.
+    """
+    global _session
+    session = _build_session(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                             pool_block=pool_block, keep_alive=keep_alive)
+    with _lock:
+        old, _session = _session, session
+        _config.update(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                       pool_block=pool_block, keep_alive=keep_alive)
+    if old is not None:
+        old.close()
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Retorna a sessão HTTP compartilhada, criando-a na primeira chamada.
+
+    Returns:
+        requests.Session: Sessão com pool de conexões reutilizáveis.
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session(**_config)
+    return _session
+
+
+def close_session():
+    """Fecha a sessão compartilhada e libera as conexões abertas."""
+    global _session
+    with _lock:
+        old, _session = _session, None
+    if old is not None:
+        old.close()
+
+
+def connection_stats() -> dict:
+    """
+    Retorna estatísticas de reutilização das conexões da sessão compartilhada.
+
+    Returns:
+        dict: 'connections' (conexões abertas), 'requests' (requisições enviadas)
+              e 'reused' (requisições que aproveitaram uma conexão já aberta).
+    """
+    connections = 0
+    total = 0
+    session = _session
+    if session is not None:
+        adapters = {id(a): a for a in session.adapters.values()}.values()
+        for adapter in adapters:
+            for key in list(adapter.poolmanager.pools.keys()):
+                pool = adapter.poolmanager.pools.get(key)
+                if pool is None:
+                    continue
+                connections += pool.num_connections
+                total += pool.num_requests
+    return {'connections': connections, 'requests': total, 'reused': max(total - connections, 0)}
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Agrupa chamadas simultâneas com a mesma chave em uma única execução.
+
+    A primeira thread executa a função; as demais que chegarem com a mesma chave enquanto ela
+    estiver em andamento aguardam e recebem o mesmo resultado (ou a mesma exceção).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key, func):
+        """
+        Executa func() uma única vez para chamadas simultâneas com a mesma chave.
+
+        Args:
+            key: Chave que identifica a chamada (ex.: URL normalizada + conta).
+            func: Função sem argumentos a executar.
+
+        Returns:
+            tuple[Any, bool]: (resultado, compartilhado). 'compartilhado' é True para as chamadas
+                que reaproveitaram a execução de outra thread.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return call.result, False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'executed': self.executed, 'shared': self.shared, 'in_flight': len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """Versão asyncio de SingleFlight: corrotinas simultâneas com a mesma chave aguardam a mesma tarefa."""
+
+    def __init__(self):
+        self._tasks = {}
+        self.executed = 0
+        self.shared = 0
+
+    async def do(self, key, factory):
+        """
+        Executa a corrotina criada por factory() uma única vez para chamadas simultâneas com a mesma chave.
+
+        Args:
+            key: Chave que identifica a chamada.
+            factory: Função sem argumentos que cria a corrotina.
+
+        Returns:
+            Any: O resultado da corrotina.
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            self.shared += 1
+            return await asyncio.shield(task)
+        task = asyncio.ensure_future(factory())
+        self._tasks[key] = task
+        self.executed += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done():
+                self._tasks.pop(key, None)
+            else:
+                task.add_done_callback(lambda _: self._tasks.pop(key, None))
+
+    def stats(self) -> dict:
+        return {'executed': self.executed, 'shared': self.shared, 'in_flight': len(self._tasks)}
@@ -1,11 +1,11 @@
 from .exeptions import UdemyUserApiExceptions, UnhandledExceptions, LoginException
-from .sections import get_courses_plan, get_details_courses
-from .api import HEADERS_USER
+from typing import Iterator
+from .sections import get_courses_plan, get_details_courses, iter_curriculum_pages
+from .api import HEADERS_USER, iter_chapters, iter_curriculum_items
 from .bultins import Course
 from .authenticate import UdemyAuth
 
 auth = UdemyAuth()
-verif_login = auth.verif_login()
 
 
 class Udemy:
@@ -19,7 +19,7 @@ class Udemy:
             LoginException: Se a sessão estiver expirada.
         """
         self.__headers = HEADERS_USER
-        if not verif_login:
+        if not auth.verif_login():
             raise LoginException("Sessão expirada!")
 
     @staticmethod
@@ -72,12 +72,14 @@ class Udemy:
             raise UnhandledExceptions(e)
 
     @staticmethod
-    def get_details_course(course_id):
+    def get_details_course(course_id, fields=None):
         """
         Obtém detalhes de um curso através do ID.
 
         Args:
             course_id: O ID do curso.
+            fields: Grupos de campos opcionais do currículo (ex.: () para não baixar os arquivos
+                suplementares). None pede todos. Ver CURRICULUM_FIELD_GROUPS.
 
         Returns:
             Course: Um objeto Course contendo os detalhes do curso.
@@ -86,8 +88,37 @@ class Udemy:
             UnhandledExceptions: Se houver erro ao obter os detalhes do curso.
         """
         try:
-            d = get_details_courses(course_id)
-            b = Course(course_id=course_id, results=d)
+            d = get_details_courses(course_id, fields=fields)
+            b = Course(course_id=course_id, results=d, fields=fields)
             return b
         except UnhandledExceptions as e:
             raise UnhandledExceptions(e)
+
+    @staticmethod
+    def iter_curriculum(course_id, by_chapter: bool = False, fields=None) -> Iterator[dict]:
+        """
+        Percorre o currículo de um curso à medida que as páginas chegam da API, sem montar o curso inteiro.
+
+        Útil em cursos muito grandes: as primeiras aulas podem ser processadas enquanto as páginas
+        seguintes ainda estão sendo baixadas, e a memória usada não cresce com o tamanho do curso.
+
+        Args:
+            course_id: O ID do curso.
+            by_chapter (bool): Se True, entrega capítulos completos (como parser_chapters com records=True);
+                se False, entrega cada aula/quiz assim que chega (como Course.lecture_records).
+            fields: Grupos de campos opcionais do currículo (chaves de CURRICULUM_FIELD_GROUPS). None pede todos.
+
+        Yields:
+            Chapter | LectureRef: Capítulos ou aulas (registros que funcionam como dicionários), na ordem
+                do currículo.
+
+        Raises:
+            LoginException: Se a sessão estiver expirada.
+            UdemyUserApiExceptions: Se alguma página do currículo não puder ser obtida.
+        """
+        items = (item for page in iter_curriculum_pages(course_id, fields=fields)
+                 for item in page.get('results', []))
+        if by_chapter:
+            yield from iter_chapters(items)
+        else:
+            yield from iter_curriculum_items(items)
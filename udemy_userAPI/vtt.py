@@ -0,0 +1,427 @@
+import html
+import os
+import re
+import time
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import repeat
+from typing import Iterable, Iterator, NamedTuple
+
+_CLOCK = r'(?:(\d+):)?(\d{1,2}):(\d{2})[.,](\d{1,3})'
+_TIMING = re.compile(rf'^\s*{_CLOCK}\s+-->\s+{_CLOCK}')
+_SKIP_BLOCKS = ('NOTE', 'STYLE', 'REGION')
+
+
+class Cue(NamedTuple):
+    """Um trecho da legenda: início e fim em milissegundos e o texto."""
+    start: int
+    end: int
+    text: str
+
+
+def parse_timestamp(value: str) -> int:
+    """
+    Converte um timestamp WebVTT ('hh:mm:ss.ttt' ou 'mm:ss.ttt') em milissegundos.
+
+    Args:
+        value (str): O timestamp.
+
+    Returns:
+        int: O tempo em milissegundos.
+
+    Raises:
+        ValueError: Se o timestamp for inválido.
+    """
+    clock, _, fraction = value.strip().replace(',', '.').partition('.')
+    parts = clock.split(':')
+    if len(parts) == 2:
+        parts.insert(0, '0')
+    if len(parts) != 3 or not fraction:
+        raise ValueError(f'Timestamp inválido: {value!r}')
+    hours, minutes, seconds = (int(p) for p in parts)
+    return ((hours * 60 + minutes) * 60 + seconds) * 1000 + int(fraction.ljust(3, '0')[:3])
+
+
+def format_timestamp(ms: int, separator: str = '.') -> str:
+    """Converte milissegundos em 'hh:mm:ss.ttt' (use separator=',' para SRT)."""
+    seconds, ms = divmod(int(ms), 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{ms:03d}'
+
+
+class CueTable:
+    """Tabela compacta de cues de uma legenda.
+
+    Os tempos ficam em arrays paralelos (início e fim em milissegundos) e os textos em um único buffer,
+    indexado por deslocamentos; as cues ficam ordenadas pelo início para permitir busca binária.
+    """
+
+    __slots__ = ('starts', 'ends', 'offsets', '_buffer', '_max_ends')
+
+    def __init__(self, cues: Iterable[tuple] = ()):
+        """
+        Monta a tabela.
+
+        Args:
+            cues (Iterable[tuple]): Tuplas (início_ms, fim_ms, texto), em qualquer ordem.
+        """
+        starts, ends, offsets, texts = array('q'), array('q'), array('q', [0]), []
+        ordered = True
+        for start, end, text in cues:
+            if starts and start < starts[-1]:
+                ordered = False
+            starts.append(start)
+            ends.append(end)
+            offsets.append(offsets[-1] + len(text))
+            texts.append(text)
+        if not ordered:
+            order = sorted(range(len(starts)), key=starts.__getitem__)
+            texts = [texts[i] for i in order]
+            starts, ends = array('q', (starts[i] for i in order)), array('q', (ends[i] for i in order))
+            offsets = array('q', [0])
+            for text in texts:
+                offsets.append(offsets[-1] + len(text))
+        self.starts, self.ends, self.offsets = starts, ends, offsets
+        self._buffer = ''.join(texts)
+        # maior fim entre as cues 0..i: diz quando parar a busca por cues sobrepostas
+        self._max_ends = array('q')
+        highest = -1
+        for end in self.ends:
+            highest = max(highest, end)
+            self._max_ends.append(highest)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> Cue:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Índice de cue fora da tabela!')
+        return Cue(self.starts[index], self.ends[index], self.text(index))
+
+    def __iter__(self) -> Iterator[Cue]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def text(self, index: int) -> str:
+        """Retorna o texto da cue no índice informado."""
+        return self._buffer[self.offsets[index]:self.offsets[index + 1]]
+
+    def index_at(self, ms: int) -> int:
+        """
+        Procura (busca binária) a cue ativa no instante informado.
+
+        Args:
+            ms (int): Instante em milissegundos.
+
+        Returns:
+            int: Índice da cue ativa (a que começou por último, se houver sobreposição) ou -1.
+        """
+        index = bisect_right(self.starts, ms) - 1
+        while index >= 0 and self._max_ends[index] > ms:
+            if self.ends[index] > ms:
+                return index
+            index -= 1
+        return -1
+
+    def cue_at(self, ms: int):
+        """
+        Retorna a cue ativa no instante informado.
+
+        Args:
+            ms (int): Instante em milissegundos.
+
+        Returns:
+            Cue | None: A cue ativa ou None se nenhuma legenda estiver na tela.
+        """
+        index = self.index_at(ms)
+        return self[index] if index >= 0 else None
+
+    def cues_between(self, start_ms: int, end_ms: int) -> list[Cue]:
+        """Retorna as cues que aparecem (ao menos em parte) entre start_ms e end_ms."""
+        last = bisect_right(self.starts, end_ms)
+        return [self[i] for i in range(last) if self.ends[i] > start_ms]
+
+    @property
+    def duration(self) -> int:
+        """Fim da última cue, em milissegundos."""
+        return self._max_ends[-1] if len(self) else 0
+
+
+def iter_cues(lines: Iterable[str]) -> Iterator[Cue]:
+    """
+    Lê as cues de uma legenda WebVTT linha a linha, sem carregar o arquivo inteiro.
+
+    Blocos NOTE, STYLE e REGION e os identificadores de cue são ignorados.
+
+    Args:
+        lines (Iterable[str]): Linhas do VTT (um arquivo aberto, iter_lines(...)...).
+
+    Yields:
+        Cue: Cada cue, na ordem do arquivo.
+    """
+    start = end = None
+    text = []
+    skipping = False
+    for line in lines:
+        line = line.rstrip('\r\n').lstrip('\ufeff')
+        if not line.strip():
+            if start is not None:
+                yield Cue(start, end, '\n'.join(text))
+            start = end = None
+            text = []
+            skipping = False
+            continue
+        if skipping:
+            continue
+        if start is None:
+            match = _TIMING.match(line)
+            if match:
+                h1, m1, s1, f1, h2, m2, s2, f2 = match.groups()
+                start = ((int(h1 or 0) * 60 + int(m1)) * 60 + int(s1)) * 1000 + int(f1.ljust(3, '0'))
+                end = ((int(h2 or 0) * 60 + int(m2)) * 60 + int(s2)) * 1000 + int(f2.ljust(3, '0'))
+            elif line.startswith(_SKIP_BLOCKS) or line.startswith('WEBVTT'):
+                skipping = True
+            # outras linhas antes do tempo são identificadores de cue
+            continue
+        text.append(line)
+    if start is not None:
+        yield Cue(start, end, '\n'.join(text))
+
+
+def iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Junta blocos de texto (ex.: response.iter_content(decode_unicode=True)) e os devolve linha a linha.
+
+    Diferente de response.iter_lines, não gera linhas vazias falsas quando um '\\r\\n' é dividido entre blocos,
+    o que encerraria a cue no meio do texto.
+
+    Args:
+        chunks (Iterable[str]): Os blocos de texto.
+
+    Yields:
+        str: Cada linha, sem a quebra de linha.
+    """
+    pending = ''
+    for chunk in chunks:
+        pending += chunk
+        lines = pending.split('\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line.rstrip('\r')
+    if pending:
+        yield pending.rstrip('\r')
+
+
+def parse_vtt(source) -> CueTable:
+    """
+    Converte uma legenda WebVTT em uma CueTable.
+
+    Args:
+        source: O conteúdo (str) ou um iterável de linhas (arquivo aberto, gerador...).
+
+    Returns:
+        CueTable: A tabela de cues.
+    """
+    if isinstance(source, str):
+        source = source.splitlines()
+    return CueTable(iter_cues(source))
+
+
+def parse_vtt_file(path: str) -> CueTable:
+    """
+    Lê um arquivo .vtt em streaming e retorna sua CueTable.
+
+    Args:
+        path (str): Caminho do arquivo.
+
+    Returns:
+        CueTable: A tabela de cues.
+    """
+    with open(path, 'r', encoding='utf-8-sig') as file:
+        return CueTable(iter_cues(file))
+
+
+CONVERT_FORMATS = ('srt', 'txt')
+PROCESS_POOL_MIN_FILES = 64  # abaixo disso, converter na própria thread sai mais barato que abrir processos
+_TAGS = re.compile(r'<[^>]*>')
+_NON_SRT_TAGS = re.compile(r'<(?!/?[ibu]>)[^>]*>')  # o SRT só entende <i>, <b> e <u>
+
+
+def srt_block(number: int, cue: Cue) -> str:
+    """Formata uma cue como um bloco SRT (numerado a partir de 1)."""
+    text = html.unescape(_NON_SRT_TAGS.sub('', cue.text))
+    return f'{number}\n{format_timestamp(cue.start, ",")} --> {format_timestamp(cue.end, ",")}\n{text}\n\n'
+
+
+def transcript_lines(cues: Iterable[Cue]) -> Iterator[str]:
+    """
+    Gera a transcrição em texto puro: o texto das cues sem tags, uma fala por linha.
+
+    Linhas repetidas em sequência (comuns em legendas automáticas, que repetem a linha anterior
+    enquanto a próxima aparece) são emitidas uma vez só.
+
+    Args:
+        cues (Iterable[Cue]): As cues.
+
+    Yields:
+        str: Cada linha da transcrição, sem a quebra de linha.
+    """
+    previous = None
+    for cue in cues:
+        for line in html.unescape(_TAGS.sub('', cue.text)).splitlines():
+            line = line.strip()
+            if line and line != previous:
+                yield line
+                previous = line
+
+
+def convert_file(path: str, dest_dir: str = None, formats: Iterable[str] = CONVERT_FORMATS,
+                 overwrite: bool = False) -> dict:
+    """
+    Converte um arquivo .vtt em .srt e/ou .txt, lendo e gravando linha a linha.
+
+    As saídas que já existem e são mais novas que o .vtt são mantidas (a menos que overwrite=True).
+    Cada saída é gravada em um arquivo temporário e só então renomeada, então uma conversão interrompida
+    não deixa arquivos pela metade.
+
+    Args:
+        path (str): Caminho do arquivo .vtt.
+        dest_dir (str): Diretório das saídas. Padrão: o diretório do .vtt.
+        formats (Iterable[str]): Formatos desejados ('srt', 'txt').
+        overwrite (bool): Converte mesmo que as saídas estejam atualizadas.
+
+    Returns:
+        dict: 'source', 'status' ('converted' ou 'skipped'), 'outputs' (caminhos) e 'cues' convertidas.
+
+    Raises:
+        ValueError: Se um formato não for suportado.
+    """
+    outputs = _outputs_for(path, dest_dir, formats)
+    result = {'source': path, 'status': 'skipped', 'outputs': list(outputs.values()), 'cues': 0}
+    if not overwrite and _up_to_date(path, outputs.values()):
+        return result
+    os.makedirs(os.path.dirname(next(iter(outputs.values()))) or '.', exist_ok=True)
+    files = {}
+    try:
+        with ExitStack() as stack:
+            for fmt, out in outputs.items():  # um de cada vez: se um open() falhar, os anteriores são fechados
+                files[fmt] = stack.enter_context(open(f'{out}.part', 'w', encoding='utf-8', newline='\n'))
+            with open(path, 'r', encoding='utf-8-sig') as source:
+                srt, txt = files.get('srt'), files.get('txt')
+                previous = None
+                for number, cue in enumerate(iter_cues(source), start=1):
+                    if srt is not None:
+                        srt.write(srt_block(number, cue))
+                    if txt is not None:
+                        for line in transcript_lines((cue,)):
+                            if line != previous:
+                                txt.write(line + '\n')
+                                previous = line
+                    result['cues'] = number
+        for fmt, file in files.items():
+            os.replace(file.name, outputs[fmt])
+    except BaseException:
+        for file in files.values():
+            try:
+                os.remove(file.name)
+            except OSError:  # já renomeado ou nunca criado
+                pass
+        raise
+    result['status'] = 'converted'
+    return result
+
+
+def convert_captions(sources, dest_dir: str = None, formats: Iterable[str] = CONVERT_FORMATS,
+                     processes: int = None, overwrite: bool = False) -> dict:
+    """
+    Converte um lote de legendas .vtt (ex.: as baixadas por Course.download_captions) em .srt e/ou .txt.
+
+    Os arquivos já convertidos (saídas mais novas que o .vtt) são pulados sem abrir o .vtt. Lotes com
+    PROCESS_POOL_MIN_FILES arquivos ou mais são convertidos em um pool de processos; os menores, aqui mesmo.
+
+    Args:
+        sources: Um diretório (são usados os arquivos .vtt dele) ou um iterável de caminhos de arquivos .vtt.
+        dest_dir (str): Diretório das saídas. Padrão: o diretório de cada .vtt.
+        formats (Iterable[str]): Formatos desejados ('srt', 'txt').
+        processes (int): Número de processos. Padrão: os.cpu_count(); 1 desativa o pool.
+        overwrite (bool): Converte mesmo os arquivos cujas saídas estão atualizadas.
+
+    Returns:
+        dict: Relatório com 'converted', 'skipped', 'failed' (lista de (caminho, erro)), 'cues', 'files'
+            (saídas, na ordem das fontes) e 'seconds'.
+
+    Raises:
+        ValueError: Se um formato não for suportado.
+    """
+    started = time.monotonic()
+    formats = tuple(formats)
+    if isinstance(sources, (str, os.PathLike)):
+        sources = sorted(os.path.join(sources, name) for name in os.listdir(sources) if name.endswith('.vtt'))
+    report = {'converted': 0, 'skipped': 0, 'failed': [], 'cues': 0, 'files': []}
+    files = []  # saídas de cada fonte, na ordem das fontes (vazia se a conversão falhar)
+    pending = []
+    for path in sources:
+        outputs = _outputs_for(path, dest_dir, formats)
+        if not overwrite and _up_to_date(path, outputs.values()):
+            report['skipped'] += 1
+            files.append(list(outputs.values()))
+        else:
+            files.append([])
+            pending.append((len(files) - 1, path))
+    paths = [path for _, path in pending]
+    processes = processes or os.cpu_count() or 1
+    if processes > 1 and len(pending) >= PROCESS_POOL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            chunksize = max(1, len(pending) // (processes * 4))
+            results = executor.map(_convert_job, paths, repeat(dest_dir), repeat(formats), repeat(True),
+                                   chunksize=chunksize)
+            _collect(report, files, pending, results)
+    else:
+        _collect(report, files, pending, (_convert_job(path, dest_dir, formats, True) for path in paths))
+    report['files'] = [output for outputs in files for output in outputs]
+    report['seconds'] = round(time.monotonic() - started, 3)
+    return report
+
+
+def _convert_job(path, dest_dir, formats, overwrite):
+    # roda nos processos do pool: erros voltam como resultado para não interromper o lote
+    try:
+        return convert_file(path, dest_dir=dest_dir, formats=formats, overwrite=overwrite)
+    except Exception as e:
+        return {'source': path, 'status': 'failed', 'error': f'{type(e).__name__}: {e}'}
+
+
+def _collect(report: dict, files: list, pending: list, results: Iterable[dict]):
+    for (index, path), result in zip(pending, results):
+        if result['status'] == 'failed':
+            report['failed'].append((path, result['error']))
+            continue
+        report['converted'] += 1
+        report['cues'] += result['cues']
+        files[index] = result['outputs']
+
+
+def _outputs_for(path: str, dest_dir: str, formats: Iterable[str]) -> dict:
+    base = os.path.splitext(os.path.basename(path))[0]
+    directory = os.path.dirname(path) if dest_dir is None else dest_dir
+    outputs = {}
+    for fmt in formats:
+        if fmt not in CONVERT_FORMATS:
+            raise ValueError(f"Formato não suportado: {fmt!r}. Use {', '.join(CONVERT_FORMATS)}.")
+        outputs[fmt] = os.path.join(directory, f'{base}.{fmt}')
+    if not outputs:
+        raise ValueError('Informe ao menos um formato de saída!')
+    return outputs
+
+
+def _up_to_date(path: str, outputs: Iterable[str]) -> bool:
+    try:
+        modified = os.path.getmtime(path)
+        return all(os.path.getmtime(out) >= modified for out in outputs)
+    except OSError:
+        return False